@@ -150,9 +150,15 @@ const ReportsScreen: React.FC = () => {
     );
   };
 
-  const viewReport = (report: Report) => {
+  const viewReport = async (report: Report) => {
     setSelectedReport(report);
     setModalVisible(true);
+
+    // 목록에는 요약만 오므로 본문은 상세 조회로 불러옴
+    const result = await ApiService.getReportDetail(report.id);
+    if (result.success && result.data) {
+      setSelectedReport(result.data);
+    }
   };
 
   const formatDate = (dateString: string) => {
@@ -242,7 +248,7 @@ const ReportsScreen: React.FC = () => {
           <View style={styles.metaItem}>
             <Icon name="format-size" size={16} color="#718096" />
             <Text style={[styles.metaText, isDarkMode && styles.subtextDark]}>
-              {item.full_report?.length || 0}자
+              {item.report_length || 'moderate'}
             </Text>
           </View>
           <View style={styles.metaItem}>
@@ -257,7 +263,7 @@ const ReportsScreen: React.FC = () => {
           style={[styles.reportPreview, isDarkMode && styles.subtextDark]}
           numberOfLines={3}
         >
-          {item.summary || item.full_report?.substring(0, 200) + '...' || '내용 없음'}
+          {item.summary || '내용 없음'}
         </Text>
       </TouchableOpacity>
     );
@@ -35,6 +35,9 @@ const ScheduleListScreen: React.FC = () => {
   const [completedSchedules, setCompletedSchedules] = useState<Schedule[]>([]);
   const [cancelledSchedules, setCancelledSchedules] = useState<Schedule[]>([]);
   const [isLoading, setIsLoading] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [loadedSchedules, setLoadedSchedules] = useState<Schedule[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [refreshing, setRefreshing] = useState(false);
   const [showCompleted, setShowCompleted] = useState(false);
   const [showCancelled, setShowCancelled] = useState(false);
@@ -50,6 +53,32 @@ const ScheduleListScreen: React.FC = () => {
     }, [])
   );
 
+  // 지금까지 불러온 스케줄을 활성, 완료, 취소로 분리
+  const applySchedules = (list: Schedule[]) => {
+    const activeSchedules = list.filter(
+      (schedule: Schedule) => schedule.status === 'active' || schedule.status === 'paused'
+    );
+    const completed = list.filter(
+      (schedule: Schedule) => schedule.status === 'completed'
+    );
+    const cancelled = list.filter(
+      (schedule: Schedule) => schedule.status === 'cancelled'
+    );
+    
+    // 디버깅: 첫 번째 활성 스케줄의 시간 정보 출력
+    if (activeSchedules.length > 0 && activeSchedules[0].next_run) {
+      console.log('첫 번째 스케줄 next_run:', activeSchedules[0].next_run);
+      console.log('Date 객체로 변환:', new Date(activeSchedules[0].next_run));
+      console.log('로컬 시간으로 표시:', new Date(activeSchedules[0].next_run).toLocaleString('ko-KR'));
+    }
+    
+    setLoadedSchedules(list);
+    setSchedules(activeSchedules);
+    setCompletedSchedules(completed);
+    setCancelledSchedules(cancelled);
+  };
+
+  // 첫 페이지부터 다시 조회
   const loadSchedules = async () => {
     if (!user?.nickname) return;
     
@@ -64,27 +93,8 @@ const ScheduleListScreen: React.FC = () => {
           console.log(`스케줄 ${schedule.id}: is_executing = ${schedule.is_executing}, status = ${schedule.status}, next_run = ${schedule.next_run}`);
         });
         
-        // 활성, 완료, 취소된 스케줄 분리
-        const activeSchedules = result.data.filter(
-          (schedule: Schedule) => schedule.status === 'active' || schedule.status === 'paused'
-        );
-        const completed = result.data.filter(
-          (schedule: Schedule) => schedule.status === 'completed'
-        );
-        const cancelled = result.data.filter(
-          (schedule: Schedule) => schedule.status === 'cancelled'
-        );
-        
-        // 디버깅: 첫 번째 활성 스케줄의 시간 정보 출력
-        if (activeSchedules.length > 0 && activeSchedules[0].next_run) {
-          console.log('첫 번째 스케줄 next_run:', activeSchedules[0].next_run);
-          console.log('Date 객체로 변환:', new Date(activeSchedules[0].next_run));
-          console.log('로컬 시간으로 표시:', new Date(activeSchedules[0].next_run).toLocaleString('ko-KR'));
-        }
-        
-        setSchedules(activeSchedules);
-        setCompletedSchedules(completed);
-        setCancelledSchedules(cancelled);
+        applySchedules(result.data);
+        setNextCursor(result.nextCursor || null);
       }
     } catch (error) {
       console.error('Failed to load schedules:', error);
@@ -92,6 +102,27 @@ const ScheduleListScreen: React.FC = () => {
     setIsLoading(false);
   };
 
+  // next_cursor로 다음 페이지를 불러와 기존 목록 뒤에 추가
+  const loadMoreSchedules = async () => {
+    if (!user?.nickname || !nextCursor || isLoadingMore) return;
+    
+    setIsLoadingMore(true);
+    try {
+      const result = await ApiService.getUserSchedules(user.nickname, nextCursor);
+      if (result.success && result.data) {
+        const loadedIds = new Set(loadedSchedules.map((schedule) => schedule.id));
+        applySchedules([
+          ...loadedSchedules,
+          ...result.data.filter((schedule: Schedule) => !loadedIds.has(schedule.id)),
+        ]);
+        setNextCursor(result.nextCursor || null);
+      }
+    } catch (error) {
+      console.error('Failed to load more schedules:', error);
+    }
+    setIsLoadingMore(false);
+  };
+
   const onRefresh = async () => {
     setRefreshing(true);
     await loadSchedules();
@@ -521,6 +552,19 @@ const ScheduleListScreen: React.FC = () => {
                 )}
               </>
             )}
+            {/* 다음 페이지 */}
+            {nextCursor && (
+              <TouchableOpacity
+                style={[styles.loadMoreButton, isDarkMode && styles.loadMoreButtonDark]}
+                onPress={loadMoreSchedules}
+                disabled={isLoadingMore}
+              >
+                <Icon name={isLoadingMore ? 'hourglass-empty' : 'expand-more'} size={20} color="#667eea" />
+                <Text style={styles.loadMoreButtonText}>
+                  {isLoadingMore ? '불러오는 중...' : '더 보기'}
+                </Text>
+              </TouchableOpacity>
+            )}
           </>
         )}
 
@@ -873,6 +917,27 @@ const styles = StyleSheet.create({
     color: '#e53e3e',
     marginLeft: 8,
   },
+  loadMoreButton: {
+    flexDirection: 'row',
+    alignItems: 'center',
+    justifyContent: 'center',
+    backgroundColor: '#ebf4ff',
+    borderRadius: 12,
+    paddingVertical: 12,
+    paddingHorizontal: 20,
+    marginTop: 10,
+    borderWidth: 1,
+    borderColor: '#667eea',
+  },
+  loadMoreButtonDark: {
+    backgroundColor: '#2d3748',
+  },
+  loadMoreButtonText: {
+    fontSize: 16,
+    fontWeight: '700',
+    color: '#667eea',
+    marginLeft: 8,
+  },
   disabledButton: {
     opacity: 0.5,
     backgroundColor: '#e2e8f0',
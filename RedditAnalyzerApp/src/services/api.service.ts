@@ -555,13 +555,16 @@ class ApiService {
     }
   }
 
-  async getUserSchedules(userNickname: string): Promise<ApiResponse> {
+  async getUserSchedules(userNickname: string, cursor?: string | null, limit: number = 50): Promise<ApiResponse> {
     try {
-      const response = await this.api.get(`/api/v1/schedule/user/${userNickname}`);
+      const response = await this.api.get(`/api/v1/schedule/user/${userNickname}`, {
+        params: cursor ? { limit, cursor } : { limit },
+      });
 
       return {
         success: true,
         data: response.data.schedules || [],
+        nextCursor: response.data.next_cursor || null,
       };
     } catch (error) {
       console.error('Get user schedules error:', error);
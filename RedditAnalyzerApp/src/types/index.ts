@@ -36,4 +36,5 @@ export interface ApiResponse<T = any> {
   data?: T;
   error?: string;
   details?: string[];
+  nextCursor?: string | null;  // 커서 페이지 목록 API의 다음 페이지 커서 (없으면 마지막 페이지)
 }
\ No newline at end of file
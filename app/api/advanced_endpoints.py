@@ -6,6 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from typing import List, Optional, Dict, Any
 from app.schemas.schemas import SearchRequest, SearchResponse, PostResponse
 from app.services.browser_service import BrowserService
+from app.services.browser_pool_service import dom_snapshot_cache
+from app.services.clearance_service import clearance_store
+from app.services.html_parse_service import html_parser
 from app.services.linkedin_service import LinkedInService
 from app.services.discord_service import DiscordService
 from app.services.hackernews_service import HackerNewsService
@@ -40,8 +43,6 @@ async def dynamic_content_search(
     - **scroll**: 무한 스크롤 페이지 여부
     """
     try:
-        await browser_service.start()
-        
         if scroll:
             # 무한 스크롤 처리
             items = await browser_service.handle_infinite_scroll(
@@ -58,9 +59,6 @@ async def dynamic_content_search(
     except Exception as e:
         logger.error(f"Dynamic search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if background_tasks:
-            background_tasks.add_task(browser_service.stop)
 
 @router.post("/execute-script")
 async def execute_javascript(
@@ -76,14 +74,11 @@ async def execute_javascript(
     - **wait_time**: 페이지 로드 대기 시간
     """
     try:
-        await browser_service.start()
         result = await browser_service.execute_custom_script(url, script)
         return {"status": "success", "result": result}
     except Exception as e:
         logger.error(f"Script execution error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        await browser_service.stop()
 
 @router.post("/linkedin-search")
 async def search_linkedin(
@@ -300,13 +295,13 @@ async def bypass_cloudflare_protection(url: str):
     - **url**: Cloudflare로 보호된 URL
     """
     try:
-        await browser_service.start()
         content = await browser_service.bypass_cloudflare(url)
         
         if content:
             return {
                 "status": "success",
                 "content_length": len(content),
+                "clearance": clearance_store.get(url) is not None,
                 "preview": content[:500] + "..." if len(content) > 500 else content
             }
         else:
@@ -315,8 +310,6 @@ async def bypass_cloudflare_protection(url: str):
     except Exception as e:
         logger.error(f"Cloudflare bypass error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        await browser_service.stop()
 
 @router.get("/service-status")
 async def get_advanced_service_status():
@@ -325,6 +318,10 @@ async def get_advanced_service_status():
     """
     return {
         "browser_service": "ready",
+        "browser_pool": browser_service.pool.get_stats(),
+        "dom_snapshot_cache": dom_snapshot_cache.get_stats(),
+        "cloudflare_clearance": clearance_store.get_stats(),
+        "html_parser": html_parser.get_stats(),
         "linkedin": "ready",
         "discord": {
             "status": "ready",
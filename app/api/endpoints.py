@@ -1,15 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from typing import List, Optional, Dict
-from app.schemas.schemas import SearchRequest, SearchResponse, PostResponse, ReportResponse
+from app.schemas.schemas import SearchRequest, SearchResponse, PostResponse, ReportResponse, PostBase, RegenerateRequest
 from app.services.reddit_service import RedditService
 # from app.services.twitter_service import TwitterService  # Twitter 서비스 비활성화
 from app.services.threads_service import ThreadsService
+from app.services.hackernews_service import HackerNewsService
 from app.services.llm_service import LLMService
 from app.services.progress_service import progress_service
-from app.services.supabase_reports_service import supabase_reports_service
+from app.services.storage_backend_service import storage_backend
 from app.services.push_notification_service import push_notification_service
+from app.services.report_cache_service import report_cache_service
+from app.services.structured_report_service import structured_report_service
+from app.services.input_snapshot_service import input_snapshot_service
+from app.services.http_client_service import http_client_registry
+from app.services.listing_cache_service import reddit_listing_cache
+from app.services.subreddit_index_service import subreddit_index
+from app.services.firehose_service import subreddit_firehose
+from app.services.post_archive_service import post_archive
+from app.services.read_cache_service import decode_cursor, user_read_cache
+from app.services.reddit_rate_governor import get_all_stats
+from app.services.credential_pool_service import reddit_credential_pool, openai_credential_pool
+from app.services.collector_service import collector_registry, RedditCollector, ThreadsCollector, HackerNewsCollector
+from app.core.config import settings
 import asyncio
 import logging
+import time
 from datetime import datetime
 import uuid
 
@@ -20,8 +35,14 @@ router = APIRouter()
 reddit_service = RedditService()
 # twitter_service = TwitterService()  # Twitter 서비스 비활성화
 threads_service = ThreadsService()
+hackernews_service = HackerNewsService()
 llm_service = LLMService()
 
+# 소스 수집기 등록 (Twitter 서비스 비활성화)
+collector_registry.register(RedditCollector(reddit_service))
+collector_registry.register(ThreadsCollector(threads_service))
+collector_registry.register(HackerNewsCollector(hackernews_service))
+
 @router.post("/search", response_model=SearchResponse)
 async def search_and_analyze(
     request: SearchRequest, 
@@ -31,7 +52,7 @@ async def search_and_analyze(
     여러 커뮤니티에서 정보를 검색하고 분석합니다.
     
     - **query**: 검색할 키워드
-    - **sources**: 검색할 플랫폼 목록 (reddit, twitter, threads)
+    - **sources**: 검색할 플랫폼 목록 (reddit, twitter, threads, hackernews)
     - **user_nickname**: 사용자 닉네임
     - **schedule_yn**: 스케줄링 여부 (Y/N)
     - **schedule_period**: 주기 (분 단위) - schedule_yn이 Y일 때 필수
@@ -96,142 +117,76 @@ async def search_and_analyze(
     # 검색 쿼리는 Supabase reports에 직접 저장되므로 별도 저장 불필요
     logger.info(f"Processing search query: {request.query}")
     query_id = str(uuid.uuid4())  # 임시 query ID 생성
+    report_length = request.length.value if request.length else "moderate"
     
-    # 고급 가중치 검색 시스템 사용
-    if "reddit" in request.sources:
+    # 같은 시간 버킷에 동일 조건으로 생성된 보고서가 있으면 재사용 (수집/분석 생략)
+    cached = report_cache_service.get(request.query, request.sources, report_length, request.structured_output)
+    sibling = None if cached else report_cache_service.find_analysis(
+        request.query, request.sources, request.structured_output
+    )
+    if sibling:
+        # 다른 길이로 만든 상세 분석이 있으면 같은 인용을 유지한 채 로컬에서 길이만 변환
+        report_data = structured_report_service.derive(
+            sibling["report_data"]["analysis"],
+            report_length,
+            sibling["report_data"]["post_mappings"]
+        )
+        posts_metadata = report_data["post_mappings"]
+        posts_collected = sibling["posts_collected"]
+        report_cache_service.put(
+            request.query,
+            request.sources,
+            report_length,
+            report_data=report_data,
+            posts=sibling["posts"],
+            posts_metadata=posts_metadata,
+            input_fingerprint=sibling["input_fingerprint"],
+            posts_collected=posts_collected,
+            structured=request.structured_output
+        )
+        input_posts = sibling["posts"]
+    elif cached:
+        report_data = cached["report_data"]
+        posts_metadata = cached["posts_metadata"]
+        posts_collected = cached["posts_collected"]
+        input_posts = cached["posts"]
         await progress_service.update_progress(
             session_id, 
-            "keyword_expansion", 
-            20, 
-            "🤖 AI가 키워드를 확장하고 있습니다...",
-            f"'{request.query}'를 분석하여 최적의 검색 키워드를 생성 중"
+            "cache_hit", 
+            90, 
+            "⚡ 최근 생성된 보고서를 불러왔습니다",
+            "동일한 키워드의 최신 분석 결과를 재사용합니다"
         )
-        
-        logger.info("Using advanced weighted search system for Reddit")
-        try:
-            # GPT-4로 키워드 확장
-            from app.services.advanced_search_service import AdvancedSearchService
-            advanced_search = AdvancedSearchService()
-            
-            await progress_service.update_progress(
-                session_id, 
-                "reddit_search", 
-                40, 
-                "🔍 Reddit에서 게시물을 수집하고 있습니다...",
-                "가중치 기반 검색으로 고품질 게시물을 선별 중"
-            )
-            
-            # 가중치 기반 검색 실행
-            search_result = await advanced_search.weighted_search(request.query, session_id)
-            all_posts = search_result.get('posts', [])
-            
-            logger.info(f"Advanced search completed. Total posts: {len(all_posts)}")
-            
-            await progress_service.update_progress(
-                session_id, 
-                "data_collection", 
-                60, 
-                f"📊 {len(all_posts)}개의 게시물을 수집했습니다",
-                "댓글과 메타데이터를 포함한 상세 정보 수집 완료"
-            )
-            
-        except Exception as e:
-            logger.error(f"Advanced search failed, falling back to basic search: {e}")
-            # 기본 검색으로 폴백
-            all_posts = reddit_service.search_posts(request.query)
     else:
-        # 기존 로직 유지 (Twitter, Threads)
-        tasks = []
-        logger.info(f"Starting search on platforms: {request.sources}")
-        
-        # Twitter 서비스 비활성화
-        # if "twitter" in request.sources:
-        #     logger.info("Adding Twitter search task")
-        #     tasks.append(asyncio.to_thread(twitter_service.search_posts, request.query))
-        if "threads" in request.sources:
-            logger.info("Adding Threads search task")
-            tasks.append(asyncio.to_thread(threads_service.search_posts, request.query))
-        
-        logger.info(f"Total tasks to execute: {len(tasks)}")
+        saved_posts = await _collect_posts(request, session_id)
+        logger.info(f"Collected {len(saved_posts)} posts")
         
-        # 모든 검색 결과 수집
-        all_results = await asyncio.gather(*tasks, return_exceptions=True)
-        all_posts = []
-        
-        logger.info(f"Search results collected. Total results: {len(all_results)}")
+        # 수집된 게시물이 없으면 에러 반환
+        if not saved_posts:
+            logger.warning(f"No posts collected for query: {request.query}")
+            raise HTTPException(
+                status_code=404,
+                detail="검색 결과가 없습니다. 다른 키워드로 시도해주세요."
+            )
         
-        for i, result in enumerate(all_results):
-            if isinstance(result, Exception):
-                logger.error(f"Search error in task {i}: {result}")
-                logger.error(f"Exception type: {type(result)}")
-            else:
-                logger.info(f"Task {i} returned {len(result)} posts")
-                all_posts.extend(result)
-    
-    # 수집된 게시물 정리 (데이터베이스 저장 없이 메모리에만 유지)
-    saved_posts = all_posts  # 모든 post_data를 그대로 사용
-    logger.info(f"Collected {len(saved_posts)} posts")
-    
-    # 수집된 게시물이 없으면 에러 반환
-    if not saved_posts:
-        logger.warning(f"No posts collected for query: {request.query}")
-        raise HTTPException(
-            status_code=404,
-            detail="검색 결과가 없습니다. 다른 키워드로 시도해주세요."
-        )
-    
-    # 고급 검증된 분석 시스템 사용
-    await progress_service.update_progress(
-        session_id, 
-        "analysis", 
-        80, 
-        "🧠 AI가 수집된 데이터를 분석하고 있습니다...",
-        "GPT-4.1을 사용하여 검증된 분석 보고서 생성 중"
-    )
-    
-    try:
-        from app.services.verified_analysis_service import VerifiedAnalysisService
-        verified_analysis = VerifiedAnalysisService()
+        report_data = await _analyze_posts(request, saved_posts, session_id)
+        posts_metadata = _build_posts_metadata(report_data, saved_posts)
+        posts_collected = len(saved_posts)
+        input_posts = saved_posts
         
-        # 검증된 분석 보고서 생성
-        report_data = await verified_analysis.generate_verified_report(
+        report_cache_service.put(
             request.query,
-            saved_posts,
-            report_length=request.length.value if request.length else "moderate",
-            session_id=session_id
-        )
-        
-        logger.info("Used verified analysis system")
-        
-    except Exception as e:
-        logger.error(f"Verified analysis failed, using basic LLM: {e}")
-        # 기본 LLM 서비스로 폴백
-        report_data = await llm_service.generate_report(
-            request.query, 
-            saved_posts,
-            report_length=request.length.value if request.length else "moderate"
+            request.sources,
+            report_length,
+            report_data=report_data,
+            posts=saved_posts,
+            posts_metadata=posts_metadata,
+            structured=request.structured_output
         )
     
     # Report 객체 생성 (데이터베이스 저장 없이 임시 생성)
     report_id = str(uuid.uuid4())
     
-    # LLM이 생성한 post_mappings 사용 (있으면)
-    posts_metadata = report_data.get("post_mappings", [])
-    
-    # post_mappings가 없으면 기존 방식으로 메타데이터 수집
-    if not posts_metadata:
-        for post in saved_posts[:30]:  # 최대 30개 포스트의 메타데이터 저장
-            if post.url:  # URL이 있는 포스트만
-                metadata = {
-                    "url": post.url,
-                    "score": post.score,
-                    "comments": post.comments,
-                    "created_utc": post.created_utc,
-                    "subreddit": post.subreddit,
-                    "title": post.title[:100] if post.title else None
-                }
-                posts_metadata.append(metadata)
-    
     # Supabase에 보고서 저장
     try:
         supabase_report_data = {
@@ -239,16 +194,28 @@ async def search_and_analyze(
             "query_text": request.query,
             "full_report": report_data["full_report"],
             "summary": report_data["summary"],
-            "posts_collected": len(saved_posts),
-            "report_length": request.length.value if request.length else "moderate",
+            "posts_collected": posts_collected,
+            "report_length": report_length,
             "session_id": session_id,
-            "posts_metadata": posts_metadata  # 메타데이터 추가
+            "posts_metadata": posts_metadata,  # 메타데이터 추가
+            "report_links": report_data.get("report_links")  # 구조화 모드에서 렌더링 시 생성된 링크
         }
         
-        save_result = await supabase_reports_service.save_report(supabase_report_data)
+        save_result = await storage_backend.save_report(supabase_report_data)
         if save_result["success"]:
             logger.info(f"Report saved to Supabase: {save_result['report_id']}")
             
+            # 재생성용 입력 스냅샷 저장 (Reddit 재수집 없이 프롬프트/모델/길이 변경 가능)
+            if input_posts:
+                await asyncio.to_thread(
+                    input_snapshot_service.save,
+                    save_result['report_id'],
+                    request.query,
+                    input_posts,
+                    sources=request.sources,
+                    report_length=report_length
+                )
+            
             # 푸시 알림 전송 (비동기)
             if request.push_token:
                 asyncio.create_task(
@@ -270,13 +237,13 @@ async def search_and_analyze(
         "completed", 
         100, 
         "✅ 분석이 완료되었습니다!",
-        f"총 {len(saved_posts)}개 게시물 분석 완료"
+        f"총 {posts_collected}개 게시물 분석 완료"
     )
     
     response = SearchResponse(
         query_id=query_id,
         query_text=request.query,
-        posts_collected=len(saved_posts),
+        posts_collected=posts_collected,
         report=ReportResponse(
             id=report_id,
             search_query_id=query_id,
@@ -291,6 +258,86 @@ async def search_and_analyze(
     
     return response
 
+async def _collect_posts(request: SearchRequest, session_id: str) -> List[PostBase]:
+    """요청된 소스에서 게시물 수집 (등록된 수집기를 공통 마감 시간 안에 동시 실행)"""
+    logger.info(f"Starting search on platforms: {request.sources}")
+    results = await collector_registry.fan_out(request.sources, request.query, session_id)
+    
+    all_posts = []
+    for source, result in results.items():
+        all_posts.extend(result["posts"])
+    
+    await progress_service.update_progress(
+        session_id, 
+        "data_collection", 
+        60, 
+        f"📊 {len(all_posts)}개의 게시물을 수집했습니다",
+        "댓글과 메타데이터를 포함한 상세 정보 수집 완료"
+    )
+    
+    # 과거 검색용 로컬 아카이브에 저장 (백그라운드 일괄 저장)
+    post_archive.add_posts(all_posts, query=request.query)
+    return all_posts
+
+async def _analyze_posts(request: SearchRequest, saved_posts: List[PostBase], session_id: str) -> Dict:
+    """수집된 게시물로 분석 보고서 생성"""
+    # 고급 검증된 분석 시스템 사용
+    await progress_service.update_progress(
+        session_id, 
+        "analysis", 
+        80, 
+        "🧠 AI가 수집된 데이터를 분석하고 있습니다...",
+        "GPT-4.1을 사용하여 검증된 분석 보고서 생성 중"
+    )
+    
+    try:
+        from app.services.verified_analysis_service import VerifiedAnalysisService
+        verified_analysis = VerifiedAnalysisService()
+        
+        # 검증된 분석 보고서 생성
+        report_data = await verified_analysis.generate_verified_report(
+            request.query,
+            saved_posts,
+            report_length=request.length.value if request.length else "moderate",
+            session_id=session_id,
+            structured=request.structured_output
+        )
+        
+        logger.info("Used verified analysis system")
+        
+    except Exception as e:
+        logger.error(f"Verified analysis failed, using basic LLM: {e}")
+        # 기본 LLM 서비스로 폴백
+        report_data = await llm_service.generate_report(
+            request.query, 
+            saved_posts,
+            report_length=request.length.value if request.length else "moderate",
+            structured=request.structured_output
+        )
+    
+    return report_data
+
+def _build_posts_metadata(report_data: Dict, saved_posts: List[PostBase]) -> List[Dict]:
+    """보고서 저장용 게시물 메타데이터 구성"""
+    # LLM이 생성한 post_mappings 사용 (있으면)
+    posts_metadata = report_data.get("post_mappings", [])
+    
+    # post_mappings가 없으면 기존 방식으로 메타데이터 수집
+    if not posts_metadata:
+        for post in saved_posts[:30]:  # 최대 30개 포스트의 메타데이터 저장
+            if post.url:  # URL이 있는 포스트만
+                metadata = {
+                    "url": post.url,
+                    "score": post.score,
+                    "comments": post.comments,
+                    "created_utc": post.created_utc,
+                    "subreddit": post.subreddit,
+                    "title": post.title[:100] if post.title else None
+                }
+                posts_metadata.append(metadata)
+    
+    return posts_metadata
+
 @router.get("/search/{query_id}", response_model=SearchResponse)
 async def get_search_details(query_id: int):
     """특정 검색의 상세 정보를 가져옵니다."""
@@ -329,7 +376,7 @@ async def get_trending_topics():
     
     # Reddit 트렌딩
     try:
-        trending["reddit"] = await reddit_service.get_trending_topics()
+        trending["reddit"] = await asyncio.to_thread(reddit_service.get_trending_topics)
     except Exception as e:
         logger.error(f"Error getting Reddit trending: {e}")
         trending["reddit"] = []
@@ -385,17 +432,27 @@ async def get_statistics():
 @router.get("/reports/{user_nickname}")
 async def get_user_reports(
     user_nickname: str,
-    limit: int = Query(20, description="반환할 최대 보고서 수")
+    limit: int = Query(20, ge=1, le=100, description="반환할 최대 보고서 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지)")
 ):
-    """사용자의 보고서 목록을 Supabase에서 조회합니다."""
+    """사용자의 보고서 목록(요약)을 조회합니다. 본문(full_report)은 상세 조회에서만 반환합니다."""
+    try:
+        decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
     try:
-        result = await supabase_reports_service.get_user_reports(user_nickname, limit)
+        result = await user_read_cache.get_or_load(
+            "reports", user_nickname, ("list", limit, cursor),
+            lambda: storage_backend.get_user_reports(user_nickname, limit, cursor)
+        )
         
         if result["success"]:
             return {
                 "success": True,
                 "reports": result["data"],
-                "count": result["count"]
+                "count": result["count"],
+                "next_cursor": result.get("next_cursor")
             }
         else:
             raise HTTPException(
@@ -410,7 +467,7 @@ async def get_user_reports(
 async def get_report_detail(report_id: str):
     """특정 보고서의 상세 정보를 조회합니다."""
     try:
-        result = await supabase_reports_service.get_report_by_id(report_id)
+        result = await storage_backend.get_report_by_id(report_id)
         
         if result["success"]:
             return {
@@ -430,7 +487,7 @@ async def get_report_detail(report_id: str):
 async def get_report_links(report_id: str):
     """특정 보고서의 링크 목록을 조회합니다."""
     try:
-        result = await supabase_reports_service.get_report_links(report_id)
+        result = await storage_backend.get_report_links(report_id)
         
         if result["success"]:
             return {
@@ -456,9 +513,10 @@ async def delete_user_report(
 ):
     """사용자의 보고서를 삭제합니다."""
     try:
-        result = await supabase_reports_service.delete_report(report_id, user_nickname)
+        result = await storage_backend.delete_report(report_id, user_nickname)
         
         if result["success"]:
+            input_snapshot_service.delete(report_id)
             return {
                 "success": True,
                 "message": "보고서가 성공적으로 삭제되었습니다."
@@ -472,11 +530,67 @@ async def delete_user_report(
         logger.error(f"Error deleting report: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/reports/{report_id}/regenerate")
+async def regenerate_report(report_id: str, request: RegenerateRequest):
+    """저장된 입력 스냅샷으로 보고서를 재생성합니다 (Reddit 재수집 없음)."""
+    result = await input_snapshot_service.regenerate(
+        report_id,
+        report_length=request.length.value if request.length else None,
+        structured=request.structured_output,
+        model=request.model
+    )
+    
+    if not result["success"]:
+        if result.get("error") == "Snapshot not found":
+            raise HTTPException(status_code=404, detail="이 보고서의 입력 스냅샷이 없습니다.")
+        raise HTTPException(status_code=500, detail=result.get("error") or result["report_data"]["full_report"])
+    
+    report_data = result["report_data"]
+    header = result["header"]
+    new_report_id = None
+    
+    if request.save:
+        save_result = await storage_backend.save_report({
+            "user_nickname": request.user_nickname,
+            "query_text": header["query"],
+            "full_report": report_data["full_report"],
+            "summary": report_data["summary"],
+            "posts_collected": len(result["posts"]),
+            "report_length": result["report_length"],
+            "posts_metadata": report_data["post_mappings"],
+            "report_links": report_data.get("report_links")
+        })
+        if not save_result["success"]:
+            raise HTTPException(status_code=500, detail=f"보고서 저장 실패: {save_result['error']}")
+        
+        new_report_id = save_result["report_id"]
+        await asyncio.to_thread(
+            input_snapshot_service.save,
+            new_report_id,
+            header["query"],
+            result["posts"],
+            sources=header.get("sources"),
+            report_length=result["report_length"]
+        )
+    
+    return {
+        "success": True,
+        "source_report_id": report_id,
+        "report_id": new_report_id,
+        "report_length": result["report_length"],
+        "summary": report_data["summary"],
+        "full_report": report_data["full_report"],
+        "report_links": report_data.get("report_links")
+    }
+
 @router.get("/reports/{user_nickname}/stats")
 async def get_user_report_stats(user_nickname: str):
     """사용자의 보고서 통계를 조회합니다."""
     try:
-        result = await supabase_reports_service.get_report_stats(user_nickname)
+        result = await user_read_cache.get_or_load(
+            "reports", user_nickname, ("stats",),
+            lambda: storage_backend.get_report_stats(user_nickname)
+        )
         
         if result["success"]:
             return {
@@ -490,4 +604,143 @@ async def get_user_report_stats(user_nickname: str):
             )
     except Exception as e:
         logger.error(f"Error retrieving report stats: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/cache/reports/stats")
+async def get_report_cache_stats():
+    """보고서 캐시 통계(적중률 등)를 조회합니다."""
+    return {
+        "success": True,
+        "stats": report_cache_service.get_stats()
+    }
+
+@router.get("/cache/reads/stats")
+async def get_read_cache_stats():
+    """목록 조회 캐시(보고서/스케줄/알림) 통계를 조회합니다."""
+    return {
+        "success": True,
+        "stats": user_read_cache.get_stats()
+    }
+
+@router.get("/reddit/subreddit-index")
+async def get_subreddit_index(query: Optional[str] = None, limit: int = 20):
+    """서브레딧 라우팅 인덱스 상태 조회 (query를 주면 해당 검색어가 보내질 서브레딧도 함께 반환)"""
+    return {
+        "success": True,
+        "index": subreddit_index.get_stats(query, limit)
+    }
+
+@router.post("/reddit/subreddit-index/refresh")
+async def refresh_subreddit_index():
+    """마지막 갱신 이후 저장된 보고서 링크를 인덱스에 반영합니다."""
+    added = await subreddit_index.refresh_from_reports()
+    return {
+        "success": True,
+        "added": added,
+        "index": subreddit_index.get_stats(limit=10)
+    }
+
+@router.get("/reddit/firehose")
+async def get_firehose_stats():
+    """관심 서브레딧 수집기 상태와 로컬 저장소 통계를 조회합니다."""
+    return {
+        "success": True,
+        "firehose": await asyncio.to_thread(subreddit_firehose.get_stats)
+    }
+
+@router.get("/archive/search")
+async def search_archive(
+    q: str = Query(..., description="검색어"),
+    source: Optional[str] = Query(None, description="소스 (reddit, hackernews, threads)"),
+    subreddit: Optional[str] = None,
+    days: Optional[int] = Query(None, description="최근 N일 게시물만"),
+    since: Optional[float] = Query(None, description="작성 시각 하한 (UTC timestamp)"),
+    until: Optional[float] = Query(None, description="작성 시각 상한 (UTC timestamp)"),
+    min_score: int = 0,
+    sort: str = Query("relevance", description="relevance, score, new"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    """지금까지 수집한 게시물을 로컬 아카이브에서 검색합니다 (Reddit 요청 없음)."""
+    if days:
+        since = max(since or 0, time.time() - days * 86400)
+    started = time.perf_counter()
+    results = await asyncio.to_thread(
+        post_archive.search, q, source, subreddit, since, until, min_score, sort, limit, offset
+    )
+    return {
+        "success": True,
+        "query": q,
+        "count": len(results),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": results
+    }
+
+@router.get("/archive/stats")
+async def get_archive_stats():
+    """게시물 아카이브 통계를 조회합니다."""
+    return {
+        "success": True,
+        "archive": await asyncio.to_thread(post_archive.get_stats)
+    }
+
+@router.get("/storage/stats")
+async def get_storage_stats():
+    """저장소 백엔드 종류와 연산별 지연 시간을 조회합니다."""
+    return {
+        "success": True,
+        "storage": storage_backend.get_stats()
+    }
+
+@router.get("/cache/listings/stats")
+async def get_listing_cache_stats():
+    """Reddit 검색 목록 캐시 통계(적중률, 백그라운드 갱신 수 등)를 조회합니다."""
+    return {
+        "success": True,
+        "stats": reddit_listing_cache.get_stats()
+    }
+
+@router.delete("/cache/listings")
+async def clear_listing_cache():
+    """Reddit 검색 목록 캐시를 비웁니다."""
+    return {
+        "success": True,
+        "removed": reddit_listing_cache.clear()
+    }
+
+@router.get("/http/stats")
+async def get_http_client_stats():
+    """공유 HTTP 클라이언트의 호스트별 연결 재사용 통계를 조회합니다."""
+    return {
+        "success": True,
+        "stats": http_client_registry.get_stats()
+    }
+
+@router.get("/reddit/rate-limit")
+async def get_reddit_rate_limit_stats():
+    """Reddit 요청 예산(X-Ratelimit) 사용률과 우선순위별 대기 통계를 조회합니다."""
+    return {
+        "success": True,
+        "stats": get_all_stats()
+    }
+
+@router.get("/credentials/stats")
+async def get_credential_pool_stats():
+    """Reddit/OpenAI 키 풀의 키별 요청 분배, 제한 횟수, 백오프 상태를 조회합니다."""
+    return {
+        "success": True,
+        "reddit": reddit_credential_pool.get_stats(),
+        "openai": openai_credential_pool.get_stats()
+    }
+
+@router.delete("/cache/reports")
+async def invalidate_report_cache(
+    query: Optional[str] = Query(None, description="무효화할 검색어 (없으면 전체)"),
+    report_length: Optional[str] = Query(None, description="무효화할 보고서 길이 (simple, moderate, detailed)")
+):
+    """보고서 캐시를 무효화합니다."""
+    removed = report_cache_service.invalidate(query, report_length)
+    return {
+        "success": True,
+        "removed": removed
+    }
\ No newline at end of file
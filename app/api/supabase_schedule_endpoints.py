@@ -1,11 +1,12 @@
 """
 수파베이스 기반 스케줄링 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 from app.services.supabase_schedule_service import supabase_schedule_service
 from app.services.supabase_service import supabase_service
+from app.services.read_cache_service import decode_cursor, user_read_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -71,12 +72,24 @@ async def create_schedule(schedule_data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail="스케줄 생성에 실패했습니다.")
 
 @router.get("/user/{user_nickname}", response_model=Dict[str, Any])
-async def get_user_schedules(user_nickname: str):
+async def get_user_schedules(
+    user_nickname: str,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지)")
+):
     """
-    사용자의 스케줄 목록 조회
+    사용자의 스케줄 목록 조회 (최신순, 커서 페이지)
     """
     try:
-        result = supabase_schedule_service.get_user_schedules(user_nickname)
+        decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    try:
+        result = await user_read_cache.get_or_load(
+            "schedules", user_nickname, (limit, cursor),
+            lambda: supabase_schedule_service.get_user_schedules(user_nickname, limit, cursor)
+        )
         
         # 실행 중인 스케줄 정보 추가
         if result["success"] and result.get("schedules"):
@@ -217,12 +230,25 @@ async def delete_all_cancelled_schedules(user_nickname: str):
         raise HTTPException(status_code=500, detail="취소된 스케줄 일괄 삭제에 실패했습니다.")
 
 @router.get("/notifications/{user_nickname}", response_model=Dict[str, Any])
-async def get_user_notifications(user_nickname: str, unread_only: bool = False):
+async def get_user_notifications(
+    user_nickname: str,
+    unread_only: bool = False,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지)")
+):
     """
-    사용자 알림 목록 조회
+    사용자 알림 목록 조회 (최신순, 커서 페이지)
     """
     try:
-        result = supabase_schedule_service.get_user_notifications(user_nickname, unread_only)
+        decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    try:
+        result = await user_read_cache.get_or_load(
+            "notifications", user_nickname, (unread_only, limit, cursor),
+            lambda: supabase_schedule_service.get_user_notifications(user_nickname, unread_only, limit, cursor)
+        )
         return result
     except Exception as e:
         logger.error(f"알림 목록 조회 오류: {e}")
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Dict, Any, Optional
 from app.schemas.schemas import UserRegisterRequest, UserLoginRequest, UserAuthResponse, SupabaseUserResponse
 from app.services.supabase_service import supabase_service
+from app.services.read_cache_service import decode_cursor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -109,15 +110,24 @@ async def approve_user(user_id: str):
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다.")
 
 @router.get("/all", response_model=Dict[str, Any])
-async def get_all_users():
-    """모든 사용자 조회 (관리자용)"""
+async def get_all_users(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지)")
+):
+    """사용자 목록 조회 (관리자용, 커서 페이지)"""
     try:
-        result = await supabase_service.get_all_users()
+        decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    try:
+        result = await supabase_service.get_all_users(limit, cursor)
         
         if result["success"]:
             return {
                 "success": True,
-                "data": result["data"]
+                "data": result["data"],
+                "next_cursor": result["next_cursor"]
             }
         else:
             error_code = result.get("error", "UNKNOWN_ERROR")
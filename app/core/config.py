@@ -8,6 +8,31 @@ class Settings(BaseSettings):
     REDDIT_CLIENT_ID: Optional[str] = None
     REDDIT_CLIENT_SECRET: Optional[str] = None
     REDDIT_USER_AGENT: str = "CommunityCollector/1.0"
+    REDDIT_CREDENTIALS: Optional[str] = None  # 추가 키 "client_id:secret,client_id:secret"
+    REDDIT_LISTING_CACHE_TTL_SECONDS: int = 300  # 이 시간 안의 같은 검색은 Reddit 요청 없이 캐시 사용
+    REDDIT_LISTING_CACHE_STALE_SECONDS: int = 600  # TTL 이후 이 시간 동안은 캐시 반환 + 백그라운드 갱신
+    REDDIT_LISTING_CACHE_MAX_ENTRIES: int = 1000
+    QUERY_PLANNER_CONCURRENCY: int = 3  # 동시에 실행할 검색 작업 수
+    QUERY_PLANNER_MAX_REQUESTS: int = 12  # 검색 1회당 최대 Reddit 검색 요청 수
+    QUERY_PLANNER_MIN_SCORE: int = 20  # 수집 대상 최소 점수
+    QUERY_PLANNER_STATS_PATH: Optional[str] = "reports/query_planner_yields.json"  # 키워드 유형별 학습된 수확량
+    SUBREDDIT_INDEX_PATH: Optional[str] = "reports/subreddit_index.json"  # 검색어 단어 → 서브레딧 라우팅 인덱스
+    SUBREDDIT_INDEX_REFRESH_SECONDS: int = 600  # report_links 증분 반영 주기
+    SUBREDDIT_ROUTE_MAX_SUBREDDITS: int = 5  # r/a+b+c 검색 한 번에 묶을 최대 서브레딧 수
+    SUBREDDIT_ROUTE_MIN_EVIDENCE: float = 3.0  # 이 가중치 미만의 서브레딧으로는 보내지 않음
+    SUBREDDIT_ROUTE_FALLBACK_RATIO: float = 0.3  # 라우팅 결과가 limit의 이 비율 미만일 때만 r/all도 검색
+    SUBREDDIT_ROUTE_EXPLORE_RATE: float = 0.1  # 라우팅된 검색 중 이 비율은 r/all도 검색해 인덱스 근거 수집
+    FIREHOSE_ENABLED: bool = False  # 관심 서브레딧 새 글/댓글 백그라운드 수집
+    FIREHOSE_SUBREDDITS: Optional[str] = None  # 쉼표 구분 "stocks,teslamotors,nvidia"
+    FIREHOSE_POLL_SECONDS: int = 60
+    FIREHOSE_COMMENTS: bool = True  # 댓글 스트림도 함께 수집
+    LOCAL_STORE_PATH: str = "reports/local_posts.db"  # 로컬 게시물 저장소 (SQLite FTS5)
+    ARCHIVE_ENABLED: bool = True  # 수집한 모든 게시물을 로컬 저장소에 보관 (과거 검색용)
+    ARCHIVE_BATCH_SIZE: int = 500  # 이만큼 쌓이면 바로 저장
+    ARCHIVE_FLUSH_SECONDS: float = 2.0  # 그 전이라도 이 주기마다 저장
+    LEXICON_PATH: Optional[str] = None  # 한영 어휘 사전 파일 (기본: app/data/lexicon_ko_en.json)
+    REDDIT_RATE_INTERACTIVE_RESERVE: int = 10  # 스케줄 작업이 남겨둬야 하는 대화형 검색용 요청 수
+    REDDIT_RATE_WINDOW_SECONDS: int = 600  # 헤더에 리셋 정보가 없을 때 가정하는 윈도우
     
     TWITTER_BEARER_TOKEN: Optional[str] = None
     TWITTER_API_KEY: Optional[str] = None
@@ -16,8 +41,68 @@ class Settings(BaseSettings):
     TWITTER_ACCESS_TOKEN_SECRET: Optional[str] = None
     
     OPENAI_API_KEY: Optional[str] = None
+    OPENAI_API_KEYS: Optional[str] = None  # 추가 키 (쉼표 구분)
+    CREDENTIAL_BACKOFF_BASE_SECONDS: float = 5.0  # 429를 받은 키의 첫 백오프 (연속 제한 시 2배씩)
+    CREDENTIAL_BACKOFF_MAX_SECONDS: float = 300.0
     ANTHROPIC_API_KEY: Optional[str] = None
     
+    # 보고서 생성
+    REPORT_STRUCTURED_OUTPUT: bool = False  # JSON 구조화 출력 + 로컬 렌더링 사용 여부
+    REPORT_STREAMING_VALIDATION: bool = True  # 스트리밍 생성 중 거부/각주 누락 조기 중단
+    REPORT_CITATION_DEADLINE_CHARS: int = 1500  # 이 글자 수까지 각주가 없으면 중단 (0이면 검사 안 함)
+    
+    # 보고서 캐시
+    REPORT_CACHE_ENABLED: bool = True
+    REPORT_CACHE_BUCKET_MINUTES: int = 60  # 같은 버킷(시간 구간) 안의 동일 요청은 캐시된 보고서 재사용
+    REPORT_CACHE_MAX_ENTRIES: int = 256
+    
+    # 목록 조회 캐시 (사용자별 보고서/스케줄/알림 목록, 쓰기 시 해당 사용자 항목 무효화)
+    READ_CACHE_ENABLED: bool = True
+    READ_CACHE_TTL_SECONDS: float = 15.0  # 다른 인스턴스의 쓰기는 이 시간까지 늦게 보일 수 있음
+    READ_CACHE_MAX_ENTRIES: int = 2000
+    
+    # 보고서 생성 모델 / 입력 스냅샷 (재생성용)
+    REPORT_MODEL: str = "gpt-4.1"
+    SNAPSHOT_ENABLED: bool = True
+    SNAPSHOT_DIR: str = "reports/snapshots"
+    
+    # Hacker News
+    HN_COMMENT_CACHE_TTL_SECONDS: int = 300
+    HN_COMMENT_TREE_MAX_COMMENTS: int = 100  # 한 스토리에서 가져올 최대 댓글 수
+    HN_COMMENT_TREE_MAX_BYTES: int = 8 * 1024 * 1024  # Algolia 트리 응답 크기 상한
+    HN_FIREBASE_CONCURRENCY: int = 10
+    HN_SEARCH_MAX_PAGES: int = 5
+    HN_SEARCH_WINDOW_HOURS: int = 24 * 30  # /search에서 조회할 기간
+    HN_SEARCH_TIME_BUDGET_SECONDS: float = 8.0
+    HN_SCHEDULED_COLLECTION: bool = False  # 스케줄 실행 시 HN 새 스토리도 함께 수집
+    
+    # 소스 동시 수집 설정
+    COLLECTOR_DEADLINE_SECONDS: float = 120.0  # 모든 소스 공통 마감 시간 (초과 시 해당 소스 취소)
+    
+    # 브라우저 풀 (Playwright)
+    BROWSER_POOL_SIZE: int = 3  # 유지할 컨텍스트 수
+    BROWSER_POOL_MAX_PAGES_PER_CONTEXT: int = 4
+    BROWSER_CONTEXT_MAX_USES: int = 50  # 이 횟수만큼 페이지를 연 컨텍스트는 교체
+    BROWSER_CONTEXT_MAX_HEAP_MB: int = 512  # JS 힙이 이 크기를 넘은 컨텍스트는 교체
+    BROWSER_POOL_ACQUIRE_TIMEOUT: float = 30.0  # 대기열에서 페이지를 기다리는 최대 시간
+    BROWSER_RENDER_PROFILE: str = "light"  # light: 이미지/폰트/미디어/트래커 차단, full: 전체 로드
+    BROWSER_DOM_QUIET_MS: int = 500  # 이 시간 동안 DOM 변경이 없으면 로드 완료로 판단
+    BROWSER_DOM_SETTLE_TIMEOUT_MS: int = 5000
+    BROWSER_DOM_CACHE_TTL_SECONDS: int = 300
+    CLOUDFLARE_CLEARANCE_TTL_SECONDS: int = 1800  # cf_clearance 만료가 더 이르면 그 시각까지만 재사용
+    
+    # HTML 파싱 풀 설정
+    HTML_PARSE_EXECUTOR: str = "thread"  # thread | process
+    HTML_PARSE_WORKERS: int = 4
+    
+    # 저장소 백엔드 ("supabase": REST, "postgres": asyncpg 직접 연결)
+    STORAGE_BACKEND: str = "supabase"
+    POSTGRES_DSN: Optional[str] = None  # 없으면 DATABASE_URL 사용
+    POSTGRES_POOL_MIN_SIZE: int = 2
+    POSTGRES_POOL_MAX_SIZE: int = 10
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100  # PgBouncer 트랜잭션 모드에서는 0
+    REPORT_PARTITION_MONTHS_AHEAD: int = 3  # 스케줄러가 미리 만들어 둘 reports/report_links 월 파티션 수 (migrations/003)
+    
     # Supabase
     SUPABASE_URL: Optional[str] = None
     SUPABASE_SERVICE_KEY: Optional[str] = None
@@ -8,6 +8,7 @@ from app.api.user_endpoints import router as user_router
 from app.api.websocket_endpoints import router as websocket_router
 import logging
 from app.core.logging_config import setup_logging
+from contextlib import asynccontextmanager
 
 # 로깅 설정 - 보기 좋은 포맷 적용
 setup_logging(level=logging.INFO)
@@ -15,10 +16,54 @@ logger = logging.getLogger(__name__)
 
 # SQLAlchemy 테이블 생성 제거 - Supabase 사용
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from app.api.websocket_endpoints import progress_manager
+    from app.services.progress_service import progress_service
+    from app.services.supabase_scheduler_service import supabase_scheduler_service
+    from app.services.http_client_service import http_client_registry
+    from app.services.browser_pool_service import browser_pool
+    from app.services.html_parse_service import html_parser
+    from app.services.subreddit_index_service import subreddit_index
+    from app.services.firehose_service import subreddit_firehose
+    from app.services.post_archive_service import post_archive
+    from app.services.storage_backend_service import storage_backend
+    
+    progress_service.set_progress_manager(progress_manager)
+    logger.info("Progress service initialized")
+    
+    # Supabase 스케줄러 시작 (비동기 함수이므로 await 사용)
+    await supabase_scheduler_service.start()
+    logger.info("✅ Supabase scheduler service started successfully")
+    
+    # 서브레딧 라우팅 인덱스 증분 갱신 시작
+    subreddit_index.start()
+    # 관심 서브레딧 새 글 수집 (FIREHOSE_ENABLED일 때만)
+    subreddit_firehose.start()
+    
+    yield
+    
+    # 저장소를 쓰는 작업(스케줄러 → 수집기 → 인덱스)을 먼저 멈추고 저장소 연결은 마지막에 닫음
+    await supabase_scheduler_service.stop()
+    logger.info("🛑 Supabase scheduler service stopped")
+    
+    await subreddit_firehose.stop()
+    await subreddit_index.stop()
+    # 아카이브 버퍼에 남은 게시물 저장
+    post_archive.shutdown()
+    
+    # 크롤러가 공유하는 HTTP 연결 / 브라우저 풀 정리
+    await http_client_registry.aclose()
+    await browser_pool.stop()
+    html_parser.shutdown()
+    
+    await storage_backend.close()
+
 app = FastAPI(
     title="Community Info Collector",
     description="해외 커뮤니티 정보 수집 및 분석 API - 정형/비정형 데이터 통합 수집",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -57,23 +102,3 @@ async def root():
             "scheduling": "Automated report generation with push notifications"
         }
     }
-
-# 스케줄러 서비스 시작
-@app.on_event("startup")
-async def startup_event():
-    from app.api.websocket_endpoints import progress_manager
-    from app.services.progress_service import progress_service
-    from app.services.supabase_scheduler_service import supabase_scheduler_service
-    
-    progress_service.set_progress_manager(progress_manager)
-    logger.info("Progress service initialized")
-    
-    # Supabase 스케줄러 시작 (비동기 함수이므로 await 사용)
-    await supabase_scheduler_service.start()
-    logger.info("✅ Supabase scheduler service started successfully")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    from app.services.supabase_scheduler_service import supabase_scheduler_service
-    await supabase_scheduler_service.stop()
-    logger.info("🛑 Supabase scheduler service stopped")
\ No newline at end of file
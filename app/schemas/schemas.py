@@ -22,6 +22,7 @@ class SearchRequest(BaseModel):
     schedule_id: Optional[int] = None
     session_id: Optional[str] = None  # 세션 ID
     push_token: Optional[str] = None  # 푸시 알림 토큰
+    structured_output: Optional[bool] = None  # 구조화 보고서 모드 (None이면 서버 설정 사용)
     # 스케줄링 관련 필드 추가
     user_nickname: Optional[str] = None  # 사용자 닉네임
     schedule_yn: Optional[str] = "N"  # 스케줄링 여부 (Y/N)
@@ -29,6 +30,14 @@ class SearchRequest(BaseModel):
     schedule_count: Optional[int] = None  # 반복 횟수
     schedule_start_time: Optional[datetime] = None  # 시작 시간
 
+class RegenerateRequest(BaseModel):
+    """입력 스냅샷으로 보고서 재생성 (값이 없으면 원본 보고서 설정 사용)"""
+    length: Optional[ReportLength] = None
+    structured_output: Optional[bool] = None
+    model: Optional[str] = None
+    save: bool = False  # True면 새 보고서로 저장
+    user_nickname: Optional[str] = None
+
 class PostBase(BaseModel):
     source: str
     post_id: Optional[str]
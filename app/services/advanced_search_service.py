@@ -8,26 +8,24 @@ import logging
 import asyncio
 from typing import List, Dict, Optional
 from datetime import datetime
-from openai import OpenAI
+from app.services.openai_gateway_service import openai_gateway
 from app.core.config import settings
 from app.services.reddit_service import RedditService
+from app.services.lexicon_service import bilingual_lexicon
+from app.services.query_planner_service import query_planner
+from app.services.subreddit_index_service import subreddit_index
+from app.services.firehose_service import subreddit_firehose
+from app.services.post_archive_service import post_archive
 from app.schemas.schemas import PostBase
 import time
-import httpx
 
 logger = logging.getLogger(__name__)
 
 class AdvancedSearchService:
     def __init__(self):
         self.reddit_service = RedditService()
-        self.openai_client = None
-        if settings.OPENAI_API_KEY:
-            # SSL 검증을 비활성화한 HTTP 클라이언트 생성
-            http_client = httpx.Client(verify=False)
-            self.openai_client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                http_client=http_client
-            )
+        # 키 풀에 분산하는 공유 게이트웨이 (키가 없으면 None)
+        self.openai_client = openai_gateway
     
     async def expand_keywords_with_gpt4(self, user_input: str) -> List[Dict]:
         """GPT-4를 사용하여 키워드를 확장하고 영어로 변환"""
@@ -89,41 +87,8 @@ JSON 형식으로 응답:
             return [{"rank": 1, "query": self.translate_to_english_keywords(user_input), "posts_to_collect": 10, "reason": "기본 번역"}]
     
     def translate_to_english_keywords(self, korean_input: str) -> str:
-        """한국어 키워드를 영어로 변환"""
-        keyword_mapping = {
-            "테슬라": "Tesla",
-            "애플": "Apple",
-            "주가": "stock price",
-            "전망": "outlook forecast",
-            "삼성": "Samsung",
-            "네이버": "Naver",
-            "카카오": "Kakao",
-            "LG": "LG",
-            "현대": "Hyundai",
-            "기아": "Kia",
-            "SK": "SK",
-            "분석": "analysis",
-            "투자": "investment",
-            "수익": "profit earnings",
-            "실적": "performance earnings",
-            "매출": "revenue sales",
-            "배당": "dividend",
-            "상승": "rise increase",
-            "하락": "fall decrease",
-            "예측": "prediction forecast",
-            "뉴스": "news",
-            "발표": "announcement",
-            "실적": "earnings results"
-        }
-        
-        english_keywords = []
-        for word in korean_input.split():
-            if word in keyword_mapping:
-                english_keywords.append(keyword_mapping[word])
-            else:
-                english_keywords.append(word)
-        
-        return " ".join(english_keywords)
+        """한국어 키워드를 영어로 변환 (공유 어휘 사전)"""
+        return bilingual_lexicon.translate(korean_input)["text"]
     
     async def weighted_search(self, user_input: str, session_id: str = None) -> Dict:
         """가중치 기반 검색 - 중요도 순위별 게시물 수집"""
@@ -137,96 +102,71 @@ JSON 형식으로 응답:
         
         logger.info(f"Generated {len(search_keywords)} search keywords")
         
+        # 관심 서브레딧 로컬 저장소에서 먼저 채우고, 부족한 키워드만 Reddit 검색
+        local_posts = {}
+        local_ids = set()
+        for keyword_info in search_keywords:
+            found = await asyncio.to_thread(
+                subreddit_firehose.lookup, [keyword_info['query']], keyword_info['posts_to_collect'], settings.QUERY_PLANNER_MIN_SCORE
+            )
+            found = [post for post in found if post.post_id not in local_ids]
+            local_ids.update(post.post_id for post in found)
+            local_posts[keyword_info['query']] = found
+        if local_ids:
+            logger.info(f"🚰 로컬 저장소 결과: {len(local_ids)}개")
+        remaining_keywords = [
+            {**keyword_info, "posts_to_collect": keyword_info['posts_to_collect'] - len(local_posts[keyword_info['query']])}
+            for keyword_info in search_keywords
+            if keyword_info['posts_to_collect'] > len(local_posts[keyword_info['query']])
+        ]
+        
+        # 쿼리 플랜 실행 - (검색어, 정렬, 기간) 작업을 수확량 순으로 동시에, 목표 달성 시 중단
+        # 검색 목록의 점수로 먼저 거른 뒤 선택된 게시물만 댓글 조회
+        # 라우팅 인덱스에 근거가 있는 키워드는 관련 서브레딧(r/a+b+c) 검색을 먼저 실행
+        plan_result = await query_planner.execute(
+            remaining_keywords,
+            lambda query, sort, time_filter, subreddit: self.reddit_service.search_listing(query, sort, time_filter, limit=25, subreddit=subreddit),
+            route=subreddit_index.route,
+            exclude_ids=local_ids
+        )
+        
+        semaphore = asyncio.Semaphore(settings.QUERY_PLANNER_CONCURRENCY)
+        
+        async def fetch(post: PostBase) -> Optional[PostBase]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self._fetch_post_with_comments, post.post_id)
+                except Exception as e:
+                    logger.error(f"Error processing post {post.post_id}: {e}")
+                    return None
+        
         all_posts_by_keyword = {}
         all_posts_combined = []
-        seen_ids = set()
-        
         for keyword_info in search_keywords:
             query = keyword_info['query']
-            target_count = keyword_info['posts_to_collect']
-            keyword_posts = []
-            
-            logger.info(f"Searching for '{query}' (target: {target_count})")
-            
-            # 다양한 정렬 방식으로 검색하여 목표 개수 달성
-            for sort_method in ['hot', 'relevance', 'top']:
-                if len(keyword_posts) >= target_count:
-                    break
-                    
-                try:
-                    # 기존 Reddit 서비스의 search_posts 사용
-                    posts = self.reddit_service.search_posts(query, limit=20, sort=sort_method)
-                    
-                    for post in posts:
-                        if len(keyword_posts) >= target_count:
-                            break
-                            
-                        if post.post_id not in seen_ids:
-                            seen_ids.add(post.post_id)
-                            
-                            try:
-                                submission = self.reddit_service.reddit.submission(id=post.post_id)
-                                
-                                # 점수 20 이상인 게시물만
-                                if submission.score >= 20:
-                                    # 댓글 수집 (상위 5개)
-                                    submission.comments.replace_more(limit=0)
-                                    top_comments = []
-                                    
-                                    comment_count = 0
-                                    for comment in sorted(submission.comments.list()[:20], 
-                                                        key=lambda x: x.score if hasattr(x, 'score') else 0, 
-                                                        reverse=True):
-                                        if hasattr(comment, 'body') and comment_count < 5:
-                                            top_comments.append({
-                                                "author": str(comment.author) if comment.author else "[deleted]",
-                                                "score": comment.score,
-                                                "body": comment.body,
-                                                "created_utc": comment.created_utc
-                                            })
-                                            comment_count += 1
-                                    
-                                    # PostBase 형식으로 변환 (메타데이터 포함)
-                                    post_base = PostBase(
-                                        source="reddit",
-                                        post_id=submission.id,
-                                        author=str(submission.author) if submission.author else "[deleted]",
-                                        title=submission.title,
-                                        content=self._format_post_content(submission, top_comments),
-                                        url=f"https://reddit.com{submission.permalink}",
-                                        # 메타데이터 추가
-                                        score=submission.score,
-                                        comments=submission.num_comments,
-                                        created_utc=submission.created_utc,
-                                        subreddit=submission.subreddit.display_name
-                                    )
-                                    
-                                    keyword_posts.append(post_base)
-                                    all_posts_combined.append(post_base)
-                                    
-                                    logger.debug(f"Added post: [{submission.score}] {submission.title[:50]}...")
-                                    
-                            except Exception as e:
-                                logger.error(f"Error processing post {post.post_id}: {e}")
-                                continue
-                            
-                except Exception as e:
-                    logger.error(f"Error searching with query '{query}': {e}")
-                
-                # API 제한 방지
-                await asyncio.sleep(0.5)
+            fetched = await asyncio.gather(*(fetch(post) for post in plan_result["selected"].get(query, [])))
+            keyword_posts = local_posts[query] + [post for post in fetched if post]
+            all_posts_combined.extend(keyword_posts)
+            # 수집 결과를 라우팅 인덱스에 반영 (라우팅된 검색 결과는 제외 - 같은 서브레딧만 계속 강화되지 않도록)
+            subreddit_index.record(query, [post for post in keyword_posts if post.post_id not in plan_result["routed_ids"]])
             
             # 키워드별 결과 저장
             all_posts_by_keyword[query] = {
                 "rank": keyword_info['rank'],
                 "reason": keyword_info['reason'],
-                "target_count": target_count,
+                "target_count": keyword_info['posts_to_collect'],
                 "actual_count": len(keyword_posts),
                 "posts": keyword_posts
             }
             
             logger.info(f"Collected {len(keyword_posts)} posts for '{query}'")
         
+        subreddit_index.save()
+        
+        comment_requests = len(all_posts_combined) - len(local_ids)
+        requests_made = plan_result["requests"] + comment_requests
+        logger.info(f"📉 Reddit 요청 수: {requests_made}회 (검색 {plan_result['requests']} + 댓글 {comment_requests}) | 로컬: {len(local_ids)}개")
+        
         logger.info(f"Total posts collected: {len(all_posts_combined)}")
         
         return {
@@ -234,9 +174,59 @@ JSON 형식으로 응답:
             "total_posts": len(all_posts_combined),
             "posts": all_posts_combined,
             "keywords_used": search_keywords,
-            "results_by_keyword": all_posts_by_keyword
+            "results_by_keyword": all_posts_by_keyword,
+            "query_plan": {
+                "requests": requests_made,
+                "local_posts": len(local_ids),
+                "executed": plan_result["executed"],
+                "skipped": plan_result["skipped"]
+            }
         }
     
+    def _fetch_post_with_comments(self, post_id: str) -> Optional[PostBase]:
+        """게시물과 상위 댓글 조회 (점수 20 미만이면 None)"""
+        submission = self.reddit_service.reddit.submission(id=post_id)
+        
+        # 점수 20 이상인 게시물만
+        if submission.score < 20:
+            return None
+        
+        # 댓글 수집 (상위 5개)
+        submission.comments.replace_more(limit=0)
+        top_comments = []
+        
+        comment_count = 0
+        for comment in sorted(submission.comments.list()[:20], 
+                            key=lambda x: x.score if hasattr(x, 'score') else 0, 
+                            reverse=True):
+            if hasattr(comment, 'body') and comment_count < 5:
+                top_comments.append({
+                    "id": comment.id,
+                    "author": str(comment.author) if comment.author else "[deleted]",
+                    "score": comment.score,
+                    "body": comment.body,
+                    "created_utc": comment.created_utc
+                })
+                comment_count += 1
+        
+        logger.debug(f"Added post: [{submission.score}] {submission.title[:50]}...")
+        post_archive.add_comments(submission.id, top_comments)
+        
+        # PostBase 형식으로 변환 (메타데이터 포함)
+        return PostBase(
+            source="reddit",
+            post_id=submission.id,
+            author=str(submission.author) if submission.author else "[deleted]",
+            title=submission.title,
+            content=self._format_post_content(submission, top_comments),
+            url=f"https://reddit.com{submission.permalink}",
+            # 메타데이터 추가
+            score=submission.score,
+            comments=submission.num_comments,
+            created_utc=submission.created_utc,
+            subreddit=submission.subreddit.display_name
+        )
+    
     def _format_post_content(self, submission, top_comments: List[Dict]) -> str:
         """게시물 내용 포맷팅"""
         content_parts = []
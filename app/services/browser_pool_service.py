@@ -0,0 +1,353 @@
+"""
+Playwright 브라우저 컨텍스트 풀
+Chromium 한 개를 유지하면서 스텔스 설정이 적용된 컨텍스트를 미리 만들어 두고 페이지 단위로 대여
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+from typing import List, Dict, Optional, Any
+from fake_useragent import UserAgent
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-gpu',
+    '--window-size=1920,1080',
+    '--disable-blink-features=AutomationControlled'
+]
+
+# 자동화 탐지 우회 (컨텍스트 생성 시 한 번만 등록)
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    window.chrome = {
+        runtime: {}
+    };
+
+    Object.defineProperty(navigator, 'permissions', {
+        get: () => ({
+            query: () => Promise.resolve({ state: 'granted' })
+        })
+    });
+"""
+
+STEALTH_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 페이지 반납 시 JS 힙 사용량 측정 (Chromium 전용 API)
+HEAP_USAGE_SCRIPT = "performance.memory ? performance.memory.usedJSHeapSize : 0"
+
+# 렌더 프로필 - light는 추출에 불필요한 리소스를 차단
+RENDER_PROFILE_FULL = "full"
+RENDER_PROFILE_LIGHT = "light"
+
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "texttrack", "manifest"}
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "adsrvr.org",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+)
+
+# DOM 변경(MutationObserver)이 quietMs 동안 없으면 완료, timeoutMs가 지나면 강제 종료
+DOM_SETTLE_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    let quietTimer = null;
+    let deadline = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => done(true), quietMs);
+    });
+    const done = (settled) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(settled);
+    };
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    quietTimer = setTimeout(() => done(true), quietMs);
+    deadline = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+
+async def wait_for_dom_settle(page, quiet_ms: int = None, timeout_ms: int = None) -> bool:
+    """DOM 변경이 잦아들 때까지 대기 (고정 sleep 대체) - 제한 시간 안에 안정되면 True"""
+    quiet_ms = quiet_ms or settings.BROWSER_DOM_QUIET_MS
+    timeout_ms = timeout_ms or settings.BROWSER_DOM_SETTLE_TIMEOUT_MS
+    try:
+        return await page.evaluate(DOM_SETTLE_SCRIPT, [quiet_ms, timeout_ms])
+    except Exception as e:
+        # 네비게이션 중 컨텍스트가 사라지는 경우 등
+        logger.debug(f"DOM settle wait failed: {e}")
+        return False
+
+
+def _is_blocked_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in BLOCKED_DOMAINS)
+
+
+class DomSnapshotCache:
+    """URL별 렌더링된 DOM(HTML) 캐시 - TTL 안의 반복 추출은 브라우저 렌더링 생략"""
+
+    def __init__(self, ttl_seconds: int = None, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds or settings.BROWSER_DOM_CACHE_TTL_SECONDS
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, profile: str) -> Optional[str]:
+        key = (url, profile)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.info(f"♻️ DOM 스냅샷 캐시 사용 | {url}")
+        return entry[1]
+
+    def put(self, url: str, profile: str, html: str) -> None:
+        key = (url, profile)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, html)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class BrowserPoolTimeout(Exception):
+    """대기열에서 제한 시간 안에 페이지를 받지 못함"""
+
+
+class PooledContext:
+    def __init__(self, context, user_agent: str):
+        self.context = context
+        self.user_agent = user_agent
+        self.active_pages = 0
+        self.uses = 0
+        self.peak_heap_bytes = 0
+        self.retiring = False
+        self.created_at = time.time()
+
+
+class BrowserPool:
+    def __init__(self, size: int = None, max_pages_per_context: int = None,
+                 max_uses: int = None, max_heap_mb: int = None, acquire_timeout: float = None):
+        self.size = size or settings.BROWSER_POOL_SIZE
+        self.max_pages_per_context = max_pages_per_context or settings.BROWSER_POOL_MAX_PAGES_PER_CONTEXT
+        self.max_uses = max_uses or settings.BROWSER_CONTEXT_MAX_USES
+        self.max_heap_bytes = (max_heap_mb or settings.BROWSER_CONTEXT_MAX_HEAP_MB) * 1024 * 1024
+        self.acquire_timeout = acquire_timeout or settings.BROWSER_POOL_ACQUIRE_TIMEOUT
+        self.ua = UserAgent()
+
+        self.playwright = None
+        self.browser = None
+        self._contexts: List[PooledContext] = []
+        self._start_lock = asyncio.Lock()
+        self._pick_lock = asyncio.Lock()
+        # 전체 동시 페이지 수 제한 - asyncio.Semaphore는 대기자를 FIFO 순서로 깨움
+        self._slots = asyncio.Semaphore(self.size * self.max_pages_per_context)
+        self._waiting = 0
+        self._stats = {
+            "pages_served": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "acquire_timeouts": 0,
+            "blocked_requests": 0,
+            "total_wait_seconds": 0.0
+        }
+
+    async def start(self):
+        """브라우저 시작 (이미 실행 중이면 무시)"""
+        async with self._start_lock:
+            if self.browser and self.browser.is_connected():
+                return
+            from playwright.async_api import async_playwright
+            if not self.playwright:
+                self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+            self._contexts = []
+            # 첫 요청이 컨텍스트 생성 비용을 치르지 않도록 미리 생성
+            for _ in range(self.size):
+                await self._new_context()
+            logger.info(f"🧭 브라우저 풀 시작 | 컨텍스트: {self.size}개 | 컨텍스트당 페이지: {self.max_pages_per_context}")
+
+    async def stop(self):
+        """모든 컨텍스트와 브라우저 종료 (앱 종료 시)"""
+        for pooled in self._contexts:
+            try:
+                await pooled.context.close()
+            except Exception as e:
+                logger.error(f"Error closing browser context: {e}")
+        self._contexts = []
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+            logger.info("🛑 브라우저 풀 종료")
+
+    async def _new_context(self) -> PooledContext:
+        user_agent = self.ua.random
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=user_agent,
+            java_script_enabled=True,
+            ignore_https_errors=True,
+            locale='en-US',
+            timezone_id='America/New_York',
+            extra_http_headers=STEALTH_HEADERS
+        )
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+
+        pooled = PooledContext(context, user_agent)
+        self._contexts.append(pooled)
+        self._stats["contexts_created"] += 1
+        return pooled
+
+    async def _pick_context(self) -> PooledContext:
+        """가장 한가한 컨텍스트 선택 (모두 사용 중이고 풀 크기 미만이면 새로 생성)"""
+        live = [c for c in self._contexts if not c.retiring]
+        available = [c for c in live if c.active_pages < self.max_pages_per_context]
+        if not any(c.active_pages == 0 for c in available) and len(live) < self.size:
+            return await self._new_context()
+        return min(available, key=lambda c: c.active_pages)
+
+    async def _release_context(self, pooled: PooledContext):
+        pooled.active_pages -= 1
+        if not pooled.retiring and (pooled.uses >= self.max_uses or pooled.peak_heap_bytes >= self.max_heap_bytes):
+            pooled.retiring = True
+            logger.info(f"♻️ 브라우저 컨텍스트 교체 | 사용: {pooled.uses}회 | 힙: {pooled.peak_heap_bytes // (1024 * 1024)}MB")
+        # 교체 대상은 사용 중인 페이지가 모두 반납된 뒤 닫음
+        if pooled.retiring and pooled.active_pages == 0:
+            if pooled in self._contexts:
+                self._contexts.remove(pooled)
+            self._stats["contexts_recycled"] += 1
+            try:
+                await pooled.context.close()
+            except Exception as e:
+                logger.error(f"Error closing browser context: {e}")
+
+    async def _block_nonessential(self, route):
+        """light 프로필: 이미지/폰트/미디어와 추적 스크립트 요청 차단"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+            self._stats["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def page(self, timeout: float = None, profile: str = RENDER_PROFILE_FULL):
+        """풀에서 페이지 대여 - async with 블록이 끝나면 페이지를 닫고 슬롯 반납"""
+        await self.start()
+
+        waited_from = time.monotonic()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout or self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._stats["acquire_timeouts"] += 1
+            raise BrowserPoolTimeout(f"No browser page available within {timeout or self.acquire_timeout}s")
+        finally:
+            self._waiting -= 1
+        self._stats["total_wait_seconds"] += time.monotonic() - waited_from
+
+        pooled = None
+        page = None
+        try:
+            # 동시 대여 시 컨텍스트가 풀 크기 이상 생성되지 않도록 선택 구간 직렬화
+            async with self._pick_lock:
+                pooled = await self._pick_context()
+                pooled.active_pages += 1
+                pooled.uses += 1
+            page = await pooled.context.new_page()
+            if profile == RENDER_PROFILE_LIGHT:
+                await page.route("**/*", self._block_nonessential)
+            self._stats["pages_served"] += 1
+
+            yield page
+        finally:
+            if page:
+                try:
+                    heap = await page.evaluate(HEAP_USAGE_SCRIPT)
+                    pooled.peak_heap_bytes = max(pooled.peak_heap_bytes, int(heap or 0))
+                except Exception:
+                    pass
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.error(f"Error closing pooled page: {e}")
+            if pooled:
+                await self._release_context(pooled)
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 사용 현황"""
+        served = self._stats["pages_served"]
+        return {
+            "running": bool(self.browser),
+            "size": self.size,
+            "max_pages_per_context": self.max_pages_per_context,
+            "waiting": self._waiting,
+            "contexts": [
+                {
+                    "active_pages": c.active_pages,
+                    "uses": c.uses,
+                    "peak_heap_mb": round(c.peak_heap_bytes / (1024 * 1024), 1),
+                    "retiring": c.retiring
+                }
+                for c in self._contexts
+            ],
+            **self._stats,
+            "avg_wait_seconds": round(self._stats["total_wait_seconds"] / served, 4) if served else 0.0
+        }
+
+
+# 전역 브라우저 풀
+browser_pool = BrowserPool()
+
+# 전역 DOM 스냅샷 캐시
+dom_snapshot_cache = DomSnapshotCache()
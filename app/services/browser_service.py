@@ -4,285 +4,306 @@ JavaScript 렌더링이 필요한 사이트 크롤링
 """
 import asyncio
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import Page
 import logging
-from fake_useragent import UserAgent
 import random
 import json
+import time
 from datetime import datetime
+from bs4 import BeautifulSoup
+from app.core.config import settings
+from app.services.browser_pool_service import browser_pool, dom_snapshot_cache, wait_for_dom_settle, RENDER_PROFILE_LIGHT
+from app.services.clearance_service import clearance_store, CHALLENGE_TITLES
 
 logger = logging.getLogger(__name__)
 
+# 아이템 필드 스펙: selector(없으면 아이템 자신), attr('text'면 textContent), all(여러 개 수집), limit
+DEFAULT_ITEM_FIELDS = {
+    "text": {"attr": "text"},
+    "links": {"selector": "a", "attr": "href", "all": True, "limit": 3},
+    "images": {"selector": "img", "attr": "src", "all": True, "limit": 2},
+    "timestamp": {"selector": "time, [datetime]", "attr": "datetime"},
+}
+
+# 아이템 목록을 한 번의 page.evaluate로 추출 (요소별 IPC 왕복 제거)
+BATCH_EXTRACT_SCRIPT = """
+({itemSelector, fields, start, limit}) => {
+    const read = (el, attr) => attr === 'text' ? (el.textContent || '').trim() : el.getAttribute(attr);
+    const nodes = document.querySelectorAll(itemSelector);
+    const end = limit ? Math.min(nodes.length, start + limit) : nodes.length;
+    const items = [];
+    for (let i = start; i < end; i++) {
+        const node = nodes[i];
+        const item = {};
+        for (const [name, spec] of Object.entries(fields)) {
+            const attr = spec.attr || 'text';
+            if (spec.all) {
+                let elements = spec.selector ? Array.from(node.querySelectorAll(spec.selector)) : [node];
+                if (spec.limit) elements = elements.slice(0, spec.limit);
+                const values = elements.map(el => read(el, attr)).filter(v => v);
+                if (values.length) item[name] = values;
+            } else {
+                const el = spec.selector ? node.querySelector(spec.selector) : node;
+                const value = el ? read(el, attr) : null;
+                if (value) item[name] = value;
+            }
+        }
+        items.push(item);
+    }
+    return {total: nodes.length, items: items};
+}
+"""
+
+# 셀렉터별 텍스트 목록을 한 번에 추출
+BATCH_TEXT_SCRIPT = """
+(selectors) => {
+    const data = {};
+    for (const [key, selector] of Object.entries(selectors)) {
+        try {
+            data[key] = Array.from(document.querySelectorAll(selector))
+                .map(el => (el.textContent || '').trim())
+                .filter(text => text);
+        } catch (e) {
+            data[key] = [];
+        }
+    }
+    return data;
+}
+"""
+
 class BrowserService:
+    """동적 크롤링 기능 - 브라우저/컨텍스트는 전역 browser_pool에서 대여"""
+    
     def __init__(self):
-        self.browser: Optional[Browser] = None
-        self.playwright = None
-        self.ua = UserAgent()
+        self.pool = browser_pool
         
     async def start(self):
-        """브라우저 시작"""
-        if not self.playwright:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-gpu',
-                    '--window-size=1920,1080',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
-            logger.info("Headless browser started")
+        """브라우저 풀 시작 (이미 실행 중이면 무시)"""
+        await self.pool.start()
     
     async def stop(self):
-        """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
-        logger.info("Headless browser stopped")
-    
-    async def create_stealth_page(self) -> Page:
-        """탐지 방지 설정이 적용된 페이지 생성"""
-        if not self.browser:
-            await self.start()
-        
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent=self.ua.random,
-            java_script_enabled=True,
-            ignore_https_errors=True,
-            locale='en-US',
-            timezone_id='America/New_York'
-        )
-        
-        # 자동화 탐지 우회
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            window.chrome = {
-                runtime: {}
-            };
-            
-            Object.defineProperty(navigator, 'permissions', {
-                get: () => ({
-                    query: () => Promise.resolve({ state: 'granted' })
-                })
-            });
-        """)
-        
-        page = await context.new_page()
-        
-        # 추가 헤더 설정
-        await page.set_extra_http_headers({
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
-        
-        return page
+        """공유 풀은 앱 종료 시 정리되므로 요청 단위로는 종료하지 않음"""
+        pass
     
     async def scroll_and_wait(self, page: Page, max_scrolls: int = 5):
-        """페이지 스크롤하며 동적 콘텐츠 로드"""
+        """페이지 스크롤하며 동적 콘텐츠 로드 (고정 대기 대신 DOM 변경이 멈출 때까지 대기)"""
+        previous_height = await page.evaluate('document.body.scrollHeight')
         for i in range(max_scrolls):
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(random.uniform(1, 2))
+            await wait_for_dom_settle(page)
             
             # 새로운 콘텐츠가 로드되었는지 확인
             new_height = await page.evaluate('document.body.scrollHeight')
-            if i > 0 and new_height == await page.evaluate('document.body.scrollHeight'):
+            if new_height == previous_height:
                 break
+            previous_height = new_height
     
-    async def extract_dynamic_content(self, url: str, selectors: Dict[str, str]) -> Dict:
-        """동적 콘텐츠 추출"""
-        page = await self.create_stealth_page()
-        
-        try:
-            # 페이지 로드
+    async def _load(self, page: Page, url: str, profile: str):
+        """프로필에 맞춰 페이지 로드 (light: DOM 준비 후 변경이 잦아들 때까지만 대기)"""
+        started = time.monotonic()
+        if profile == RENDER_PROFILE_LIGHT:
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await wait_for_dom_settle(page)
+        else:
             await page.goto(url, wait_until='networkidle', timeout=30000)
             await asyncio.sleep(random.uniform(2, 4))
-            
-            # 스크롤하여 모든 콘텐츠 로드
-            await self.scroll_and_wait(page)
-            
-            # 셀렉터를 사용하여 데이터 추출
-            data = {}
-            for key, selector in selectors.items():
-                try:
-                    elements = await page.query_selector_all(selector)
-                    data[key] = []
-                    for element in elements:
-                        text = await element.text_content()
-                        if text:
-                            data[key].append(text.strip())
-                except Exception as e:
-                    logger.error(f"Error extracting {key}: {e}")
-                    data[key] = []
-            
-            # 스크린샷 (디버깅용)
-            # await page.screenshot(path=f'debug_{datetime.now().timestamp()}.png')
-            
-            return data
+        logger.info(f"⏱️ 페이지 로드 {time.monotonic() - started:.2f}초 | 프로필: {profile} | {url}")
+    
+    async def extract_dynamic_content(self, url: str, selectors: Dict[str, str], profile: str = None) -> Dict:
+        """동적 콘텐츠 추출 (같은 URL은 TTL 동안 캐시된 DOM에서 추출)"""
+        profile = profile or settings.BROWSER_RENDER_PROFILE
+        
+        cached_html = dom_snapshot_cache.get(url, profile)
+        if cached_html is not None:
+            return self._extract_from_html(cached_html, selectors)
+        
+        try:
+            async with self.pool.page(profile=profile) as page:
+                # 페이지 로드
+                await self._load(page, url, profile)
+                
+                # 스크롤하여 모든 콘텐츠 로드
+                await self.scroll_and_wait(page)
+                
+                # 렌더링된 DOM 저장 (반복 추출 시 렌더링 생략)
+                dom_snapshot_cache.put(url, profile, await page.content())
+                
+                # 셀렉터를 사용하여 데이터 추출 (한 번의 evaluate)
+                data = await self.extract_texts(page, selectors)
+                
+                # 스크린샷 (디버깅용)
+                # await page.screenshot(path=f'debug_{datetime.now().timestamp()}.png')
+                
+                return data
             
         except Exception as e:
             logger.error(f"Error extracting dynamic content from {url}: {e}")
             return {}
-        finally:
-            await page.close()
     
-    async def handle_infinite_scroll(self, url: str, item_selector: str, max_items: int = 50) -> List[Dict]:
+    def _extract_from_html(self, html: str, selectors: Dict[str, str]) -> Dict:
+        """캐시된 DOM 스냅샷에서 셀렉터별 텍스트 추출 (브라우저 없이)"""
+        soup = BeautifulSoup(html, 'lxml')
+        data = {}
+        for key, selector in selectors.items():
+            try:
+                data[key] = [
+                    element.get_text().strip()
+                    for element in soup.select(selector)
+                    if element.get_text().strip()
+                ]
+            except Exception as e:
+                logger.error(f"Error extracting {key}: {e}")
+                data[key] = []
+        return data
+    
+    async def handle_infinite_scroll(self, url: str, item_selector: str, max_items: int = 50, profile: str = None) -> List[Dict]:
         """무한 스크롤 페이지 처리"""
-        page = await self.create_stealth_page()
+        profile = profile or settings.BROWSER_RENDER_PROFILE
         items = []
         
+        cache_key = f"{url}#scroll:{max_items}"
+        cached_html = dom_snapshot_cache.get(cache_key, profile)
+        if cached_html is not None:
+            return self._extract_items_from_html(cached_html, item_selector, max_items)
+        
         try:
-            await page.goto(url, wait_until='networkidle')
-            await asyncio.sleep(2)
-            
-            previous_count = 0
-            scroll_attempts = 0
-            max_scroll_attempts = 20
-            
-            while len(items) < max_items and scroll_attempts < max_scroll_attempts:
-                # 현재 아이템들 수집
-                elements = await page.query_selector_all(item_selector)
+            async with self.pool.page(profile=profile) as page:
+                await self._load(page, url, profile)
                 
-                for element in elements[previous_count:]:
-                    try:
-                        # 각 아이템에서 필요한 정보 추출
-                        item_data = await self._extract_item_data(element)
-                        if item_data:
-                            items.append(item_data)
-                    except Exception as e:
-                        logger.error(f"Error extracting item: {e}")
+                previous_count = 0
+                scroll_attempts = 0
+                max_scroll_attempts = 20
                 
-                previous_count = len(elements)
+                while len(items) < max_items and scroll_attempts < max_scroll_attempts:
+                    # 새로 나타난 아이템들만 한 번에 수집
+                    remaining = max_items - len(items)
+                    batch = await self.extract_items(page, item_selector, start=previous_count, limit=remaining)
+                    items.extend(batch["items"])
+                    previous_count = min(batch["total"], previous_count + remaining)
+                    
+                    if len(items) >= max_items:
+                        break
+                    
+                    # 스크롤 후 새 아이템이 붙거나 DOM 변경이 멈출 때까지 대기
+                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                    await wait_for_dom_settle(page)
+                    
+                    new_count = await page.evaluate('(selector) => document.querySelectorAll(selector).length', item_selector)
+                    if new_count <= previous_count:
+                        scroll_attempts += 1
                 
-                # 스크롤
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                await asyncio.sleep(random.uniform(1, 3))
-                
-                # 로딩 대기
-                try:
-                    await page.wait_for_selector(f'{item_selector}:nth-child({previous_count + 1})', timeout=5000)
-                except:
-                    scroll_attempts += 1
-                
-                if len(items) >= max_items:
-                    break
-            
-            return items[:max_items]
+                dom_snapshot_cache.put(cache_key, profile, await page.content())
+                return items[:max_items]
             
         except Exception as e:
             logger.error(f"Error handling infinite scroll: {e}")
             return items
-        finally:
-            await page.close()
     
-    async def _extract_item_data(self, element) -> Optional[Dict]:
-        """개별 아이템에서 데이터 추출"""
-        try:
-            data = {}
-            
-            # 텍스트 콘텐츠
-            text = await element.text_content()
-            if text:
-                data['text'] = text.strip()
-            
-            # 링크 추출
-            links = await element.query_selector_all('a')
-            if links:
-                data['links'] = []
-                for link in links[:3]:  # 최대 3개 링크
-                    href = await link.get_attribute('href')
-                    if href:
-                        data['links'].append(href)
-            
-            # 이미지 추출
-            images = await element.query_selector_all('img')
-            if images:
-                data['images'] = []
-                for img in images[:2]:  # 최대 2개 이미지
-                    src = await img.get_attribute('src')
-                    if src:
-                        data['images'].append(src)
-            
-            # 시간 정보 추출 (time, datetime 태그)
-            time_element = await element.query_selector('time, [datetime]')
-            if time_element:
-                datetime_attr = await time_element.get_attribute('datetime')
-                if datetime_attr:
-                    data['timestamp'] = datetime_attr
-            
-            return data if data else None
-            
-        except Exception as e:
-            logger.error(f"Error extracting item data: {e}")
-            return None
+    def _extract_items_from_html(self, html: str, item_selector: str, max_items: int,
+                                 fields: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """캐시된 DOM 스냅샷에서 아이템 추출 (extract_items와 같은 필드 스펙)"""
+        fields = fields or DEFAULT_ITEM_FIELDS
+        soup = BeautifulSoup(html, 'lxml')
+        
+        def read(element, attr):
+            return element.get_text().strip() if attr == 'text' else element.get(attr)
+        
+        items = []
+        for node in soup.select(item_selector)[:max_items]:
+            item = {}
+            for name, spec in fields.items():
+                attr = spec.get('attr', 'text')
+                if spec.get('all'):
+                    elements = node.select(spec['selector']) if spec.get('selector') else [node]
+                    if spec.get('limit'):
+                        elements = elements[:spec['limit']]
+                    values = [value for value in (read(el, attr) for el in elements) if value]
+                    if values:
+                        item[name] = values
+                else:
+                    element = node.select_one(spec['selector']) if spec.get('selector') else node
+                    value = read(element, attr) if element else None
+                    if value:
+                        item[name] = value
+            if item:
+                items.append(item)
+        return items
+    
+    async def extract_items(self, page: Page, item_selector: str, fields: Optional[Dict[str, Dict]] = None,
+                            start: int = 0, limit: Optional[int] = None) -> Dict:
+        """아이템 셀렉터에 해당하는 요소들의 필드를 한 번의 page.evaluate로 추출 - {total, items}"""
+        result = await page.evaluate(BATCH_EXTRACT_SCRIPT, {
+            "itemSelector": item_selector,
+            "fields": fields or DEFAULT_ITEM_FIELDS,
+            "start": start,
+            "limit": limit
+        })
+        # 필드가 하나도 없는 아이템 제외
+        result["items"] = [item for item in result["items"] if item]
+        return result
+    
+    async def extract_texts(self, page: Page, selectors: Dict[str, str]) -> Dict[str, List[str]]:
+        """셀렉터별 텍스트 목록을 한 번의 page.evaluate로 추출"""
+        return await page.evaluate(BATCH_TEXT_SCRIPT, selectors)
     
     async def bypass_cloudflare(self, url: str) -> Optional[str]:
-        """Cloudflare 보호 우회"""
-        page = await self.create_stealth_page()
+        """Cloudflare 보호 우회 (도메인 클리어런스가 유효하면 브라우저 없이 HTTP로 요청)"""
+        content = await clearance_store.fetch(url)
+        if content is not None:
+            logger.info(f"🍪 클리어런스 재사용 - 브라우저 생략 | {url}")
+            return content
         
         try:
-            await page.goto(url)
-            
-            # Cloudflare 챌린지 대기
-            for _ in range(30):  # 최대 30초 대기
-                await asyncio.sleep(1)
+            async with self.pool.page() as page:
+                await page.goto(url)
                 
-                # 타이틀 확인
-                title = await page.title()
-                if "Just a moment" not in title and "Checking your browser" not in title:
-                    break
+                # Cloudflare 챌린지 대기
+                passed = False
+                challenged = False
+                for _ in range(30):  # 최대 30초 대기
+                    await asyncio.sleep(1)
+                    
+                    # 타이틀 확인
+                    title = await page.title()
+                    if not any(marker in title for marker in CHALLENGE_TITLES):
+                        passed = True
+                        break
+                    challenged = True
+                    
+                    # Cloudflare 체크박스 클릭 시도
+                    try:
+                        checkbox = await page.query_selector('input[type="checkbox"]')
+                        if checkbox:
+                            await checkbox.click()
+                    except:
+                        pass
                 
-                # Cloudflare 체크박스 클릭 시도
-                try:
-                    checkbox = await page.query_selector('input[type="checkbox"]')
-                    if checkbox:
-                        await checkbox.click()
-                except:
-                    pass
-            
-            # 페이지 콘텐츠 반환
-            content = await page.content()
-            return content
+                # 챌린지를 실제로 통과했으면 쿠키와 User-Agent를 저장해 이후 같은 도메인 요청은 HTTP로 처리
+                # (챌린지가 없던 도메인은 렌더링된 DOM이 필요할 수 있으므로 저장하지 않음)
+                if passed:
+                    cookies = await page.context.cookies(url)
+                    if challenged or any(cookie.get('name') == 'cf_clearance' for cookie in cookies):
+                        clearance_store.save(url, cookies, await page.evaluate('navigator.userAgent'))
+                
+                # 페이지 콘텐츠 반환
+                content = await page.content()
+                return content
             
         except Exception as e:
             logger.error(f"Error bypassing Cloudflare: {e}")
             return None
-        finally:
-            await page.close()
     
     async def execute_custom_script(self, url: str, script: str) -> any:
         """커스텀 JavaScript 실행"""
-        page = await self.create_stealth_page()
-        
         try:
-            await page.goto(url, wait_until='networkidle')
-            await asyncio.sleep(2)
-            
-            # 커스텀 스크립트 실행
-            result = await page.evaluate(script)
-            return result
+            async with self.pool.page() as page:
+                await page.goto(url, wait_until='networkidle')
+                await asyncio.sleep(2)
+                
+                # 커스텀 스크립트 실행
+                result = await page.evaluate(script)
+                return result
             
         except Exception as e:
             logger.error(f"Error executing custom script: {e}")
-            return None
-        finally:
-            await page.close()
\ No newline at end of file
+            return None
\ No newline at end of file
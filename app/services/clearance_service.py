@@ -0,0 +1,120 @@
+"""
+Cloudflare 클리어런스 저장소
+브라우저로 챌린지를 통과한 뒤 도메인별 쿠키/User-Agent를 보관하고, 만료 전까지는 공유 httpx 클라이언트로 바로 요청
+"""
+import logging
+import time
+from typing import List, Dict, Optional, Any
+from urllib.parse import urlsplit
+from app.core.config import settings
+from app.services.http_client_service import http_client_registry
+
+logger = logging.getLogger(__name__)
+
+CHALLENGE_TITLES = ["Just a moment", "Checking your browser", "Attention Required"]
+CHALLENGE_MARKERS = ["cf-chl-", "challenge-platform", "cf_chl_opt"]
+
+
+def is_challenge_response(status_code: int, headers: Dict[str, str], text: str) -> bool:
+    """Cloudflare 챌린지 페이지 여부"""
+    if headers.get("cf-mitigated") == "challenge":
+        return True
+    if status_code in (403, 429, 503):
+        head = text[:5000]
+        return any(marker in head for marker in CHALLENGE_MARKERS + CHALLENGE_TITLES)
+    return False
+
+
+class ClearanceStore:
+    def __init__(self, ttl_seconds: int = None):
+        self.ttl_seconds = ttl_seconds or settings.CLOUDFLARE_CLEARANCE_TTL_SECONDS
+        # 도메인 → {cookies, user_agent, expires_at, hits}
+        self._clearances: Dict[str, Dict[str, Any]] = {}
+        self._stats = {
+            "http_hits": 0,
+            "browser_fallbacks": 0,
+            "rejected": 0
+        }
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlsplit(url).hostname or url
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """유효한 클리어런스 조회 (만료되었으면 삭제)"""
+        domain = self._domain(url)
+        clearance = self._clearances.get(domain)
+        if clearance and clearance["expires_at"] <= time.time():
+            del self._clearances[domain]
+            return None
+        return clearance
+
+    def save(self, url: str, cookies: List[Dict[str, Any]], user_agent: str) -> None:
+        """브라우저 통과 후 쿠키와 User-Agent 저장 (cf_clearance 만료 시각과 TTL 중 빠른 쪽까지 유효)"""
+        domain = self._domain(url)
+        expires_at = time.time() + self.ttl_seconds
+        for cookie in cookies:
+            if cookie.get("name") == "cf_clearance" and cookie.get("expires", -1) > 0:
+                expires_at = min(expires_at, cookie["expires"])
+
+        self._clearances[domain] = {
+            "cookies": {cookie["name"]: cookie["value"] for cookie in cookies},
+            "user_agent": user_agent,
+            "expires_at": expires_at,
+            "hits": 0
+        }
+        logger.info(f"🍪 클리어런스 저장 | 도메인: {domain} | 쿠키: {len(cookies)}개 | 만료까지: {int(expires_at - time.time())}초")
+
+    def invalidate(self, url: str) -> None:
+        self._clearances.pop(self._domain(url), None)
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """저장된 클리어런스로 HTTP 요청 - 없거나 챌린지가 다시 나오면 None (브라우저 폴백 필요)"""
+        clearance = self.get(url)
+        if not clearance:
+            self._stats["browser_fallbacks"] += 1
+            return None
+
+        client = http_client_registry.get_client(url)
+        try:
+            response = await client.get(
+                url,
+                headers={
+                    "User-Agent": clearance["user_agent"],
+                    "Cookie": "; ".join(f"{name}={value}" for name, value in clearance["cookies"].items()),
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9"
+                },
+                follow_redirects=True
+            )
+        except Exception as e:
+            logger.warning(f"Clearance fetch failed for {url}: {e}")
+            self._stats["browser_fallbacks"] += 1
+            return None
+
+        if is_challenge_response(response.status_code, response.headers, response.text):
+            # 클리어런스가 거부됨 (IP/지문 변경 등) - 다음 요청은 브라우저로
+            logger.info(f"🚧 클리어런스 거부 | 도메인: {self._domain(url)} | 상태: {response.status_code}")
+            self.invalidate(url)
+            self._stats["rejected"] += 1
+            self._stats["browser_fallbacks"] += 1
+            return None
+
+        clearance["hits"] += 1
+        self._stats["http_hits"] += 1
+        return response.text
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            **self._stats,
+            "domains": {
+                domain: {"hits": c["hits"], "expires_in": int(c["expires_at"] - now)}
+                for domain, c in self._clearances.items()
+                if c["expires_at"] > now
+            }
+        }
+
+
+# 전역 클리어런스 저장소
+clearance_store = ClearanceStore()
@@ -0,0 +1,215 @@
+"""
+소스 수집기 서비스
+소스별 수집을 같은 비동기 인터페이스로 감싸고, 토큰 버킷/동시 실행 제한을 건 뒤 공통 마감 시간 안에 동시에 실행
+"""
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.progress_service import progress_service
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기 - 대기한 시간(초) 반환"""
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited = delay
+                self._refill()
+            self.tokens -= 1
+        return waited
+
+
+class SourceCollector(ABC):
+    """수집기 공통 인터페이스 - 하위 클래스는 name과 collect를 구현"""
+    name: str = ""
+    rate_per_second: float = 1.0
+    burst: int = 2
+    max_concurrency: int = 2
+
+    def __init__(self):
+        self.bucket = TokenBucket(self.rate_per_second, self.burst)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @abstractmethod
+    async def collect(self, query: str, session_id: Optional[str] = None) -> List[PostBase]: ...
+
+    async def run(self, query: str, session_id: Optional[str] = None) -> List[PostBase]:
+        """속도/동시 실행 제한을 지키며 수집"""
+        async with self.semaphore:
+            waited = await self.bucket.acquire()
+            if waited:
+                logger.info(f"⏳ {self.name} 속도 제한 대기 {waited:.2f}초")
+            return await self.collect(query, session_id)
+
+
+class RedditCollector(SourceCollector):
+    """가중치 기반 고급 검색 (실패 시 praw 기본 검색을 스레드에서 실행)"""
+    name = "reddit"
+    rate_per_second = 0.5
+    burst = 2
+    max_concurrency = 2
+
+    def __init__(self, reddit_service):
+        super().__init__()
+        self.reddit_service = reddit_service
+
+    async def collect(self, query: str, session_id: Optional[str] = None) -> List[PostBase]:
+        if session_id:
+            await progress_service.update_progress(
+                session_id,
+                "keyword_expansion",
+                20,
+                "🤖 AI가 키워드를 확장하고 있습니다...",
+                f"'{query}'를 분석하여 최적의 검색 키워드를 생성 중"
+            )
+
+        logger.info("Using advanced weighted search system for Reddit")
+        try:
+            # GPT-4로 키워드 확장
+            from app.services.advanced_search_service import AdvancedSearchService
+            advanced_search = AdvancedSearchService()
+
+            if session_id:
+                await progress_service.update_progress(
+                    session_id,
+                    "reddit_search",
+                    40,
+                    "🔍 Reddit에서 게시물을 수집하고 있습니다...",
+                    "가중치 기반 검색으로 고품질 게시물을 선별 중"
+                )
+
+            # 가중치 기반 검색 실행
+            search_result = await advanced_search.weighted_search(query, session_id)
+            posts = search_result.get('posts', [])
+            logger.info(f"Advanced search completed. Total posts: {len(posts)}")
+            return posts
+
+        except Exception as e:
+            logger.error(f"Advanced search failed, falling back to basic search: {e}")
+            # 기본 검색으로 폴백 (praw는 동기 클라이언트)
+            return await asyncio.to_thread(self.reddit_service.search_posts, query)
+
+
+class ThreadsCollector(SourceCollector):
+    name = "threads"
+    rate_per_second = 1.0
+    burst = 2
+    max_concurrency = 2
+
+    def __init__(self, threads_service):
+        super().__init__()
+        self.threads_service = threads_service
+
+    async def collect(self, query: str, session_id: Optional[str] = None) -> List[PostBase]:
+        return await self.threads_service.search_posts(query)
+
+
+class HackerNewsCollector(SourceCollector):
+    """Algolia 페이지 스트리밍 수집"""
+    name = "hackernews"
+    rate_per_second = 2.0
+    burst = 4
+    max_concurrency = 4
+
+    def __init__(self, hackernews_service):
+        super().__init__()
+        self.hackernews_service = hackernews_service
+
+    async def collect(self, query: str, session_id: Optional[str] = None) -> List[PostBase]:
+        return await self.hackernews_service.collect_posts(
+            query,
+            window_hours=settings.HN_SEARCH_WINDOW_HOURS
+        )
+
+
+class CollectorRegistry:
+    def __init__(self):
+        self._collectors: Dict[str, SourceCollector] = {}
+
+    def register(self, collector: SourceCollector) -> None:
+        self._collectors[collector.name] = collector
+
+    def get(self, name: str) -> Optional[SourceCollector]:
+        return self._collectors.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._collectors.keys())
+
+    async def fan_out(self, sources: List[str], query: str, session_id: Optional[str] = None,
+                      deadline: float = None) -> Dict[str, Dict[str, Any]]:
+        """
+        요청된 소스를 동시에 실행하고 공통 마감 시간이 지나면 남은 수집은 취소
+        반환: {source: {"posts", "elapsed", "error", "timed_out"}} (요청 순서 유지)
+        """
+        deadline = deadline or settings.COLLECTOR_DEADLINE_SECONDS
+        started = time.monotonic()
+        results: Dict[str, Dict[str, Any]] = {}
+        tasks: Dict[asyncio.Task, str] = {}
+
+        async def timed_run(name: str, collector: SourceCollector) -> List[PostBase]:
+            try:
+                return await collector.run(query, session_id)
+            finally:
+                results[name]["elapsed"] = round(time.monotonic() - started, 2)
+
+        for name in sources:
+            if name in results:
+                continue
+            collector = self._collectors.get(name)
+            if not collector:
+                logger.warning(f"등록되지 않은 소스 무시: {name}")
+                continue
+            results[name] = {"posts": [], "elapsed": None, "error": None, "timed_out": False}
+            tasks[asyncio.create_task(timed_run(name, collector))] = name
+
+        if not tasks:
+            return results
+
+        logger.info(f"🚀 소스 동시 수집 시작 | 소스: {list(results.keys())} | 마감: {deadline}초")
+        done, pending = await asyncio.wait(tasks.keys(), timeout=deadline)
+
+        for task in pending:
+            task.cancel()
+            results[tasks[task]]["timed_out"] = True
+            logger.warning(f"⏰ {tasks[task]} 수집이 마감 시간({deadline}초)을 넘겨 취소됨")
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            name = tasks[task]
+            try:
+                results[name]["posts"] = task.result() or []
+                logger.info(f"   {name}: {len(results[name]['posts'])}개 ({results[name]['elapsed']}초)")
+            except Exception as e:
+                results[name]["error"] = str(e)
+                logger.error(f"Search error in {name}: {e}")
+
+        return results
+
+
+# 전역 수집기 레지스트리
+collector_registry = CollectorRegistry()
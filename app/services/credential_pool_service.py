@@ -0,0 +1,168 @@
+"""
+자격 증명 풀 서비스
+Reddit/OpenAI 키를 여러 개 등록해 가장 오래전에 제한된(또는 한 번도 제한되지 않은) 키부터 사용하고,
+429를 받은 키는 개별적으로 백오프
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PooledCredential:
+    def __init__(self, credential_id: str, values: Dict[str, str], label: Optional[str] = None):
+        self.id = credential_id
+        self.values = values
+        # 로그/통계 표시용 (비밀 값은 마스킹)
+        self.label = label or credential_id
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.limited_until = 0.0
+        self.last_limited_at = 0.0
+
+    def available(self, now: float) -> bool:
+        return self.limited_until <= now
+
+
+class CredentialPool:
+    def __init__(self, name: str, credentials: List[PooledCredential],
+                 base_backoff: float = None, max_backoff: float = None):
+        self.name = name
+        self.credentials = credentials
+        self.base_backoff = base_backoff or settings.CREDENTIAL_BACKOFF_BASE_SECONDS
+        self.max_backoff = max_backoff or settings.CREDENTIAL_BACKOFF_MAX_SECONDS
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def get(self, credential_id: str) -> Optional[PooledCredential]:
+        for credential in self.credentials:
+            if credential.id == credential_id:
+                return credential
+        return None
+
+    def select(self) -> Optional[PooledCredential]:
+        """
+        사용할 키 선택 - 백오프 중이 아닌 키 중 가장 오래전에 제한된 키 (같으면 진행 중/누적 요청이 적은 키)
+        모두 백오프 중이면 가장 먼저 풀리는 키
+        """
+        with self._lock:
+            if not self.credentials:
+                return None
+            now = time.time()
+            healthy = [c for c in self.credentials if c.available(now)]
+            if healthy:
+                return min(healthy, key=lambda c: (c.last_limited_at, c.in_flight, c.requests))
+            return min(self.credentials, key=lambda c: c.limited_until)
+
+    def begin(self, credential: PooledCredential) -> None:
+        """요청 시작 기록 (release로 종료)"""
+        with self._lock:
+            credential.in_flight += 1
+            credential.requests += 1
+
+    def acquire(self) -> Optional[PooledCredential]:
+        """키 선택과 요청 시작 기록을 함께"""
+        credential = self.select()
+        if credential:
+            self.begin(credential)
+        return credential
+
+    def release(self, credential: PooledCredential) -> None:
+        with self._lock:
+            credential.in_flight = max(0, credential.in_flight - 1)
+
+    def report_success(self, credential: PooledCredential) -> None:
+        with self._lock:
+            credential.consecutive_failures = 0
+
+    def report_rate_limited(self, credential: PooledCredential, retry_after: Optional[float] = None) -> None:
+        """429 - 해당 키만 백오프 (Retry-After/리셋 시간이 있으면 그만큼, 없으면 지수 증가)"""
+        with self._lock:
+            now = time.time()
+            credential.rate_limited += 1
+            credential.consecutive_failures += 1
+            credential.last_limited_at = now
+            backoff = retry_after if retry_after else self.base_backoff * (2 ** (credential.consecutive_failures - 1))
+            credential.limited_until = now + min(backoff, self.max_backoff)
+        logger.warning(f"🚫 {self.name} 키 제한 | {credential.label} | {int(credential.limited_until - now)}초 백오프")
+
+    def report_error(self, credential: PooledCredential) -> None:
+        """연결/인증 오류 - 연속 3회 이상이면 잠시 제외"""
+        with self._lock:
+            credential.errors += 1
+            credential.consecutive_failures += 1
+            if credential.consecutive_failures >= 3:
+                credential.limited_until = time.time() + self.base_backoff * credential.consecutive_failures
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.time()
+            total_requests = sum(c.requests for c in self.credentials)
+            return {
+                "size": len(self.credentials),
+                "available": sum(1 for c in self.credentials if c.available(now)),
+                "credentials": [
+                    {
+                        "id": c.id,
+                        "label": c.label,
+                        "requests": c.requests,
+                        "share": round(c.requests / total_requests, 3) if total_requests else 0.0,
+                        "in_flight": c.in_flight,
+                        "rate_limited": c.rate_limited,
+                        "errors": c.errors,
+                        "backoff_remaining": round(max(0.0, c.limited_until - now), 1)
+                    }
+                    for c in self.credentials
+                ]
+            }
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _mask(secret: str) -> str:
+    return f"{secret[:4]}…{secret[-4:]}" if len(secret) > 8 else "…"
+
+
+def _fingerprint(secret: str) -> str:
+    """비밀 값을 드러내지 않으면서 키마다 다른 안정적인 ID"""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:12]
+
+
+def build_reddit_pool() -> CredentialPool:
+    """REDDIT_CREDENTIALS("id:secret,id:secret")와 단일 REDDIT_CLIENT_ID/SECRET으로 풀 구성"""
+    pairs = []
+    if settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET:
+        pairs.append((settings.REDDIT_CLIENT_ID, settings.REDDIT_CLIENT_SECRET))
+    for item in _split(settings.REDDIT_CREDENTIALS):
+        client_id, _, client_secret = item.partition(":")
+        if client_id and client_secret and (client_id, client_secret) not in pairs:
+            pairs.append((client_id, client_secret))
+    return CredentialPool("reddit", [
+        PooledCredential(client_id, {"client_id": client_id, "client_secret": client_secret})
+        for client_id, client_secret in pairs
+    ])
+
+
+def build_openai_pool() -> CredentialPool:
+    """OPENAI_API_KEYS(쉼표 구분)와 단일 OPENAI_API_KEY로 풀 구성"""
+    keys = []
+    for key in ([settings.OPENAI_API_KEY] if settings.OPENAI_API_KEY else []) + _split(settings.OPENAI_API_KEYS):
+        if key not in keys:
+            keys.append(key)
+    return CredentialPool("openai", [PooledCredential(_fingerprint(key), {"api_key": key}, label=_mask(key)) for key in keys])
+
+
+# 전역 자격 증명 풀
+reddit_credential_pool = build_reddit_pool()
+openai_credential_pool = build_openai_pool()
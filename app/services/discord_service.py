@@ -5,7 +5,7 @@ Discord 서버 메시지 수집 서비스
 from typing import List, Dict, Optional
 from app.schemas.schemas import PostBase
 import logging
-import httpx
+from app.services.http_client_service import http_client_registry
 import asyncio
 from datetime import datetime
 import json
@@ -59,24 +59,24 @@ class DiscordService:
         
         try:
             # Disboard (Discord 서버 목록 사이트) 검색
-            async with httpx.AsyncClient() as client:
-                search_url = f"https://disboard.org/servers/search/{query}"
-                response = await client.get(search_url, headers=self.headers)
-                
-                if response.status_code == 200:
-                    # 간단한 파싱 (실제로는 BeautifulSoup 사용 권장)
-                    content = response.text
-                    if query.lower() in content.lower():
-                        post = PostBase(
-                            source="discord/disboard",
-                            post_id=None,
-                            author="Discord Server Directory",
-                            title=f"Discord servers related to: {query}",
-                            content=f"Found Discord servers matching '{query}' on Disboard. Visit {search_url} for more details.",
-                            url=search_url
-                        )
-                        posts.append(post)
-                        
+            client = http_client_registry.get_client("https://disboard.org")
+            search_url = f"https://disboard.org/servers/search/{query}"
+            response = await client.get(search_url, headers=self.headers)
+            
+            if response.status_code == 200:
+                # 간단한 파싱 (실제로는 BeautifulSoup 사용 권장)
+                content = response.text
+                if query.lower() in content.lower():
+                    post = PostBase(
+                        source="discord/disboard",
+                        post_id=None,
+                        author="Discord Server Directory",
+                        title=f"Discord servers related to: {query}",
+                        content=f"Found Discord servers matching '{query}' on Disboard. Visit {search_url} for more details.",
+                        url=search_url
+                    )
+                    posts.append(post)
+                    
         except Exception as e:
             logger.error(f"Error searching public servers: {e}")
         
@@ -85,32 +85,32 @@ class DiscordService:
     async def _get_discord_status(self) -> Optional[PostBase]:
         """Discord 상태 정보 가져오기"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("https://discordstatus.com/api/v2/summary.json")
+            client = http_client_registry.get_client("https://discordstatus.com")
+            response = await client.get("https://discordstatus.com/api/v2/summary.json")
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                status = data.get('status', {})
+                incidents = data.get('incidents', [])
+                
+                content = f"Discord Status: {status.get('description', 'Unknown')}\n"
+                content += f"Last Updated: {data.get('page', {}).get('updated_at', 'Unknown')}\n\n"
+                
+                if incidents:
+                    content += "Recent Incidents:\n"
+                    for incident in incidents[:3]:
+                        content += f"- {incident.get('name', 'Unknown incident')}\n"
+                
+                return PostBase(
+                    source="discord/status",
+                    post_id=None,
+                    author="Discord Status",
+                    title="Discord Service Status",
+                    content=content,
+                    url="https://discordstatus.com"
+                )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    status = data.get('status', {})
-                    incidents = data.get('incidents', [])
-                    
-                    content = f"Discord Status: {status.get('description', 'Unknown')}\n"
-                    content += f"Last Updated: {data.get('page', {}).get('updated_at', 'Unknown')}\n\n"
-                    
-                    if incidents:
-                        content += "Recent Incidents:\n"
-                        for incident in incidents[:3]:
-                            content += f"- {incident.get('name', 'Unknown incident')}\n"
-                    
-                    return PostBase(
-                        source="discord/status",
-                        post_id=None,
-                        author="Discord Status",
-                        title="Discord Service Status",
-                        content=content,
-                        url="https://discordstatus.com"
-                    )
-                    
         except Exception as e:
             logger.error(f"Error getting Discord status: {e}")
         
@@ -129,19 +129,19 @@ class DiscordService:
         """Discord 웹훅 설정 (메시지 수신용)"""
         try:
             # 웹훅 정보 확인
-            async with httpx.AsyncClient() as client:
-                response = await client.get(webhook_url)
+            client = http_client_registry.get_client(webhook_url)
+            response = await client.get(webhook_url)
+            
+            if response.status_code == 200:
+                webhook_info = response.json()
+                return {
+                    'id': webhook_info.get('id'),
+                    'name': webhook_info.get('name'),
+                    'channel_id': webhook_info.get('channel_id'),
+                    'guild_id': webhook_info.get('guild_id'),
+                    'status': 'active'
+                }
                 
-                if response.status_code == 200:
-                    webhook_info = response.json()
-                    return {
-                        'id': webhook_info.get('id'),
-                        'name': webhook_info.get('name'),
-                        'channel_id': webhook_info.get('channel_id'),
-                        'guild_id': webhook_info.get('guild_id'),
-                        'status': 'active'
-                    }
-                    
         except Exception as e:
             logger.error(f"Error setting up webhook: {e}")
             return {'status': 'error', 'message': str(e)}
@@ -157,15 +157,15 @@ class DiscordService:
             if embed:
                 payload['embeds'] = [embed]
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'}
-                )
-                
-                return response.status_code == 204
-                
+            client = http_client_registry.get_client(webhook_url)
+            response = await client.post(
+                webhook_url,
+                json=payload,
+                headers={'Content-Type': 'application/json'}
+            )
+            
+            return response.status_code == 204
+            
         except Exception as e:
             logger.error(f"Error sending to webhook: {e}")
             return False
@@ -177,15 +177,15 @@ class DiscordService:
             return None
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_base}/guilds/{guild_id}",
-                    headers=self.headers
-                )
+            client = http_client_registry.get_client(self.api_base)
+            response = await client.get(
+                f"{self.api_base}/guilds/{guild_id}",
+                headers=self.headers
+            )
+            
+            if response.status_code == 200:
+                return response.json()
                 
-                if response.status_code == 200:
-                    return response.json()
-                    
         except Exception as e:
             logger.error(f"Error getting guild info: {e}")
         
@@ -199,27 +199,27 @@ class DiscordService:
         messages = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_base}/channels/{channel_id}/messages",
-                    headers=self.headers,
-                    params={'limit': 100}
-                )
+            client = http_client_registry.get_client(self.api_base)
+            response = await client.get(
+                f"{self.api_base}/channels/{channel_id}/messages",
+                headers=self.headers,
+                params={'limit': 100}
+            )
+            
+            if response.status_code == 200:
+                all_messages = response.json()
                 
-                if response.status_code == 200:
-                    all_messages = response.json()
-                    
-                    # 쿼리와 일치하는 메시지 필터링
-                    for msg in all_messages:
-                        if query.lower() in msg.get('content', '').lower():
-                            messages.append({
-                                'id': msg.get('id'),
-                                'content': msg.get('content'),
-                                'author': msg.get('author', {}).get('username', 'Unknown'),
-                                'timestamp': msg.get('timestamp'),
-                                'channel_id': channel_id
-                            })
-                            
+                # 쿼리와 일치하는 메시지 필터링
+                for msg in all_messages:
+                    if query.lower() in msg.get('content', '').lower():
+                        messages.append({
+                            'id': msg.get('id'),
+                            'content': msg.get('content'),
+                            'author': msg.get('author', {}).get('username', 'Unknown'),
+                            'timestamp': msg.get('timestamp'),
+                            'channel_id': channel_id
+                        })
+                        
         except Exception as e:
             logger.error(f"Error searching messages: {e}")
         
@@ -0,0 +1,175 @@
+"""
+관심 서브레딧 새 글 수집기 (firehose)
+설정된 서브레딧들의 /new 게시물과 댓글 스트림을 주기적으로 가져와 로컬 저장소에 기록
+마지막으로 받은 fullname을 체크포인트로 남겨 다음 폴링에서는 새 항목만 저장
+/search와 스케줄 실행은 로컬 저장소를 먼저 조회하고 부족한 만큼만 Reddit 검색
+"""
+import asyncio
+import logging
+import time
+from typing import List, Dict, Optional, Any, Tuple
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.local_post_store_service import local_post_store
+from app.services.reddit_rate_governor import reddit_rate_governor, PRIORITY_SCHEDULED
+
+logger = logging.getLogger(__name__)
+
+# 한 번 폴링에서 가져올 최대 항목 수 (Reddit 목록 한 페이지)
+POLL_LIMIT = 100
+
+
+class SubredditFirehose:
+    def __init__(self):
+        self.enabled = settings.FIREHOSE_ENABLED
+        self.subreddits = [name.strip().lower() for name in (settings.FIREHOSE_SUBREDDITS or "").split(",") if name.strip()]
+        self.poll_seconds = settings.FIREHOSE_POLL_SECONDS
+        self.include_comments = settings.FIREHOSE_COMMENTS
+        self._task: Optional[asyncio.Task] = None
+        self._last_poll: Optional[float] = None
+        self._stats = {"polls": 0, "posts": 0, "comments": 0, "errors": 0, "local_hits": 0}
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and bool(self.subreddits)
+
+    @property
+    def fresh(self) -> bool:
+        """마지막 폴링이 최근이라 로컬 저장소로 답해도 되는지"""
+        return self._last_poll is not None and time.time() - self._last_poll < self.poll_seconds * 3
+
+    def _read_stream(self, stream: str, items) -> Tuple[List[Any], Optional[Tuple[str, float]]]:
+        """
+        체크포인트 이후의 새 항목만 (최신순 목록을 체크포인트 항목이나 그보다 오래된 항목에서 중단)
+        새 체크포인트 (fullname, created_utc)도 함께 반환 - 항목을 저장한 뒤에 기록해야 실패 시 다시 읽음
+        """
+        checkpoint = local_post_store.get_checkpoint(stream)
+        new_items = []
+        for item in items:
+            if checkpoint and (item.fullname == checkpoint["fullname"] or item.created_utc < checkpoint["created_utc"]):
+                break
+            new_items.append(item)
+        next_checkpoint = (new_items[0].fullname, new_items[0].created_utc) if new_items else None
+        return new_items, next_checkpoint
+
+    @staticmethod
+    def _advance(stream: str, checkpoint: Optional[Tuple[str, float]]) -> None:
+        if checkpoint:
+            local_post_store.set_checkpoint(stream, *checkpoint)
+
+    def poll_once(self) -> Dict[str, int]:
+        """새 게시물/댓글 한 번 가져오기 (동기 - 스레드에서 실행)"""
+        from app.services.reddit_service import RedditService
+
+        reddit = RedditService().reddit
+        if not reddit or not self.subreddits:
+            return {"posts": 0, "comments": 0}
+
+        multi = "+".join(self.subreddits)
+        subreddit = reddit.subreddit(multi)
+
+        posts_stream = f"posts:{multi}"
+        submissions, posts_checkpoint = self._read_stream(posts_stream, subreddit.new(limit=POLL_LIMIT))
+        local_post_store.upsert_posts([
+            {
+                "source": "reddit",
+                "post_id": submission.id,
+                "subreddit": submission.subreddit.display_name,
+                "author": str(submission.author) if submission.author else "[deleted]",
+                "title": submission.title,
+                "body": submission.selftext,
+                "url": f"https://reddit.com{submission.permalink}",
+                "score": submission.score,
+                "comments": submission.num_comments,
+                "created_utc": submission.created_utc
+            }
+            for submission in submissions
+        ])
+        self._advance(posts_stream, posts_checkpoint)
+
+        comments = []
+        if self.include_comments:
+            comments_stream = f"comments:{multi}"
+            comments, comments_checkpoint = self._read_stream(comments_stream, subreddit.comments(limit=POLL_LIMIT))
+            local_post_store.upsert_comments([
+                {
+                    "comment_id": comment.id,
+                    "post_id": comment.link_id.split("_", 1)[-1],
+                    "author": str(comment.author) if comment.author else "[deleted]",
+                    "body": comment.body,
+                    "score": comment.score,
+                    "created_utc": comment.created_utc
+                }
+                for comment in comments
+            ])
+            self._advance(comments_stream, comments_checkpoint)
+
+        self._last_poll = time.time()
+        self._stats["polls"] += 1
+        self._stats["posts"] += len(submissions)
+        self._stats["comments"] += len(comments)
+        if len(submissions) >= POLL_LIMIT:
+            logger.warning(f"🚰 Firehose 폴링 한 번에 {POLL_LIMIT}개 - 일부 게시물을 놓쳤을 수 있습니다 (주기 단축 필요)")
+        return {"posts": len(submissions), "comments": len(comments)}
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # 대화형 검색 예산을 침범하지 않도록 스케줄 우선순위로 실행
+                with reddit_rate_governor.priority(PRIORITY_SCHEDULED):
+                    result = await asyncio.to_thread(self.poll_once)
+                logger.debug(f"🚰 Firehose 폴링 | 게시물: {result['posts']} | 댓글: {result['comments']}")
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Firehose poll failed: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    def start(self) -> None:
+        if self.active and self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🚰 Firehose 시작 | 서브레딧: {', '.join(self.subreddits)} | 주기: {self.poll_seconds}초")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def lookup(self, queries: List[str], limit: int, min_score: int = 0,
+               window_seconds: int = 7 * 24 * 3600) -> List[PostBase]:
+        """
+        로컬 저장소에서 관심 서브레딧 게시물 검색 (수집기가 꺼져 있거나 오래됐으면 빈 목록)
+        여러 검색어 결과를 중복 없이 합쳐 limit개까지
+        """
+        if not self.active or not self.fresh:
+            return []
+
+        since = time.time() - window_seconds
+        rows = []
+        seen_ids = set()
+        for query in queries:
+            for row in local_post_store.search(query, subreddits=self.subreddits, since_utc=since,
+                                               min_score=min_score, limit=limit):
+                if row["post_id"] not in seen_ids and len(rows) < limit:
+                    seen_ids.add(row["post_id"])
+                    rows.append(row)
+        self._stats["local_hits"] += len(rows)
+        return local_post_store.to_posts(rows)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "subreddits": self.subreddits,
+            "running": self._task is not None,
+            "fresh": self.fresh,
+            "last_poll": self._last_poll,
+            **self._stats,
+            "store": local_post_store.get_stats()
+        }
+
+
+# 전역 관심 서브레딧 수집기
+subreddit_firehose = SubredditFirehose()
@@ -2,17 +2,24 @@
 Hacker News 크롤링 서비스
 개발자 커뮤니티의 최신 트렌드와 토론 수집
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator
 from app.schemas.schemas import PostBase
 import logging
 import httpx
+from app.services.http_client_service import http_client_registry
 import asyncio
 from datetime import datetime
 from bs4 import BeautifulSoup
 import json
+import time
+from app.core.config import settings
+from app.services.local_post_store_service import local_post_store
 
 logger = logging.getLogger(__name__)
 
+# 스토리별 댓글 트리 캐시: 키 → (만료 시각, 트리)
+_comment_tree_cache: Dict[tuple, tuple] = {}
+
 class HackerNewsService:
     def __init__(self):
         self.base_url = "https://news.ycombinator.com"
@@ -31,24 +38,24 @@ class HackerNewsService:
         
         try:
             # Algolia API로 검색
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.algolia_api}/search",
-                    params={
-                        'query': query,
-                        'tags': 'story',  # story, comment, poll 중 선택
-                        'hitsPerPage': limit
-                    }
-                )
+            client = http_client_registry.get_client(self.algolia_api)
+            response = await client.get(
+                f"{self.algolia_api}/search",
+                params={
+                    'query': query,
+                    'tags': 'story',  # story, comment, poll 중 선택
+                    'hitsPerPage': limit
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                hits = data.get('hits', [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    hits = data.get('hits', [])
-                    
-                    for hit in hits:
-                        post = self._parse_algolia_hit(hit)
-                        if post:
-                            posts.append(post)
+                for hit in hits:
+                    post = self._parse_algolia_hit(hit)
+                    if post:
+                        posts.append(post)
             
             logger.info(f"Retrieved {len(posts)} posts from Hacker News for query: {query}")
             
@@ -57,6 +64,141 @@ class HackerNewsService:
         
         return posts
     
+    async def stream_posts(self, query: str, since: Optional[int] = None, hits_per_page: int = 50,
+                           max_pages: int = None, by_date: bool = False,
+                           progress: Optional[Dict] = None, until: Optional[int] = None) -> AsyncIterator[PostBase]:
+        """
+        Algolia 검색 결과를 페이지 단위로 동시에 가져오며 도착하는 대로 yield
+        since: created_at_i 하한 (UNIX timestamp) - 이후에 올라온 스토리만 조회
+        until: created_at_i 상한 (UNIX timestamp) - 이전에 올라온 스토리만 조회
+        by_date: /search_by_date(최신순)로 페이지를 순서대로 하나씩 가져옴 (증분 수집용)
+        progress: 전달하면 progress["exhausted"]에 조건에 맞는 스토리를 끝까지 읽었는지 기록
+        """
+        max_pages = max_pages or settings.HN_SEARCH_MAX_PAGES
+        client = http_client_registry.get_client(self.algolia_api)
+        endpoint = "search_by_date" if by_date else "search"
+        params = {
+            'query': query,
+            'tags': 'story',
+            'hitsPerPage': hits_per_page
+        }
+        filters = []
+        if since:
+            filters.append(f"created_at_i>{int(since)}")
+        if until:
+            filters.append(f"created_at_i<{int(until)}")
+        if filters:
+            params['numericFilters'] = ",".join(filters)
+        if progress is not None:
+            progress["exhausted"] = False
+        
+        async def fetch_page(page: int) -> Dict:
+            response = await client.get(f"{self.algolia_api}/{endpoint}", params={**params, 'page': page})
+            response.raise_for_status()
+            return response.json()
+        
+        # 첫 페이지로 전체 페이지 수 확인
+        first = await fetch_page(0)
+        for hit in first.get('hits', []):
+            post = self._parse_algolia_hit(hit)
+            if post:
+                yield post
+        
+        pages = min(first.get('nbPages', 1), max_pages)
+        if by_date:
+            # 중간에 멈춰도 읽은 범위가 최신 스토리부터 빈틈없이 이어지도록 순서대로 요청
+            for page in range(1, pages):
+                data = await fetch_page(page)
+                for hit in data.get('hits', []):
+                    post = self._parse_algolia_hit(hit)
+                    if post:
+                        yield post
+            # 페이지 상한(max_pages, Algolia 1000건 제한)에 걸렸으면 끝까지 읽은 것이 아님
+            if progress is not None:
+                progress["exhausted"] = first.get('nbHits', 0) <= pages * hits_per_page
+            return
+        
+        if pages <= 1:
+            return
+        
+        # 나머지 페이지는 동시 요청, 먼저 도착한 페이지부터 yield
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(1, pages)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                try:
+                    data = await next_page
+                except Exception as e:
+                    logger.error(f"Error fetching Hacker News page: {e}")
+                    continue
+                for hit in data.get('hits', []):
+                    post = self._parse_algolia_hit(hit)
+                    if post:
+                        yield post
+        finally:
+            # 소비자가 중간에 멈추면 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def collect_posts(self, query: str, limit: int = 50, window_hours: Optional[int] = None,
+                            watermark_key: Optional[str] = None, time_budget: float = None) -> List[PostBase]:
+        """
+        스트리밍 수집기를 소비하여 게시물 목록 반환
+        watermark_key(스케줄 ID)를 주면 같은 키의 이전 실행 이후 새 스토리만 최신순으로 가져옴 (스케줄 실행용)
+        한 번에 다 읽지 못하면 가장 오래 읽은 스토리 시각을 저장해 다음 실행에서 그 이전부터 이어서 읽음
+        """
+        time_budget = time_budget or settings.HN_SEARCH_TIME_BUDGET_SECONDS
+        incremental = watermark_key is not None
+        state_key = f"hn:{watermark_key}"
+        state = (local_post_store.get_search_watermark(state_key) if incremental else None) or {}
+        previous = state.get("watermark")
+        # 이전 실행이 중간에 멈췄으면 (이전 워터마크, 가장 오래 읽은 스토리) 사이부터 마저 읽음
+        resume_before = state.get("resume_before")
+        
+        since = None
+        if window_hours:
+            since = int(time.time()) - window_hours * 3600
+        if previous:
+            since = max(since or 0, previous)
+        
+        posts = []
+        seen = set()
+        newest = since or 0
+        oldest = None
+        progress = {}
+        deadline = time.monotonic() + time_budget
+        
+        try:
+            async for post in self.stream_posts(query, since=since, hits_per_page=min(limit, 100),
+                                                by_date=incremental, progress=progress, until=resume_before):
+                if post.post_id in seen:
+                    continue
+                seen.add(post.post_id)
+                posts.append(post)
+                created = int(post.created_utc or 0)
+                newest = max(newest, created)
+                oldest = created if oldest is None else min(oldest, created)
+                # 지연 예산/수량 초과 시 남은 페이지 중단
+                if len(posts) >= limit or time.monotonic() > deadline:
+                    break
+        except Exception as e:
+            logger.error(f"Error collecting Hacker News posts: {e}")
+        
+        if incremental:
+            # 이어 읽는 중이면 워터마크는 빈틈을 처음 만든 실행에서 읽은 가장 최신 시각
+            pending_newest = state.get("resume_newest") if resume_before else newest
+            if progress.get("exhausted") or previous is None:
+                if pending_newest:
+                    local_post_store.set_search_watermark(state_key, max(pending_newest, previous or 0))
+            elif oldest is not None:
+                # 최신순으로 읽다가 멈췄으므로 이전 워터마크 ~ 가장 오래 읽은 스토리 사이는 다음 실행에서 읽음
+                local_post_store.set_search_watermark(state_key, previous, resume_before=oldest,
+                                                      resume_newest=pending_newest)
+                logger.info(f"HN collection for '{query}' stopped after {len(posts)} posts; "
+                            f"resuming before {oldest} next run")
+        
+        logger.info(f"Collected {len(posts)} Hacker News posts for '{query}' (since: {since})")
+        return posts
+    
     def _parse_algolia_hit(self, hit: Dict) -> Optional[PostBase]:
         """Algolia 검색 결과 파싱"""
         try:
@@ -93,7 +235,10 @@ class HackerNewsService:
                 author=hit.get('author', 'Unknown'),
                 title=hit.get('title'),
                 content=content,
-                url=story_url or hn_url  # 외부 링크가 있으면 우선, 없으면 HN 링크
+                url=story_url or hn_url,  # 외부 링크가 있으면 우선, 없으면 HN 링크
+                score=hit.get('points'),
+                comments=hit.get('num_comments'),
+                created_utc=hit.get('created_at_i')
             )
             
         except Exception as e:
@@ -108,24 +253,24 @@ class HackerNewsService:
         posts = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                # 스토리 ID 목록 가져오기
-                response = await client.get(f"{self.api_base}/{story_type}stories.json")
+            client = http_client_registry.get_client(self.api_base)
+            # 스토리 ID 목록 가져오기
+            response = await client.get(f"{self.api_base}/{story_type}stories.json")
+            
+            if response.status_code == 200:
+                story_ids = response.json()[:limit]
                 
-                if response.status_code == 200:
-                    story_ids = response.json()[:limit]
-                    
-                    # 각 스토리 상세 정보 가져오기 (병렬 처리)
-                    tasks = []
-                    for story_id in story_ids:
-                        task = self._get_story_details(client, story_id)
-                        tasks.append(task)
-                    
-                    stories = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    for story in stories:
-                        if isinstance(story, PostBase):
-                            posts.append(story)
+                # 각 스토리 상세 정보 가져오기 (병렬 처리)
+                tasks = []
+                for story_id in story_ids:
+                    task = self._get_story_details(client, story_id)
+                    tasks.append(task)
+                
+                stories = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                for story in stories:
+                    if isinstance(story, PostBase):
+                        posts.append(story)
             
         except Exception as e:
             logger.error(f"Error getting top stories: {e}")
@@ -172,92 +317,160 @@ class HackerNewsService:
         posts = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                # 사용자 정보 가져오기
-                response = await client.get(f"{self.api_base}/user/{username}.json")
+            client = http_client_registry.get_client(self.api_base)
+            # 사용자 정보 가져오기
+            response = await client.get(f"{self.api_base}/user/{username}.json")
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                submitted_ids = user_data.get('submitted', [])[:limit]
                 
-                if response.status_code == 200:
-                    user_data = response.json()
-                    submitted_ids = user_data.get('submitted', [])[:limit]
-                    
-                    # 각 제출물 정보 가져오기
-                    tasks = []
-                    for item_id in submitted_ids:
-                        task = self._get_story_details(client, item_id)
-                        tasks.append(task)
-                    
-                    items = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    for item in items:
-                        if isinstance(item, PostBase):
-                            posts.append(item)
-                            
+                # 각 제출물 정보 가져오기
+                tasks = []
+                for item_id in submitted_ids:
+                    task = self._get_story_details(client, item_id)
+                    tasks.append(task)
+                
+                items = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                for item in items:
+                    if isinstance(item, PostBase):
+                        posts.append(item)
+                        
         except Exception as e:
             logger.error(f"Error getting user submissions: {e}")
         
         return posts
     
-    async def get_comments_for_story(self, story_id: int, max_depth: int = 2) -> List[Dict]:
-        """스토리의 댓글 가져오기"""
-        comments = []
+    async def get_comments_for_story(self, story_id: int, max_depth: int = 2,
+                                     max_top_level: int = 10, max_replies: int = 3,
+                                     max_comments: int = None) -> List[Dict]:
+        """스토리의 댓글 트리 가져오기 (Algolia 단일 요청 → 실패 시 Firebase 병렬 탐색)"""
+        max_comments = max_comments or settings.HN_COMMENT_TREE_MAX_COMMENTS
+        cache_key = (int(story_id), max_depth, max_top_level, max_replies, max_comments)
+        
+        cached = _comment_tree_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            logger.info(f"♻️ HN 댓글 트리 캐시 사용 | 스토리: {story_id}")
+            return cached[1]
         
+        budget = {"remaining": max_comments}
         try:
-            async with httpx.AsyncClient() as client:
-                # 스토리 정보 가져오기
-                response = await client.get(f"{self.api_base}/item/{story_id}.json")
-                
-                if response.status_code == 200:
-                    story = response.json()
-                    kid_ids = story.get('kids', [])
-                    
-                    # 댓글 가져오기 (재귀적으로)
-                    for kid_id in kid_ids[:10]:  # 상위 10개 댓글만
-                        comment = await self._get_comment_tree(client, kid_id, max_depth)
-                        if comment:
-                            comments.append(comment)
-                            
+            comments = await self._get_comment_tree_algolia(story_id, max_depth, max_top_level, max_replies, budget)
         except Exception as e:
-            logger.error(f"Error getting comments: {e}")
+            logger.warning(f"Algolia comment tree failed for {story_id}, falling back to Firebase: {e}")
+            budget = {"remaining": max_comments}
+            comments = await self._get_comment_tree_firebase(story_id, max_depth, max_top_level, max_replies, budget)
+        
+        _comment_tree_cache[cache_key] = (time.monotonic() + settings.HN_COMMENT_CACHE_TTL_SECONDS, comments)
+        # 만료 항목 정리
+        if len(_comment_tree_cache) > 256:
+            now = time.monotonic()
+            for key in [k for k, v in _comment_tree_cache.items() if v[0] <= now]:
+                del _comment_tree_cache[key]
         
         return comments
     
-    async def _get_comment_tree(self, client: httpx.AsyncClient, comment_id: int, 
-                               max_depth: int, current_depth: int = 0) -> Optional[Dict]:
-        """댓글 트리 구조로 가져오기"""
-        if current_depth >= max_depth:
-            return None
+    async def _get_comment_tree_algolia(self, story_id: int, max_depth: int, max_top_level: int,
+                                        max_replies: int, budget: Dict) -> List[Dict]:
+        """Algolia items API - 전체 댓글 트리를 한 번의 요청으로 가져와 예산만큼 잘라냄"""
+        client = http_client_registry.get_client(self.algolia_api)
+        max_bytes = settings.HN_COMMENT_TREE_MAX_BYTES
         
-        try:
-            response = await client.get(f"{self.api_base}/item/{comment_id}.json")
+        # 응답을 스트리밍으로 읽으면서 크기 상한을 넘으면 중단 (초대형 스레드 방지)
+        chunks = []
+        received = 0
+        async with client.stream("GET", f"{self.algolia_api}/items/{story_id}") as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > max_bytes:
+                    raise ValueError(f"comment tree exceeds {max_bytes} bytes")
+                chunks.append(chunk)
+        
+        item = json.loads(b"".join(chunks))
+        return self._build_algolia_children(item.get('children') or [], max_depth, max_top_level, max_replies, budget)
+    
+    def _build_algolia_children(self, children: List[Dict], depth_left: int, breadth: int,
+                                max_replies: int, budget: Dict) -> List[Dict]:
+        comments = []
+        if depth_left <= 0:
+            return comments
+        
+        for child in children:
+            if len(comments) >= breadth or budget["remaining"] <= 0:
+                break
+            # 삭제된 댓글은 author/text가 비어 있음
+            if child.get('type') != 'comment' or not child.get('text'):
+                continue
             
-            if response.status_code == 200:
-                comment = response.json()
-                
-                if not comment or comment.get('deleted') or comment.get('dead'):
-                    return None
-                
-                comment_data = {
-                    'id': comment_id,
-                    'author': comment.get('by', 'Unknown'),
-                    'text': comment.get('text', ''),
-                    'time': datetime.fromtimestamp(comment.get('time', 0)).isoformat(),
-                    'replies': []
-                }
-                
-                # 대댓글 가져오기
-                kid_ids = comment.get('kids', [])
-                for kid_id in kid_ids[:3]:  # 대댓글은 3개까지만
-                    reply = await self._get_comment_tree(
-                        client, kid_id, max_depth, current_depth + 1
-                    )
-                    if reply:
-                        comment_data['replies'].append(reply)
-                
-                return comment_data
-                
-        except Exception as e:
-            logger.error(f"Error getting comment tree: {e}")
-            return None
+            budget["remaining"] -= 1
+            comments.append({
+                'id': child.get('id'),
+                'author': child.get('author') or 'Unknown',
+                'text': child.get('text', ''),
+                'time': datetime.fromtimestamp(child.get('created_at_i', 0)).isoformat(),
+                'replies': self._build_algolia_children(
+                    child.get('children') or [], depth_left - 1, max_replies, max_replies, budget
+                )
+            })
+        
+        return comments
+    
+    async def _get_comment_tree_firebase(self, story_id: int, max_depth: int, max_top_level: int,
+                                         max_replies: int, budget: Dict) -> List[Dict]:
+        """Firebase API 폴백 - 같은 깊이의 댓글을 동시 요청 수 제한 하에 병렬로 가져옴"""
+        client = http_client_registry.get_client(self.api_base)
+        semaphore = asyncio.Semaphore(settings.HN_FIREBASE_CONCURRENCY)
+        
+        async def fetch(item_id: int) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    response = await client.get(f"{self.api_base}/item/{item_id}.json")
+                    if response.status_code == 200:
+                        return response.json()
+                except Exception as e:
+                    logger.error(f"Error getting comment {item_id}: {e}")
+                return None
+        
+        story = await fetch(story_id)
+        if not story:
+            return []
+        
+        comments = []
+        # (부모의 replies 리스트, 자식 ID 목록) 단위로 한 레벨씩 내려감
+        level = [(comments, story.get('kids', [])[:max_top_level])]
+        for _ in range(max_depth):
+            # 남은 예산만큼만 요청 (앞쪽 부모의 자식부터)
+            ids = [kid_id for _, kid_ids in level for kid_id in kid_ids][:budget["remaining"]]
+            if not ids:
+                break
+            
+            items = await asyncio.gather(*[fetch(kid_id) for kid_id in ids])
+            items_by_id = {kid_id: item for kid_id, item in zip(ids, items)}
+            
+            next_level = []
+            for replies, kid_ids in level:
+                for kid_id in kid_ids:
+                    comment = items_by_id.get(kid_id)
+                    if not comment or comment.get('deleted') or comment.get('dead'):
+                        continue
+                    if budget["remaining"] <= 0:
+                        break
+                    budget["remaining"] -= 1
+                    
+                    comment_data = {
+                        'id': kid_id,
+                        'author': comment.get('by', 'Unknown'),
+                        'text': comment.get('text', ''),
+                        'time': datetime.fromtimestamp(comment.get('time', 0)).isoformat(),
+                        'replies': []
+                    }
+                    replies.append(comment_data)
+                    next_level.append((comment_data['replies'], comment.get('kids', [])[:max_replies]))
+            level = next_level
+        
+        return comments
     
     async def monitor_keywords(self, keywords: List[str], callback) -> None:
         """키워드 모니터링 (실시간 알림)"""
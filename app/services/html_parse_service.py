@@ -0,0 +1,245 @@
+"""
+HTML 파싱 서비스
+Threads/LinkedIn 페이지 파싱을 lxml로 처리하고 스레드/프로세스 풀에서 실행해 이벤트 루프를 막지 않음
+"""
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Any
+import lxml.html
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+
+logger = logging.getLogger(__name__)
+
+THREADS_BASE_URL = "https://www.threads.net"
+
+
+def _parse_document(html: str):
+    return lxml.html.fromstring(html)
+
+
+def _og_description(doc) -> Optional[str]:
+    """og:description 메타 태그의 content (태그가 없으면 None)"""
+    metas = doc.xpath('//meta[@property="og:description"]')
+    return metas[0].get('content', '') if metas else None
+
+
+def _single_string(element) -> Optional[str]:
+    """BeautifulSoup의 element.string과 같은 규칙 - 자식 노드가 문자열 하나뿐일 때만 그 문자열"""
+    children = [child for child in element if not isinstance(child, lxml.html.HtmlComment)]
+    if not children:
+        return element.text
+    if len(children) == 1 and element.text is None and children[0].tail is None:
+        return _single_string(children[0])
+    return None
+
+
+def _parse_json_ld_post(data: dict) -> Optional[PostBase]:
+    """JSON-LD 형식의 게시물 파싱"""
+    try:
+        author = data.get('author', {})
+        author_name = author.get('name', 'Unknown')
+        if isinstance(author, dict) and 'identifier' in author:
+            author_name = f"@{author['identifier']['value']}"
+
+        content = data.get('articleBody', '')
+        url = data.get('url', '')
+
+        if not content:
+            return None
+
+        # 날짜 정보 추가
+        date_published = data.get('datePublished', '')
+        if date_published:
+            content += f"\n\n---\n📅 Posted: {date_published}"
+
+        return PostBase(
+            source="threads",
+            post_id=url.split('/')[-1] if url else None,
+            author=author_name,
+            title=None,
+            content=content[:1000],
+            url=url
+        )
+    except Exception as e:
+        logger.error(f"Error parsing JSON-LD post: {e}")
+        return None
+
+
+def parse_threads_search(html: str, query: str, base_url: str = THREADS_BASE_URL) -> List[PostBase]:
+    """Threads 검색/해시태그 페이지 - JSON-LD 게시물과 og:description"""
+    doc = _parse_document(html)
+    posts = []
+    query_lower = query.lower()
+
+    # JSON-LD 데이터 추출
+    for script in doc.xpath('//script[@type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text)
+            if isinstance(data, list):
+                for item in data:
+                    if item.get('@type') == 'SocialMediaPosting':
+                        post = _parse_json_ld_post(item)
+                        if post and query_lower in post.content.lower():
+                            posts.append(post)
+        except Exception:
+            continue
+
+    # 메타 태그에서 정보 추출
+    content = _og_description(doc)
+    if content and query_lower in content.lower():
+        posts.append(PostBase(
+            source="threads",
+            post_id=None,
+            author="Threads",
+            title=None,
+            content=content,
+            url=base_url
+        ))
+
+    return posts
+
+
+def parse_threads_user_posts(html: str, username: str, limit: int = 10, base_url: str = THREADS_BASE_URL) -> List[PostBase]:
+    """Threads 사용자 프로필 페이지 - 초기 로드된 article 컨테이너"""
+    doc = _parse_document(html)
+    posts = []
+
+    for container in doc.xpath('//div[@role="article"]')[:limit]:
+        try:
+            # 텍스트 내용 추출 (문자열 하나만 가진 span/div)
+            texts = []
+            for element in container.iterdescendants('span', 'div'):
+                text = _single_string(element)
+                if text is not None and text.strip():
+                    texts.append(text.strip())
+            content = ' '.join(texts)
+
+            if not content:
+                continue
+
+            # 링크 추출
+            links = container.xpath('.//a[contains(@href, "/t/")]/@href')
+            href = links[0] if links else None
+
+            posts.append(PostBase(
+                source="threads",
+                post_id=href.split('/')[-1] if href else None,
+                author=f"@{username}",
+                title=None,
+                content=content[:1000],
+                url=f"{base_url}{href}" if href else None
+            ))
+        except Exception as e:
+            logger.error(f"Error parsing post container: {e}")
+
+    return posts
+
+
+def parse_linkedin_company_posts(html: str, company_url: str, limit: int = 10) -> List[PostBase]:
+    """LinkedIn 회사 페이지 - 렌더링된 DOM에서 게시물 추출"""
+    doc = _parse_document(html)
+    posts = []
+
+    headings = doc.xpath('//h1')
+    company_name = headings[0].text_content() if headings else ""
+    if not company_name:
+        company_name = "Unknown Company"
+
+    containers = doc.xpath(
+        '//*[contains(@data-urn, "activity") or contains(concat(" ", normalize-space(@class), " "), " feed-shared-update-v2 ")]'
+    )
+    for container in containers[:limit]:
+        try:
+            text_elements = container.xpath(
+                './/*[contains(concat(" ", normalize-space(@class), " "), " feed-shared-text ")'
+                ' or contains(concat(" ", normalize-space(@class), " "), " break-words ")]'
+            )
+            content = text_elements[0].text_content() if text_elements else ""
+            if not content:
+                continue
+
+            reactions = container.xpath('.//*[@data-test-social-counts]')
+            engagement = reactions[0].text_content() if reactions else ""
+
+            posts.append(PostBase(
+                source=f"linkedin/{company_name.lower().replace(' ', '_')}",
+                post_id=None,
+                author=company_name,
+                title=None,
+                content=f"{content.strip()}\n\n---\n💼 Company: {company_name}\n{engagement}",
+                url=company_url
+            ))
+        except Exception as e:
+            logger.error(f"Error extracting post: {e}")
+
+    return posts
+
+
+def parse_linkedin_hashtag(html: str, hashtag: str, hashtag_url: str) -> List[PostBase]:
+    """LinkedIn 해시태그 페이지 - og:description"""
+    content = _og_description(_parse_document(html))
+    if content is None:
+        return []
+    return [PostBase(
+        source=f"linkedin/#{hashtag}",
+        post_id=None,
+        author="LinkedIn Hashtag",
+        title=f"#{hashtag}",
+        content=content,
+        url=hashtag_url
+    )]
+
+
+class HtmlParseService:
+    def __init__(self, mode: str = None, workers: int = None):
+        self.mode = mode or settings.HTML_PARSE_EXECUTOR
+        self.workers = workers or settings.HTML_PARSE_WORKERS
+        self._executor: Optional[Executor] = None
+        self._stats = {"pages": 0, "total_ms": 0.0, "max_ms": 0.0}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="html-parse")
+            logger.info(f"🧩 HTML 파싱 풀 생성 | 모드: {self.mode} | 워커: {self.workers}")
+        return self._executor
+
+    async def run(self, parser: Callable[..., List[PostBase]], html: str, *args: Any) -> List[PostBase]:
+        """파서 함수를 풀에서 실행 (실패 시 빈 목록)"""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._get_executor(), parser, html, *args)
+        except Exception as e:
+            logger.error(f"Error parsing HTML with {parser.__name__}: {e}")
+            return []
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats["pages"] += 1
+            self._stats["total_ms"] += elapsed_ms
+            self._stats["max_ms"] = max(self._stats["max_ms"], elapsed_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        pages = self._stats["pages"]
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "pages": pages,
+            "avg_ms": round(self._stats["total_ms"] / pages, 2) if pages else 0.0,
+            "max_ms": round(self._stats["max_ms"], 2)
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 HTML 파싱 서비스
+html_parser = HtmlParseService()
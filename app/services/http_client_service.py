@@ -0,0 +1,129 @@
+"""
+공유 HTTP 클라이언트 레지스트리
+업스트림 호스트별로 장기 유지되는 httpx.AsyncClient를 재사용하여 DNS/TCP/TLS 핸드셰이크 비용 절감
+"""
+import logging
+from typing import Dict, Any
+from urllib.parse import urlsplit
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2는 h2 패키지가 있을 때만 사용 (없으면 HTTP/1.1 keep-alive)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_PROFILE = {
+    "timeout": 15.0,
+    "connect_timeout": 5.0,
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 60.0,
+    "http2": True,
+}
+
+# 호스트별 튜닝 (DEFAULT_PROFILE 위에 덮어씀)
+HOST_PROFILES = {
+    # HN Firebase API는 아이템 단위로 호출이 많으므로 연결 풀을 크게
+    "hacker-news.firebaseio.com": {"max_connections": 50, "max_keepalive_connections": 30},
+    "hn.algolia.com": {"timeout": 10.0},
+    # Threads 웹 페이지는 응답이 느림
+    "www.threads.net": {"timeout": 30.0, "max_connections": 10, "max_keepalive_connections": 5},
+    "discord.com": {"timeout": 10.0},
+    "discordstatus.com": {"timeout": 10.0, "max_connections": 5, "max_keepalive_connections": 2},
+    "disboard.org": {"timeout": 20.0, "max_connections": 5, "max_keepalive_connections": 2, "http2": False},
+    "fcm.googleapis.com": {"timeout": 10.0},
+}
+
+
+class HttpClientRegistry:
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # 호스트별 요청/연결 통계 (연결 재사용률 확인용)
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """URL의 호스트에 해당하는 공유 클라이언트 반환 (없으면 생성)"""
+        host = urlsplit(url).hostname or url
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = self._create_client(host)
+            self._clients[host] = client
+        return client
+
+    def _create_client(self, host: str) -> httpx.AsyncClient:
+        profile = {**DEFAULT_PROFILE, **HOST_PROFILES.get(host, {})}
+        http2 = profile["http2"] and HTTP2_AVAILABLE
+        self._stats.setdefault(host, {
+            "requests": 0,
+            "tcp_connects": 0,
+            "tls_handshakes": 0,
+            "http2_requests": 0,
+            "errors": 0
+        })
+
+        async def on_request(request: httpx.Request):
+            # httpcore trace 확장으로 실제 연결 생성 여부를 기록
+            self._stats[host]["requests"] += 1
+            request.extensions["trace"] = self._make_trace(host)
+
+        logger.info(f"🌐 HTTP 클라이언트 생성 | 호스트: {host} | HTTP/2: {http2} | 최대 연결: {profile['max_connections']}")
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(profile["timeout"], connect=profile["connect_timeout"]),
+            limits=httpx.Limits(
+                max_connections=profile["max_connections"],
+                max_keepalive_connections=profile["max_keepalive_connections"],
+                keepalive_expiry=profile["keepalive_expiry"]
+            ),
+            event_hooks={"request": [on_request]}
+        )
+
+    def _make_trace(self, host: str):
+        stats = self._stats[host]
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                stats["tcp_connects"] += 1
+            elif event_name == "connection.start_tls.complete":
+                stats["tls_handshakes"] += 1
+            elif event_name == "http2.send_request_headers.started":
+                stats["http2_requests"] += 1
+            elif event_name.endswith(".failed"):
+                stats["errors"] += 1
+
+        return trace
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호스트별 요청 수, 새 연결 수, 연결 재사용률"""
+        hosts = {}
+        for host, stats in self._stats.items():
+            requests = stats["requests"]
+            client = self._clients.get(host)
+            hosts[host] = {
+                **stats,
+                "connection_reuse_rate": round(1 - stats["tcp_connects"] / requests, 4) if requests else 0.0,
+                "open": bool(client and not client.is_closed)
+            }
+        return {
+            "http2_available": HTTP2_AVAILABLE,
+            "clients": len(self._clients),
+            "hosts": hosts
+        }
+
+    async def aclose(self):
+        """모든 클라이언트 종료 (앱 종료 시)"""
+        for host, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing HTTP client for {host}: {e}")
+        self._clients.clear()
+        logger.info("🛑 공유 HTTP 클라이언트 종료")
+
+
+# 전역 HTTP 클라이언트 레지스트리
+http_client_registry = HttpClientRegistry()
@@ -0,0 +1,158 @@
+"""
+보고서 입력 스냅샷 서비스
+보고서 생성에 사용된 게시물 집합을 압축 JSONL로 보관하여 Reddit 재수집 없이 재생성 가능하게 함
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.report_cache_service import fingerprint_posts
+
+logger = logging.getLogger(__name__)
+
+# zstd가 설치되어 있으면 사용, 없으면 gzip으로 저장
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SNAPSHOT_VERSION = 1
+
+
+class InputSnapshotService:
+    def __init__(self, snapshot_dir: Optional[str] = None):
+        self.snapshot_dir = snapshot_dir or settings.SNAPSHOT_DIR
+        self.enabled = settings.SNAPSHOT_ENABLED
+
+    def _path(self, report_id: str, extension: str) -> str:
+        # 경로 조작 방지
+        safe_id = os.path.basename(str(report_id))
+        return os.path.join(self.snapshot_dir, f"{safe_id}.jsonl.{extension}")
+
+    def _find_path(self, report_id: str) -> Optional[str]:
+        for extension in ("zst", "gz"):
+            path = self._path(report_id, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def save(self, report_id: str, query: str, posts: List[PostBase], sources: Optional[List[str]] = None,
+             report_length: Optional[str] = None, input_fingerprint: Optional[str] = None) -> Dict[str, Any]:
+        """보고서 입력 스냅샷 저장 (첫 줄은 헤더, 이후 게시물 한 줄씩)"""
+        if not self.enabled:
+            return {"success": False, "error": "Snapshots disabled"}
+
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+
+            header = {
+                "version": SNAPSHOT_VERSION,
+                "report_id": report_id,
+                "query": query,
+                "sources": sources or [],
+                "report_length": report_length,
+                "input_fingerprint": input_fingerprint or fingerprint_posts(posts),
+                "posts_count": len(posts),
+                "created_at": time.time()
+            }
+            lines = [json.dumps(header, ensure_ascii=False)]
+            lines.extend(json.dumps(post.model_dump(), ensure_ascii=False) for post in posts)
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+            if zstandard:
+                path = self._path(report_id, "zst")
+                data = zstandard.ZstdCompressor(level=10).compress(payload)
+            else:
+                path = self._path(report_id, "gz")
+                data = gzip.compress(payload, compresslevel=6)
+
+            # 임시 파일에 쓴 뒤 교체 (중간에 실패해도 깨진 스냅샷이 남지 않도록)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            logger.info(f"💾 입력 스냅샷 저장 | 보고서: {report_id} | 게시물: {len(posts)}개 | {len(payload)} → {len(data)} bytes")
+            return {"success": True, "path": path, "bytes": len(data)}
+
+        except Exception as e:
+            logger.error(f"Error saving input snapshot: {e}")
+            return {"success": False, "error": str(e)}
+
+    def load(self, report_id: str) -> Dict[str, Any]:
+        """스냅샷 로드 - header와 PostBase 목록 반환"""
+        path = self._find_path(report_id)
+        if not path:
+            return {"success": False, "error": "Snapshot not found"}
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+
+            if path.endswith(".zst"):
+                if not zstandard:
+                    return {"success": False, "error": "zstandard is not installed"}
+                payload = zstandard.ZstdDecompressor().decompress(data)
+            else:
+                payload = gzip.decompress(data)
+
+            lines = payload.decode("utf-8").splitlines()
+            header = json.loads(lines[0])
+            posts = [PostBase(**json.loads(line)) for line in lines[1:] if line]
+
+            return {"success": True, "header": header, "posts": posts}
+
+        except Exception as e:
+            logger.error(f"Error loading input snapshot: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def regenerate(self, report_id: str, report_length: Optional[str] = None,
+                         structured: Optional[bool] = None, model: Optional[str] = None) -> Dict[str, Any]:
+        """스냅샷의 게시물로 보고서 재생성 (Reddit 재수집 없음)"""
+        snapshot = await asyncio.to_thread(self.load, report_id)
+        if not snapshot["success"]:
+            return snapshot
+
+        header = snapshot["header"]
+        posts = snapshot["posts"]
+        report_length = report_length or header.get("report_length") or "moderate"
+
+        from app.services.verified_analysis_service import VerifiedAnalysisService
+        verified_analysis = VerifiedAnalysisService()
+
+        logger.info(f"🔁 스냅샷으로 보고서 재생성 | 원본: {report_id} | 길이: {report_length} | 모델: {model or settings.REPORT_MODEL}")
+        report_data = await verified_analysis.generate_verified_report(
+            header["query"],
+            posts,
+            report_length=report_length,
+            structured=structured,
+            model=model
+        )
+
+        return {
+            "success": "post_mappings" in report_data,
+            "header": header,
+            "posts": posts,
+            "report_length": report_length,
+            "report_data": report_data
+        }
+
+    def exists(self, report_id: str) -> bool:
+        return self._find_path(report_id) is not None
+
+    def delete(self, report_id: str) -> bool:
+        """스냅샷 삭제 (보고서 삭제 시)"""
+        path = self._find_path(report_id)
+        if not path:
+            return False
+        os.remove(path)
+        return True
+
+
+# 전역 입력 스냅샷 서비스
+input_snapshot_service = InputSnapshotService()
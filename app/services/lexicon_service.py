@@ -0,0 +1,165 @@
+"""
+한영 어휘 사전 서비스
+파일(app/data/lexicon_ko_en.json)의 한국어 용어를 Aho-Corasick 오토마톤으로 한 번에 찾아 영어로 변환
+조사(은/는/이/가/의...)를 떼어내고, 여러 번역어가 있는 용어는 조합해 검색어 변형을 만듦
+"""
+import heapq
+import json
+import logging
+import os
+import re
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+from app.services.report_validator_service import AhoCorasickMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "lexicon_ko_en.json")
+
+HANGUL_PATTERN = re.compile('[가-힣]')
+
+
+class BilingualLexicon:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.LEXICON_PATH or DEFAULT_LEXICON_PATH
+        self.entries: List[Dict[str, Any]] = []
+        self.particles: List[str] = []
+        self._terms: List[str] = []
+        self._term_entry: List[int] = []
+        self._matcher: Optional[AhoCorasickMatcher] = None
+        self.load()
+
+    def load(self) -> None:
+        """사전 파일을 읽어 오토마톤 생성 (파일이 없으면 빈 사전)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ 어휘 사전 로드 실패: {self.path} | {e}")
+            data = {}
+
+        self.entries = data.get("entries", [])
+        # 긴 조사부터 확인해야 '에서'가 '에'로 잘리지 않음
+        self.particles = sorted(data.get("particles", []), key=len, reverse=True)
+        self._terms = []
+        self._term_entry = []
+        for index, entry in enumerate(self.entries):
+            for term in entry["ko"]:
+                self._terms.append(term)
+                self._term_entry.append(index)
+        self._matcher = AhoCorasickMatcher(self._terms)
+        logger.info(f"📖 어휘 사전 로드 | 항목: {len(self.entries)}개 | 용어: {len(self._terms)}개")
+
+    def _strip_particle(self, text: str, end: int, next_start: int) -> int:
+        """용어 바로 뒤의 조사를 건너뛴 위치 (조사 뒤가 단어 경계일 때만)"""
+        for particle in self.particles:
+            particle_end = end + len(particle)
+            if text.startswith(particle, end) and (
+                particle_end == next_start or particle_end == len(text) or not HANGUL_PATTERN.match(text[particle_end])
+            ):
+                return particle_end
+        return end
+
+    def _is_word_end(self, text: str, end: int) -> bool:
+        """용어 끝이 단어 경계인지 (텍스트 끝, 한글이 아닌 문자, 또는 뒤에 조사만 붙은 경우)"""
+        return end == len(text) or not HANGUL_PATTERN.match(text[end]) or self._strip_particle(text, end, len(text)) > end
+
+    def match(self, text: str) -> List[Dict[str, Any]]:
+        """
+        단어 경계에서 시작하는 용어를 가장 긴 것부터 겹치지 않게 선택 - [{start, end, term, entry}]
+        단어 중간의 용어(파인애플의 '애플', 근현대의 '현대')는 제외하고,
+        붙여 쓴 용어(삼성전자주가)는 단어 끝까지 용어로만 이어질 때 인정 ('주식회사'의 '주식'은 제외)
+        """
+        by_start: Dict[int, List[tuple]] = {}
+        for start, end, index in self._matcher.find_spans(text):
+            by_start.setdefault(start, []).append((end, index))
+        for candidates in by_start.values():
+            candidates.sort(key=lambda candidate: -candidate[0])
+
+        chains: Dict[int, Optional[List[tuple]]] = {}
+
+        def chain(start: int) -> Optional[List[tuple]]:
+            """start에서 시작해 단어 끝까지 용어로만 이어지는 조합 (긴 용어 우선)"""
+            if start not in chains:
+                chains[start] = None
+                for end, index in by_start.get(start, []):
+                    if self._is_word_end(text, end):
+                        chains[start] = [(start, end, index)]
+                        break
+                    rest = chain(end)
+                    if rest:
+                        chains[start] = [(start, end, index)] + rest
+                        break
+            return chains[start]
+
+        selected = []
+        position = 0
+        while position < len(text):
+            if position == 0 or not HANGUL_PATTERN.match(text[position - 1]):
+                found = chain(position)
+                if found:
+                    for start, end, index in found:
+                        selected.append({"start": start, "end": end, "term": self._terms[index],
+                                         "entry": self.entries[self._term_entry[index]]})
+                    position = found[-1][1]
+                    continue
+            position += 1
+
+        # 조사 제거 (다음 용어 시작 전까지만)
+        for i, item in enumerate(selected):
+            next_start = selected[i + 1]["start"] if i + 1 < len(selected) else len(text)
+            item["end"] = self._strip_particle(text, item["end"], next_start)
+        return selected
+
+    def _render(self, text: str, matches: List[Dict[str, Any]], choices: List[str]) -> str:
+        parts = []
+        position = 0
+        for item, english in zip(matches, choices):
+            parts.append(text[position:item["start"]])
+            parts.append(f" {english} ")
+            position = item["end"]
+        parts.append(text[position:])
+        return " ".join("".join(parts).split())
+
+    def translate(self, text: str) -> Dict[str, Any]:
+        """
+        대표 번역어로 변환
+        반환: {"text", "matches", "fully_translated"} - fully_translated면 남은 한글이 없어 LLM 번역이 필요 없음
+        """
+        matches = self.match(text)
+        translated = self._render(text, matches, [item["entry"]["en"][0] for item in matches])
+        return {
+            "text": translated,
+            "matches": [{"term": item["term"], "en": item["entry"]["en"], "type": item["entry"].get("type")}
+                        for item in matches],
+            "fully_translated": not HANGUL_PATTERN.search(translated)
+        }
+
+    def expand(self, text: str, max_variants: int = 6) -> List[str]:
+        """용어별 번역어 조합으로 검색어 변형 생성 (대표 번역어 조합이 먼저)"""
+        matches = self.match(text)
+        if not matches:
+            return [text]
+
+        alternatives = [item["entry"]["en"] for item in matches]
+        # 대체 번역어를 적게 쓴 조합부터 (인덱스 합이 작은 순으로 필요한 만큼만 생성)
+        start = tuple(0 for _ in alternatives)
+        heap = [(0, start)]
+        seen = {start}
+        variants = []
+        while heap and len(variants) < max_variants:
+            _, combo = heapq.heappop(heap)
+            variant = self._render(text, matches, [alternatives[i][choice] for i, choice in enumerate(combo)])
+            if variant not in variants:
+                variants.append(variant)
+            for i, choice in enumerate(combo):
+                if choice + 1 < len(alternatives[i]):
+                    next_combo = combo[:i] + (choice + 1,) + combo[i + 1:]
+                    if next_combo not in seen:
+                        seen.add(next_combo)
+                        heapq.heappush(heap, (sum(next_combo), next_combo))
+        return variants
+
+
+# 전역 어휘 사전 (한 번 로드해 공유)
+bilingual_lexicon = BilingualLexicon()
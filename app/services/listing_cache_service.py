@@ -0,0 +1,137 @@
+"""
+Reddit 검색 목록 캐시
+(정규화된 검색어, 서브레딧, 정렬, 기간) 단위로 검색 결과 게시물 목록을 짧게 보관
+TTL이 지난 뒤 일정 시간 동안은 기존 목록을 바로 돌려주고 백그라운드에서 갱신 (stale-while-revalidate)
+"""
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Dict, Optional, Any, Tuple
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.report_cache_service import normalize_query
+
+logger = logging.getLogger(__name__)
+
+ListingKey = Tuple[str, str, str, str]
+
+
+class RedditListingCache:
+    def __init__(self, ttl_seconds: int = None, stale_seconds: int = None, max_entries: int = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.REDDIT_LISTING_CACHE_TTL_SECONDS
+        self.stale_seconds = stale_seconds if stale_seconds is not None else settings.REDDIT_LISTING_CACHE_STALE_SECONDS
+        self.max_entries = max_entries or settings.REDDIT_LISTING_CACHE_MAX_ENTRIES
+        # 키 → {"posts", "limit", "fetched_at"} (LRU 순서)
+        self._entries: "OrderedDict[ListingKey, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 같은 키를 동시에 조회할 때 한 번만 요청 (키 → 완료 이벤트)
+        self._inflight: Dict[ListingKey, threading.Event] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "coalesced": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(query: str, sort: str, time_filter: str, subreddit: str = "all") -> ListingKey:
+        return (normalize_query(query), subreddit.lower(), sort, time_filter)
+
+    def _usable(self, entry: Dict[str, Any], limit: int) -> bool:
+        """더 큰 limit으로 받아둔 목록이거나, 결과가 limit보다 적게 끝난 목록이면 재사용 가능"""
+        return entry["limit"] >= limit or len(entry["posts"]) < entry["limit"]
+
+    def _store(self, key: ListingKey, posts: List[PostBase], limit: int) -> None:
+        with self._lock:
+            self._entries[key] = {"posts": posts, "limit": limit, "fetched_at": time.time()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _fetch(self, key: ListingKey, limit: int, fetch: Callable[[int], List[PostBase]]) -> List[PostBase]:
+        """요청 1회 (같은 키를 가져오는 중이면 그 결과를 기다림)"""
+        with self._lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self._inflight[key] = event
+        if not owner:
+            self._stats["coalesced"] += 1
+            event.wait(timeout=60)
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry and self._usable(entry, limit):
+                return entry["posts"][:limit]
+
+        try:
+            posts = fetch(limit)
+            self._store(key, posts, limit)
+            return posts
+        finally:
+            if owner:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                event.set()
+
+    def _refresh_in_background(self, key: ListingKey, limit: int, fetch: Callable[[int], List[PostBase]]) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+        self._stats["refreshes"] += 1
+
+        def run():
+            try:
+                self._fetch(key, limit, fetch)
+            except Exception as e:
+                logger.warning(f"Listing refresh failed for {key}: {e}")
+
+        # 호출한 작업의 컨텍스트(Reddit 요청 우선순위 등)를 그대로 이어받음
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), daemon=True, name="listing-refresh").start()
+
+    def get_or_fetch(self, query: str, sort: str, time_filter: str, limit: int,
+                     fetch: Callable[[int], List[PostBase]], subreddit: str = "all") -> List[PostBase]:
+        """
+        캐시된 목록 반환 - TTL 안이면 그대로, 유예 구간이면 기존 목록 반환 후 백그라운드 갱신,
+        그 외에는 fetch(limit)로 새로 가져옴
+        """
+        key = self.make_key(query, sort, time_filter, subreddit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._usable(entry, limit):
+                self._entries.move_to_end(key)
+            else:
+                entry = None
+
+        if entry:
+            age = time.time() - entry["fetched_at"]
+            if age < self.ttl_seconds:
+                self._stats["hits"] += 1
+                return entry["posts"][:limit]
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._stats["stale_hits"] += 1
+                self._refresh_in_background(key, entry["limit"], fetch)
+                return entry["posts"][:limit]
+
+        self._stats["misses"] += 1
+        return self._fetch(key, limit, fetch)[:limit]
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            **self._stats,
+            "hit_rate": round((self._stats["hits"] + self._stats["stale_hits"]) / lookups, 4) if lookups else 0.0
+        }
+
+
+# 전역 Reddit 검색 목록 캐시
+reddit_listing_cache = RedditListingCache()
@@ -1,27 +1,22 @@
 from typing import List, Optional
 from app.core.config import settings
 from app.schemas.schemas import PostBase
+from app.services.structured_report_service import structured_report_service, STRUCTURED_OUTPUT_INSTRUCTIONS
+from app.services.report_cache_service import fingerprint_posts
 import logging
-from openai import OpenAI
+from app.services.openai_gateway_service import openai_gateway
 from tenacity import retry, stop_after_attempt, wait_exponential
 import ssl
-import httpx
 
 logger = logging.getLogger(__name__)
 
 class LLMService:
     def __init__(self):
-        self.openai_client = None
-        if settings.OPENAI_API_KEY:
-            # SSL 검증을 비활성화한 HTTP 클라이언트 생성
-            http_client = httpx.Client(verify=False)
-            self.openai_client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                http_client=http_client
-            )
+        # 키 풀에 분산하는 공유 게이트웨이 (키가 없으면 None)
+        self.openai_client = openai_gateway
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def generate_report(self, query: str, posts: List[PostBase], report_length: str = "moderate") -> dict:
+    async def generate_report(self, query: str, posts: List[PostBase], report_length: str = "moderate", structured: Optional[bool] = None, model: Optional[str] = None) -> dict:
         if not self.openai_client:
             logger.warning("OpenAI client not initialized")
             return {
@@ -69,9 +64,21 @@ class LLMService:
             }
         }
         
+        if structured is None:
+            structured = settings.REPORT_STRUCTURED_OUTPUT
+        model = model or settings.REPORT_MODEL
+        
+        # 구조화 모드는 항상 상세 분석을 한 번 생성하고, 짧은 길이는 로컬에서 도출
+        requested_length = report_length
+        if structured:
+            report_length = "detailed"
+        
         config = report_configs.get(report_length, report_configs["moderate"])
         posts_text = self._format_posts_for_llm(posts, config['posts_limit'])
         
+        # 게시물 번호와 URL 매핑 생성
+        post_mappings = self._build_post_mappings(posts[:config['posts_limit']])
+        
         try:
             system_prompt = f"""당신은 Reddit 소셜미디어 분석 전문가입니다. 
 주어진 게시물들을 분석하여 {query}에 대한 보고서를 작성하세요.
@@ -105,8 +112,22 @@ YOU MUST USE [1], [2], [3] FORMAT FOR ALL REFERENCES."""
 - 절대 [뉴스 1], [루머 2] 같은 형식을 사용하지 마세요. 오직 [1], [2], [3] 형식만 사용합니다.
 - 게시물 번호는 위에 제공된 "게시물 1", "게시물 2" 순서와 일치해야 합니다."""
             
+            if structured:
+                # 같은 입력 집합의 상세 분석이 있으면 재사용 (다른 길이 요청은 LLM 호출 없음)
+                fingerprint = f"{model}:{fingerprint_posts(posts[:config['posts_limit']])}"
+                analysis = structured_report_service.get_analysis(fingerprint)
+                if analysis is None:
+                    analysis = self._generate_structured(system_prompt, user_prompt, config['max_tokens'], model)
+                    if analysis:
+                        structured_report_service.put_analysis(fingerprint, analysis)
+                if analysis:
+                    # 로컬 렌더링 - 마크다운과 report_links를 한 번에 생성
+                    return structured_report_service.derive(analysis, requested_length, post_mappings)
+                logger.warning("Structured report generation failed, falling back to markdown")
+                return await self.generate_report(query, posts, requested_length, structured=False, model=model)
+            
             response = self.openai_client.chat.completions.create(
-                model="gpt-4.1",
+                model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -127,21 +148,6 @@ YOU MUST USE [1], [2], [3] FORMAT FOR ALL REFERENCES."""
                 # 보고서 내용에 각주 추가
                 full_report = self._add_footnotes_to_report(full_report, posts[:config['posts_limit']])
             
-            # 게시물 번호와 URL 매핑 생성
-            post_mappings = []
-            for i, post in enumerate(posts[:config['posts_limit']], 1):
-                if post.url:
-                    post_mappings.append({
-                        "footnote_number": i,
-                        "url": post.url,
-                        "title": post.title,
-                        "score": post.score,
-                        "comments": post.comments,
-                        "created_utc": post.created_utc,
-                        "subreddit": post.subreddit,
-                        "author": post.author
-                    })
-            
             return {
                 "summary": summary,
                 "full_report": full_report,
@@ -155,6 +161,37 @@ YOU MUST USE [1], [2], [3] FORMAT FOR ALL REFERENCES."""
                 "full_report": str(e)
             }
     
+    def _generate_structured(self, system_prompt: str, user_prompt: str, max_tokens: int, model: str) -> Optional[dict]:
+        """JSON 모드로 구조화 보고서 생성"""
+        response = self.openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt + "\n" + STRUCTURED_OUTPUT_INSTRUCTIONS}
+            ],
+            temperature=0.3,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"}
+        )
+        return structured_report_service.parse(response.choices[0].message.content)
+    
+    def _build_post_mappings(self, posts: List[PostBase]) -> List[dict]:
+        """게시물 번호(각주)와 URL/메타데이터 매핑 생성"""
+        post_mappings = []
+        for i, post in enumerate(posts, 1):
+            if post.url:
+                post_mappings.append({
+                    "footnote_number": i,
+                    "url": post.url,
+                    "title": post.title,
+                    "score": post.score,
+                    "comments": post.comments,
+                    "created_utc": post.created_utc,
+                    "subreddit": post.subreddit,
+                    "author": post.author
+                })
+        return post_mappings
+    
     def _format_posts_for_llm(self, posts: List[PostBase], limit: int = 20) -> str:
         formatted_posts = []
         for i, post in enumerate(posts[:limit], 1):
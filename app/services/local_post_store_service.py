@@ -0,0 +1,312 @@
+"""
+로컬 게시물 저장소
+SQLite(WAL) + FTS5 전문 검색 인덱스에 게시물/댓글을 보관하고, 스트림별 체크포인트(마지막 fullname)를 기록
+스케줄별 증분 검색 워터마크(HN 등)도 같은 파일에 보관해 재시작/다른 워커에서도 이어서 수집
+관심 서브레딧 수집기와 수집 결과 아카이브가 같은 저장소를 사용
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    source TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    subreddit TEXT,
+    author TEXT,
+    title TEXT,
+    body TEXT,
+    url TEXT,
+    score INTEGER,
+    comments INTEGER,
+    created_utc REAL,
+    ingested_at REAL NOT NULL,
+    formatted INTEGER NOT NULL DEFAULT 0,
+    query TEXT,
+    PRIMARY KEY (source, post_id)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit_created ON posts(subreddit, created_utc);
+CREATE INDEX IF NOT EXISTS idx_posts_created ON posts(created_utc);
+
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id TEXT PRIMARY KEY,
+    post_id TEXT NOT NULL,
+    author TEXT,
+    body TEXT,
+    score INTEGER,
+    created_utc REAL
+);
+CREATE INDEX IF NOT EXISTS idx_comments_post ON comments(post_id, score);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    stream TEXT PRIMARY KEY,
+    fullname TEXT,
+    created_utc REAL,
+    updated_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS search_watermarks (
+    key TEXT PRIMARY KEY,
+    watermark INTEGER,
+    resume_before INTEGER,
+    resume_newest INTEGER,
+    updated_at REAL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, body, content='posts', content_rowid='rowid', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS posts_ai AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_ad AFTER DELETE ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_au AFTER UPDATE OF title, body ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+    INSERT INTO posts_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+END;
+"""
+
+# 이전 버전 파일에 없는 컬럼 (없으면 추가)
+MIGRATIONS = {
+    "formatted": "ALTER TABLE posts ADD COLUMN formatted INTEGER NOT NULL DEFAULT 0",
+    "query": "ALTER TABLE posts ADD COLUMN query TEXT",
+}
+
+SEARCH_ORDERS = {
+    "relevance": "rank, p.score DESC",
+    "score": "p.score DESC, rank",
+    "new": "p.created_utc DESC",
+}
+
+POST_COLUMNS = ("source", "post_id", "subreddit", "author", "title", "body", "url", "score", "comments",
+                "created_utc", "formatted", "query")
+
+FTS_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(query: str) -> str:
+    """검색어를 FTS5 MATCH 식으로 변환 (단어마다 따옴표 처리, 모든 단어 포함)"""
+    tokens = FTS_TOKEN_PATTERN.findall(query.lower())
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def format_post_content(body: str, score: int, comments: int, created_utc: float,
+                        top_comments: List[Dict[str, Any]]) -> str:
+    """저장된 게시물을 수집 결과와 같은 형식의 본문으로 변환"""
+    content_parts = []
+    if body:
+        content_parts.append(body[:1000])
+
+    meta = f"\n\n---\n"
+    meta += f"👍 Score: {score} | "
+    meta += f"💬 Comments: {comments} | "
+    meta += f"📅 Posted: {datetime.fromtimestamp(created_utc or 0).strftime('%Y-%m-%d %H:%M')}"
+    content_parts.append(meta)
+
+    if top_comments:
+        content_parts.append("\n\n🔥 Top Comments:")
+        for i, comment in enumerate(top_comments[:3], 1):
+            content_parts.append(f"{i}. [{comment['score']}] {comment['body'][:200]}...")
+
+    return "\n".join(content_parts)
+
+
+class LocalPostStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.LOCAL_STORE_PATH
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # 연결 하나를 잠금으로 보호해 여러 스레드에서 공유
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+
+    def _migrate(self) -> None:
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(posts)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(statement)
+        self._conn.commit()
+
+    def _insert_posts(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        이미 있으면 점수/댓글 수만 갱신
+        (수집 결과처럼 본문이 완성된 게시물이 들어오면 본문/검색어도 교체)
+        """
+        now = time.time()
+        self._conn.executemany(
+            f"""
+            INSERT INTO posts ({', '.join(POST_COLUMNS)}, ingested_at)
+            VALUES ({', '.join(':' + column for column in POST_COLUMNS)}, :ingested_at)
+            ON CONFLICT(source, post_id) DO UPDATE SET
+                score = excluded.score,
+                comments = excluded.comments,
+                body = CASE WHEN excluded.formatted THEN excluded.body ELSE posts.body END,
+                formatted = MAX(posts.formatted, excluded.formatted),
+                query = COALESCE(excluded.query, posts.query)
+            """,
+            [{**{column: None for column in POST_COLUMNS}, "formatted": 0, **row, "ingested_at": now} for row in rows]
+        )
+
+    def _insert_comments(self, rows: List[Dict[str, Any]]) -> None:
+        self._conn.executemany(
+            """
+            INSERT INTO comments (comment_id, post_id, author, body, score, created_utc)
+            VALUES (:comment_id, :post_id, :author, :body, :score, :created_utc)
+            ON CONFLICT(comment_id) DO UPDATE SET score = excluded.score
+            """,
+            rows
+        )
+
+    def upsert_posts(self, rows: List[Dict[str, Any]]) -> int:
+        """게시물 일괄 저장 (한 트랜잭션)"""
+        return self.write_batch(rows, [])[0]
+
+    def upsert_comments(self, rows: List[Dict[str, Any]]) -> int:
+        return self.write_batch([], rows)[1]
+
+    def write_batch(self, posts: List[Dict[str, Any]], comments: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """게시물과 댓글을 한 트랜잭션으로 저장"""
+        if not posts and not comments:
+            return 0, 0
+        with self._lock, self._conn:
+            if posts:
+                self._insert_posts(posts)
+            if comments:
+                self._insert_comments(comments)
+        return len(posts), len(comments)
+
+    def search(self, query: str, subreddits: Optional[List[str]] = None, since_utc: Optional[float] = None,
+               min_score: int = 0, limit: int = 25, source: Optional[str] = "reddit",
+               until_utc: Optional[float] = None, order: str = "relevance", offset: int = 0) -> List[Dict[str, Any]]:
+        """전문 검색 - 기본은 관련도(bm25) 순, 같은 관련도면 점수 순"""
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        sql = """
+            SELECT p.*, bm25(posts_fts, 2.0, 1.0) AS rank,
+                   snippet(posts_fts, 1, '[', ']', '…', 16) AS snippet
+            FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid
+            WHERE posts_fts MATCH ? AND COALESCE(p.score, 0) >= ?
+        """
+        params: List[Any] = [match, min_score]
+        if source:
+            sql += " AND p.source = ?"
+            params.append(source)
+        if subreddits:
+            sql += f" AND lower(p.subreddit) IN ({','.join('?' for _ in subreddits)})"
+            params.extend(subreddit.lower() for subreddit in subreddits)
+        if since_utc:
+            sql += " AND p.created_utc >= ?"
+            params.append(since_utc)
+        if until_utc:
+            sql += " AND p.created_utc < ?"
+            params.append(until_utc)
+        sql += f" ORDER BY {SEARCH_ORDERS.get(order, SEARCH_ORDERS['relevance'])} LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def top_comments(self, post_ids: List[str], per_post: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        if not post_ids:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT * FROM (
+                    SELECT c.*, ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY score DESC) AS position
+                    FROM comments c WHERE post_id IN ({','.join('?' for _ in post_ids)})
+                ) WHERE position <= ?
+                """,
+                [*post_ids, per_post]
+            ).fetchall()
+        comments: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            comments.setdefault(row["post_id"], []).append(dict(row))
+        return comments
+
+    def to_posts(self, rows: List[Dict[str, Any]]) -> List[PostBase]:
+        """저장된 행을 상위 댓글을 포함한 PostBase로 변환"""
+        comments = self.top_comments([row["post_id"] for row in rows])
+        return [
+            PostBase(
+                source=row["source"],
+                post_id=row["post_id"],
+                author=row["author"] or "[deleted]",
+                title=row["title"] or "",
+                # 수집 결과로 저장된 게시물은 본문이 이미 완성된 형식
+                content=row["body"] if row.get("formatted") else format_post_content(
+                    row["body"], row["score"], row["comments"], row["created_utc"], comments.get(row["post_id"], [])
+                ),
+                url=row["url"] or "",
+                score=row["score"],
+                comments=row["comments"],
+                created_utc=row["created_utc"],
+                subreddit=row["subreddit"]
+            )
+            for row in rows
+        ]
+
+    def get_checkpoint(self, stream: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM checkpoints WHERE stream = ?", (stream,)).fetchone()
+        return dict(row) if row else None
+
+    def set_checkpoint(self, stream: str, fullname: str, created_utc: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO checkpoints (stream, fullname, created_utc, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(stream) DO UPDATE SET fullname = excluded.fullname,
+                    created_utc = excluded.created_utc, updated_at = excluded.updated_at
+                """,
+                (stream, fullname, created_utc, time.time())
+            )
+
+    def get_search_watermark(self, key: str) -> Optional[Dict[str, Any]]:
+        """증분 검색 상태 {"watermark", "resume_before", "resume_newest"} (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM search_watermarks WHERE key = ?", (key,)).fetchone()
+        return dict(row) if row else None
+
+    def set_search_watermark(self, key: str, watermark: Optional[int], resume_before: Optional[int] = None,
+                             resume_newest: Optional[int] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO search_watermarks (key, watermark, resume_before, resume_newest, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET watermark = excluded.watermark,
+                    resume_before = excluded.resume_before, resume_newest = excluded.resume_newest,
+                    updated_at = excluded.updated_at
+                """,
+                (key, watermark, resume_before, resume_newest, time.time())
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            posts = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            comments = self._conn.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+            checkpoints = [dict(row) for row in self._conn.execute("SELECT * FROM checkpoints").fetchall()]
+        return {"path": self.path, "posts": posts, "comments": comments, "checkpoints": checkpoints}
+
+
+# 전역 로컬 게시물 저장소
+local_post_store = LocalPostStore()
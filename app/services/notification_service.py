@@ -4,7 +4,7 @@ Firebase Cloud Messaging (FCM)을 사용하여 모바일 앱에 푸시 알림 
 """
 import os
 import json
-import httpx
+from app.services.http_client_service import http_client_registry
 from typing import Optional, Dict
 import logging
 from google.oauth2 import service_account
@@ -111,20 +111,20 @@ class NotificationService:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.fcm_api_url,
-                    headers=headers,
-                    json=message
-                )
+            client = http_client_registry.get_client(self.fcm_api_url)
+            response = await client.post(
+                self.fcm_api_url,
+                headers=headers,
+                json=message
+            )
+            
+            if response.status_code == 200:
+                logger.info(f"Push notification sent successfully to {token[:10]}...")
+                return True
+            else:
+                logger.error(f"Failed to send push notification: {response.text}")
+                return False
                 
-                if response.status_code == 200:
-                    logger.info(f"Push notification sent successfully to {token[:10]}...")
-                    return True
-                else:
-                    logger.error(f"Failed to send push notification: {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"Error sending push notification: {e}")
             return False
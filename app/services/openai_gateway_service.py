@@ -0,0 +1,73 @@
+"""
+OpenAI 게이트웨이
+OpenAI 클라이언트와 같은 chat.completions.create 인터페이스로 호출을 받아 키 풀에 분산하고,
+429를 받으면 해당 키를 백오프한 뒤 다른 키로 재시도
+"""
+import logging
+from typing import Any, Callable, Dict
+import httpx
+import openai
+from openai import OpenAI
+from app.services.credential_pool_service import openai_credential_pool, CredentialPool
+
+logger = logging.getLogger(__name__)
+
+
+class _Completions:
+    def __init__(self, gateway: "OpenAIGateway"):
+        self._gateway = gateway
+
+    def create(self, **kwargs) -> Any:
+        return self._gateway.call(lambda client: client.chat.completions.create(**kwargs))
+
+
+class _Chat:
+    def __init__(self, gateway: "OpenAIGateway"):
+        self.completions = _Completions(gateway)
+
+
+class OpenAIGateway:
+    def __init__(self, pool: CredentialPool):
+        self.pool = pool
+        self._clients: Dict[str, OpenAI] = {}
+        self.chat = _Chat(self)
+
+    def _client(self, credential) -> OpenAI:
+        client = self._clients.get(credential.id)
+        if client is None:
+            # SSL 검증을 비활성화한 HTTP 클라이언트 생성
+            client = OpenAI(
+                api_key=credential.values["api_key"],
+                http_client=httpx.Client(verify=False),
+                # 키가 여러 개면 같은 키로 재시도하지 않고 게이트웨이가 다른 키로 넘김
+                max_retries=0 if len(self.pool) > 1 else 2
+            )
+            self._clients[credential.id] = client
+        return client
+
+    def call(self, request: Callable[[OpenAI], Any]) -> Any:
+        """키를 바꿔가며 요청 (모든 키가 실패하면 마지막 오류 전달)"""
+        last_error = None
+        for _ in range(max(1, len(self.pool))):
+            credential = self.pool.acquire()
+            if credential is None:
+                raise RuntimeError("OpenAI API key is not configured")
+            try:
+                response = request(self._client(credential))
+                self.pool.report_success(credential)
+                return response
+            except openai.RateLimitError as e:
+                retry_after = e.response.headers.get("retry-after") if e.response is not None else None
+                self.pool.report_rate_limited(credential, float(retry_after) if retry_after else None)
+                last_error = e
+            except (openai.APIConnectionError, openai.AuthenticationError) as e:
+                self.pool.report_error(credential)
+                last_error = e
+            finally:
+                self.pool.release(credential)
+            logger.info(f"🔁 OpenAI 요청 다른 키로 재시도 | 실패 키: {credential.label}")
+        raise last_error
+
+
+# 전역 OpenAI 게이트웨이 (키가 없으면 None)
+openai_gateway = OpenAIGateway(openai_credential_pool) if len(openai_credential_pool) else None
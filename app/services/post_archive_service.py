@@ -0,0 +1,161 @@
+"""
+수집 게시물 아카이브
+요청마다 수집한 모든 게시물(과 상위 댓글)을 로컬 저장소(SQLite FTS5)에 쌓아 과거 키워드 검색에 사용
+요청 경로를 막지 않도록 버퍼에 모았다가 백그라운드 스레드가 한 트랜잭션으로 일괄 저장
+"""
+import logging
+import threading
+import time
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.local_post_store_service import local_post_store
+
+logger = logging.getLogger(__name__)
+
+
+class PostArchive:
+    def __init__(self):
+        self.enabled = settings.ARCHIVE_ENABLED
+        self.batch_size = settings.ARCHIVE_BATCH_SIZE
+        self.flush_seconds = settings.ARCHIVE_FLUSH_SECONDS
+        self._posts: List[Dict[str, Any]] = []
+        self._comments: List[Dict[str, Any]] = []
+        self._cond = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"posts": 0, "comments": 0, "batches": 0, "errors": 0, "last_batch_ms": 0.0}
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, daemon=True, name="post-archive-writer")
+            self._writer.start()
+
+    def add_posts(self, posts: List[PostBase], query: Optional[str] = None) -> None:
+        """수집 결과 게시물 저장 예약"""
+        if not self.enabled or not posts:
+            return
+        rows = [
+            {
+                "source": post.source,
+                "post_id": post.post_id,
+                "subreddit": post.subreddit,
+                "author": post.author,
+                "title": post.title,
+                "body": post.content,
+                "url": post.url,
+                "score": post.score,
+                "comments": post.comments,
+                "created_utc": post.created_utc,
+                "formatted": 1,
+                "query": query
+            }
+            for post in posts if post.post_id
+        ]
+        with self._cond:
+            self._posts.extend(rows)
+            self._ensure_writer()
+            if len(self._posts) + len(self._comments) >= self.batch_size:
+                self._cond.notify()
+
+    def add_comments(self, post_id: str, comments: List[Dict[str, Any]]) -> None:
+        """게시물의 상위 댓글 저장 예약 - [{id, author, body, score, created_utc}]"""
+        if not self.enabled or not comments:
+            return
+        rows = [
+            {
+                "comment_id": comment["id"],
+                "post_id": post_id,
+                "author": comment.get("author"),
+                "body": comment.get("body"),
+                "score": comment.get("score"),
+                "created_utc": comment.get("created_utc")
+            }
+            for comment in comments if comment.get("id")
+        ]
+        with self._cond:
+            self._comments.extend(rows)
+            self._ensure_writer()
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 게시물/댓글을 한 트랜잭션으로 저장"""
+        with self._cond:
+            posts, self._posts = self._posts, []
+            comments, self._comments = self._comments, []
+        if not posts and not comments:
+            return 0
+
+        started = time.perf_counter()
+        try:
+            local_post_store.write_batch(posts, comments)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"❌ 게시물 아카이브 저장 실패 ({len(posts)}개): {e}")
+            return 0
+        self._stats["posts"] += len(posts)
+        self._stats["comments"] += len(comments)
+        self._stats["batches"] += 1
+        self._stats["last_batch_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug(f"🗄️ 아카이브 저장 | 게시물: {len(posts)} | 댓글: {len(comments)} | {self._stats['last_batch_ms']}ms")
+        return len(posts)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and len(self._posts) + len(self._comments) < self.batch_size:
+                    self._cond.wait(timeout=self.flush_seconds)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def shutdown(self) -> None:
+        """남은 버퍼 저장 후 종료"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer:
+            self._writer.join(timeout=10)
+        self.flush()
+
+    def search(self, query: str, source: Optional[str] = None, subreddit: Optional[str] = None,
+               since_utc: Optional[float] = None, until_utc: Optional[float] = None, min_score: int = 0,
+               order: str = "relevance", limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """과거 수집 게시물 키워드 검색"""
+        rows = local_post_store.search(
+            query,
+            subreddits=[subreddit] if subreddit else None,
+            since_utc=since_utc,
+            until_utc=until_utc,
+            min_score=min_score,
+            limit=limit,
+            offset=offset,
+            source=source,
+            order=order
+        )
+        return [
+            {
+                "source": row["source"],
+                "post_id": row["post_id"],
+                "title": row["title"],
+                "snippet": row["snippet"],
+                "url": row["url"],
+                "author": row["author"],
+                "subreddit": row["subreddit"],
+                "score": row["score"],
+                "comments": row["comments"],
+                "created_utc": row["created_utc"],
+                "query": row["query"],
+                "rank": round(row["rank"], 6)
+            }
+            for row in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._posts) + len(self._comments)
+        return {"enabled": self.enabled, "pending": pending, **self._stats, "store": local_post_store.get_stats()}
+
+
+# 전역 게시물 아카이브
+post_archive = PostArchive()
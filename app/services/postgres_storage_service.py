@@ -0,0 +1,425 @@
+"""
+Postgres 저장소 백엔드 (asyncpg)
+PostgREST를 거치지 않고 커넥션 풀로 직접 연결
+- 쿼리는 고정 SQL이라 연결별 prepared statement 캐시가 재사용됨
+- 보고서 링크는 COPY로 일괄 저장, 보고서와 링크는 한 트랜잭션
+- 스케줄 선점은 FOR UPDATE SKIP LOCKED로 조회와 잠금을 한 문장에서 처리
+"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Any
+import asyncpg
+from app.core.config import settings
+from app.services.read_cache_service import decode_cursor, next_cursor, user_read_cache
+from app.services.storage_backend_service import StorageBackend
+from app.services.supabase_reports_service import extract_links_from_report
+
+logger = logging.getLogger(__name__)
+
+REPORT_LINK_COLUMNS = [
+    "report_id", "footnote_number", "url", "title", "score", "comments",
+    "created_utc", "subreddit", "author", "position_in_report"
+]
+
+SQL_INSERT_REPORT = """
+    INSERT INTO reports (id, user_nickname, query_text, full_report, summary, posts_collected, report_length, session_id)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    RETURNING *
+"""
+
+# 목록은 요약 컬럼만 (full_report는 상세 조회에서만), 최신순 + 같은 시각이면 id 순
+# idx_reports_user_created_cover (user_nickname, created_at DESC, id) 순서와 같음
+REPORT_SUMMARY_COLUMNS = "id, user_nickname, query_text, summary, posts_collected, report_length, session_id, created_at"
+
+SQL_USER_REPORTS = f"""
+    SELECT {REPORT_SUMMARY_COLUMNS} FROM reports
+    WHERE user_nickname = $1
+    ORDER BY created_at DESC, id
+    LIMIT $2
+"""
+
+SQL_USER_REPORTS_AFTER = f"""
+    SELECT {REPORT_SUMMARY_COLUMNS} FROM reports
+    WHERE user_nickname = $1 AND (created_at < $3 OR (created_at = $3 AND id > $4))
+    ORDER BY created_at DESC, id
+    LIMIT $2
+"""
+
+SQL_REPORT_BY_ID = "SELECT * FROM reports WHERE id = $1::uuid"
+
+SQL_REPORT_LINKS = "SELECT * FROM report_links WHERE report_id = $1::uuid ORDER BY position_in_report"
+
+# (created_at, id) 이후 링크 - since_id($2)가 없으면 created_at만 비교
+SQL_LINKS_SINCE = """
+    SELECT l.id, l.subreddit, l.created_at, l.report_id, r.query_text
+    FROM report_links l JOIN reports r ON r.id = l.report_id
+    WHERE l.subreddit IS NOT NULL
+      AND ($1::timestamptz IS NULL
+           OR (l.created_at >= $1::timestamptz AND (l.created_at > $1::timestamptz OR l.id > $2::uuid)))
+    ORDER BY l.created_at, l.id
+    LIMIT $3
+"""
+
+# 월별 파티션 미리 생성 (migrations/003 의 함수)
+SQL_ENSURE_PARTITIONS = """
+    SELECT ensure_monthly_partitions('reports'::regclass, now(), $1::integer) AS reports,
+           ensure_monthly_partitions('report_links'::regclass, now(), $1::integer) AS report_links
+"""
+
+SQL_DELETE_REPORT = "DELETE FROM reports WHERE id = $1::uuid AND user_nickname = $2 RETURNING id"
+
+SQL_REPORT_STATS = """
+    SELECT COUNT(*) AS total_reports,
+           COUNT(*) FILTER (WHERE created_at >= date_trunc('day', now())) AS recent_reports
+    FROM reports WHERE user_nickname = $1
+"""
+
+# 실행 시간이 된 스케줄을 한 문장으로 조회 + 선점 (다른 인스턴스가 잠근 행은 건너뜀)
+SQL_CLAIM_DUE_SCHEDULES = """
+    WITH due AS (
+        SELECT id FROM schedules
+        WHERE status = 'active' AND is_executing = false AND next_run <= now()
+        ORDER BY next_run
+        LIMIT $1
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE schedules s SET is_executing = true, updated_at = now()
+    FROM due WHERE s.id = due.id
+    RETURNING s.*
+"""
+
+SQL_RELEASE_SCHEDULE = """
+    UPDATE schedules SET is_executing = false, updated_at = now() WHERE id = $1 RETURNING *
+"""
+
+# 완료 수 증가와 상태/다음 실행 시간 계산을 한 번에 (조회 후 갱신 왕복 없음)
+SQL_UPDATE_AFTER_EXECUTION = """
+    UPDATE schedules SET
+        last_run = now(),
+        completed_reports = completed_reports + 1,
+        status = CASE WHEN completed_reports + 1 >= total_reports THEN 'completed' ELSE 'active' END,
+        next_run = CASE WHEN completed_reports + 1 >= total_reports THEN NULL
+                        ELSE now() + make_interval(mins => $2) END,
+        updated_at = now()
+    WHERE id = $1
+    RETURNING *
+"""
+
+SQL_UPDATE_NEXT_RUN = """
+    UPDATE schedules SET next_run = now() + make_interval(mins => $2), updated_at = now() WHERE id = $1 RETURNING *
+"""
+
+SQL_RESET_EXECUTING = """
+    UPDATE schedules SET is_executing = false, updated_at = now() WHERE is_executing = true RETURNING id
+"""
+
+SQL_INSERT_NOTIFICATION = """
+    INSERT INTO notifications (user_nickname, title, message, type, data)
+    VALUES ($1, $2, $3, $4, $5)
+    RETURNING *
+"""
+
+SCHEDULE_TIME_FIELDS = ("next_run", "last_run", "created_at", "updated_at")
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _row(record: asyncpg.Record) -> Dict[str, Any]:
+    """Supabase 응답과 같은 형태(문자열 시간/ID)의 dict로 변환"""
+    return {key: _to_json_value(value) for key, value in record.items()}
+
+
+def _schedule_row(record: asyncpg.Record) -> Dict[str, Any]:
+    """스케줄 시간은 기존 서비스처럼 UTC 기준 'Z' 형식"""
+    schedule = _row(record)
+    for field in SCHEDULE_TIME_FIELDS:
+        value = record.get(field)
+        if isinstance(value, datetime):
+            if value.tzinfo:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            schedule[field] = value.isoformat() + "Z"
+    return schedule
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # JSON 컬럼은 dict로 주고받음
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(type_name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+
+class PostgresStorageBackend(StorageBackend):
+    name = "postgres"
+
+    def __init__(self, dsn: Optional[str] = None):
+        self.dsn = dsn or settings.POSTGRES_DSN or settings.DATABASE_URL
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    async def pool(self) -> asyncpg.Pool:
+        """처음 사용할 때 커넥션 풀 생성"""
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self.dsn,
+                        min_size=settings.POSTGRES_POOL_MIN_SIZE,
+                        max_size=settings.POSTGRES_POOL_MAX_SIZE,
+                        # PgBouncer 트랜잭션 모드에서는 0으로 설정
+                        statement_cache_size=settings.POSTGRES_STATEMENT_CACHE_SIZE,
+                        server_settings={"timezone": "UTC"},
+                        init=_init_connection
+                    )
+                    logger.info(f"🐘 Postgres 커넥션 풀 생성 | {settings.POSTGRES_POOL_MIN_SIZE}~{settings.POSTGRES_POOL_MAX_SIZE}")
+        return self._pool
+
+    def _record(self, operation: str, started: float) -> None:
+        stats = self._stats.setdefault(operation, {"calls": 0, "total_ms": 0.0})
+        stats["calls"] += 1
+        stats["total_ms"] += (time.perf_counter() - started) * 1000
+
+    async def _fetch(self, operation: str, sql: str, *args) -> List[asyncpg.Record]:
+        started = time.perf_counter()
+        pool = await self.pool()
+        try:
+            return await pool.fetch(sql, *args)
+        finally:
+            self._record(operation, started)
+
+    # 보고서
+    async def save_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """보고서 + 링크를 한 트랜잭션으로 저장 (링크는 COPY)"""
+        started = time.perf_counter()
+        try:
+            report_id = uuid.uuid4()
+            links = report_data.get("report_links")
+            if links is None:
+                links = extract_links_from_report(
+                    report_data.get("full_report", ""),
+                    report_data.get("posts_metadata", [])
+                )
+
+            pool = await self.pool()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    record = await conn.fetchrow(
+                        SQL_INSERT_REPORT,
+                        report_id,
+                        report_data.get("user_nickname"),
+                        report_data.get("query_text"),
+                        report_data.get("full_report"),
+                        report_data.get("summary"),
+                        report_data.get("posts_collected", 0),
+                        report_data.get("report_length", "moderate"),
+                        report_data.get("session_id")
+                    )
+                    if links:
+                        await conn.copy_records_to_table(
+                            "report_links",
+                            columns=REPORT_LINK_COLUMNS,
+                            records=[
+                                (
+                                    report_id,
+                                    int(link["footnote_number"]),
+                                    link["url"],
+                                    link.get("title"),
+                                    link.get("score"),
+                                    link.get("comments"),
+                                    link.get("created_utc"),
+                                    link.get("subreddit"),
+                                    link.get("author"),
+                                    position
+                                )
+                                for position, link in enumerate(links)
+                            ]
+                        )
+
+            user_read_cache.invalidate("reports", report_data.get("user_nickname"))
+            logger.info(f"Report saved successfully: {report_id} (links: {len(links or [])})")
+            return {
+                "success": True,
+                "data": _row(record),
+                "report_id": str(report_id)
+            }
+        except Exception as e:
+            logger.error(f"Error saving report: {e}")
+            return {"success": False, "error": str(e), "message": str(e)}
+        finally:
+            self._record("save_report", started)
+
+    async def get_user_reports(self, user_nickname: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            after = decode_cursor(cursor)
+            if after:
+                records = await self._fetch(
+                    "get_user_reports", SQL_USER_REPORTS_AFTER,
+                    user_nickname, limit + 1, _parse_time(after[0]), uuid.UUID(after[1])
+                )
+            else:
+                records = await self._fetch("get_user_reports", SQL_USER_REPORTS, user_nickname, limit + 1)
+            rows = [_row(record) for record in records]
+            cursor = next_cursor(rows, limit)
+            return {"success": True, "data": rows, "count": len(rows), "next_cursor": cursor}
+        except Exception as e:
+            logger.error(f"Error retrieving reports: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_report_by_id(self, report_id: str) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch("get_report_by_id", SQL_REPORT_BY_ID, report_id)
+            if not rows:
+                return {"success": False, "error": "Report not found"}
+            return {"success": True, "data": _row(rows[0])}
+        except Exception as e:
+            logger.error(f"Error retrieving report: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_report_links(self, report_id: str) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch("get_report_links", SQL_REPORT_LINKS, report_id)
+            return {"success": True, "data": [_row(record) for record in rows]}
+        except Exception as e:
+            logger.error(f"Error retrieving report links: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_links_since(self, since: Optional[str] = None, since_id: Optional[str] = None,
+                              limit: int = 1000) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch("get_links_since", SQL_LINKS_SINCE, _parse_time(since), since_id, limit)
+            return {
+                "success": True,
+                "data": [
+                    {"id": str(record["id"]), "subreddit": record["subreddit"],
+                     "created_at": record["created_at"].isoformat(),
+                     "report_id": str(record["report_id"]), "query_text": record["query_text"]}
+                    for record in rows
+                ]
+            }
+        except Exception as e:
+            logger.error(f"Error retrieving links since {since}: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def delete_report(self, report_id: str, user_nickname: str) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch("delete_report", SQL_DELETE_REPORT, report_id, user_nickname)
+            if not rows:
+                return {"success": False, "error": "Failed to delete report or permission denied"}
+            user_read_cache.invalidate("reports", user_nickname)
+            return {"success": True, "data": [_row(record) for record in rows]}
+        except Exception as e:
+            logger.error(f"Error deleting report: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_report_stats(self, user_nickname: str) -> Dict[str, Any]:
+        try:
+            record = (await self._fetch("get_report_stats", SQL_REPORT_STATS, user_nickname))[0]
+            return {"success": True, "data": {"total_reports": record["total_reports"], "recent_reports": record["recent_reports"]}}
+        except Exception as e:
+            logger.error(f"Error retrieving report stats: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def ensure_report_partitions(self, months_ahead: int = 3) -> Dict[str, Any]:
+        try:
+            record = (await self._fetch("ensure_report_partitions", SQL_ENSURE_PARTITIONS, months_ahead))[0]
+            return {"success": True, "created": {"reports": record["reports"], "report_links": record["report_links"]}}
+        except asyncpg.UndefinedFunctionError as e:
+            return {"success": False, "skipped": True, "error": str(e)}
+        except Exception as e:
+            logger.error(f"Error ensuring report partitions: {e}")
+            return {"success": False, "error": str(e)}
+
+    # 스케줄러
+    async def claim_due_schedules(self, limit: int = 50) -> List[Dict[str, Any]]:
+        try:
+            rows = await self._fetch("claim_due_schedules", SQL_CLAIM_DUE_SCHEDULES, limit)
+            schedules = [_schedule_row(record) for record in rows]
+            if schedules:
+                logger.info(f"Claimed {len(schedules)} due schedules")
+            return schedules
+        except Exception as e:
+            logger.error(f"Error claiming schedules: {e}")
+            return []
+
+    async def _update_schedule(self, operation: str, sql: str, *args) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch(operation, sql, *args)
+            if not rows:
+                return {"success": False, "message": "Schedule not found"}
+            user_read_cache.invalidate("schedules", rows[0]["user_nickname"])
+            return {"success": True, "data": _schedule_row(rows[0])}
+        except Exception as e:
+            logger.error(f"Error in {operation}: {e}")
+            return {"success": False, "message": f"Error in {operation}: {str(e)}"}
+
+    async def release_schedule_lock(self, schedule_id: int) -> Dict[str, Any]:
+        return await self._update_schedule("release_schedule_lock", SQL_RELEASE_SCHEDULE, int(schedule_id))
+
+    async def update_schedule_after_execution(self, schedule_id: int, interval_minutes: int, report_id: str) -> Dict[str, Any]:
+        return await self._update_schedule(
+            "update_schedule_after_execution", SQL_UPDATE_AFTER_EXECUTION, int(schedule_id), int(interval_minutes)
+        )
+
+    async def update_next_run_only(self, schedule_id: int, interval_minutes: int) -> Dict[str, Any]:
+        return await self._update_schedule("update_next_run_only", SQL_UPDATE_NEXT_RUN, int(schedule_id), int(interval_minutes))
+
+    async def reset_all_executing_flags(self) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch("reset_all_executing_flags", SQL_RESET_EXECUTING)
+            logger.info(f"Reset {len(rows)} executing flags")
+            return {"success": True, "reset_count": len(rows)}
+        except Exception as e:
+            logger.error(f"Error resetting executing flags: {e}")
+            return {"success": False, "message": f"Error resetting executing flags: {str(e)}"}
+
+    async def create_notification(self, notification_data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            rows = await self._fetch(
+                "create_notification",
+                SQL_INSERT_NOTIFICATION,
+                notification_data.get("user_nickname"),
+                notification_data.get("title"),
+                notification_data.get("message"),
+                notification_data.get("type", "system"),
+                notification_data.get("data")
+            )
+            user_read_cache.invalidate("notifications", notification_data.get("user_nickname"))
+            return {"success": True, "data": _row(rows[0])}
+        except Exception as e:
+            logger.error(f"알림 생성 오류: {e}")
+            return {"success": False, "message": f"알림 생성 중 오류가 발생했습니다: {str(e)}"}
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        pool = None
+        if self._pool is not None:
+            pool = {"size": self._pool.get_size(), "idle": self._pool.get_idle_size(),
+                    "min_size": self._pool.get_min_size(), "max_size": self._pool.get_max_size()}
+        return {
+            "backend": self.name,
+            "pool": pool,
+            "operations": {
+                operation: {"calls": stats["calls"], "avg_ms": round(stats["total_ms"] / stats["calls"], 2)}
+                for operation, stats in self._stats.items() if stats["calls"]
+            }
+        }
@@ -0,0 +1,222 @@
+"""
+검색 쿼리 플래너
+확장 키워드마다 (검색어, 정렬, 기간, 대상) 작업을 만들어 기대 수확량이 높은 순서로 동시에 실행하고,
+조건을 만족하는 게시물이 목표 수에 도달하면 남은 작업은 건너뜀
+라우팅 인덱스에 근거가 있는 키워드는 r/all 대신 r/a+b+c 검색을 먼저 실행
+키워드 유형별로 실제 수확량을 학습해 다음 계획에 반영
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Callable, List, Dict, Optional, Any, Tuple
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+
+logger = logging.getLogger(__name__)
+
+# (정렬, 기간) 조합과 학습 전 기본 수확량 (요청 1회당 조건 충족 게시물 수)
+SEARCH_VARIANTS: Dict[Tuple[str, str], float] = {
+    ("relevance", "week"): 6.0,
+    ("top", "month"): 6.0,
+    ("hot", "week"): 4.0,
+    ("top", "week"): 4.0,
+}
+
+# 키워드 유형 분류용 단서 단어
+KEYWORD_CLASSES: Dict[str, List[str]] = {
+    "rumor": ["rumor", "rumour", "leak", "speculation", "controversy", "scandal"],
+    "finance": ["stock", "earnings", "price", "forecast", "outlook", "dividend", "revenue", "investment", "valuation"],
+    "news": ["news", "latest", "update", "announcement", "breaking", "launch", "release"],
+    "analysis": ["analysis", "review", "comparison", "opinion", "discussion"],
+}
+
+YIELD_EMA_ALPHA = 0.3
+
+# 라우팅된 검색의 학습 전 수확량 배수 (관련 커뮤니티만 검색하므로 r/all보다 높게 시작)
+ROUTED_PRIOR_BOOST = 1.5
+
+
+def classify_keyword(query: str) -> str:
+    words = query.lower().split()
+    for keyword_class, cues in KEYWORD_CLASSES.items():
+        if any(cue in words for cue in cues):
+            return keyword_class
+    return "general"
+
+
+class PlanTask:
+    def __init__(self, keyword: Dict[str, Any], sort: str, time_filter: str, expected_yield: float,
+                 subreddits: Optional[List[str]] = None):
+        self.keyword = keyword
+        self.query = keyword["query"]
+        self.keyword_class = classify_keyword(self.query)
+        self.sort = sort
+        self.time_filter = time_filter
+        self.expected_yield = expected_yield
+        self.subreddits = subreddits or []
+
+    @property
+    def subreddit(self) -> str:
+        """검색 대상 - "all" 또는 "a+b+c" """
+        return "+".join(self.subreddits) if self.subreddits else "all"
+
+    @property
+    def yield_key(self) -> str:
+        key = f"{self.keyword_class}|{self.sort}|{self.time_filter}"
+        return f"{key}|routed" if self.subreddits else key
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query": self.query,
+            "class": self.keyword_class,
+            "sort": self.sort,
+            "time_filter": self.time_filter,
+            "subreddit": self.subreddit,
+            "expected_yield": round(self.expected_yield, 2)
+        }
+
+
+class QueryPlanner:
+    def __init__(self, stats_path: Optional[str] = None):
+        self.stats_path = stats_path or settings.QUERY_PLANNER_STATS_PATH
+        self.concurrency = settings.QUERY_PLANNER_CONCURRENCY
+        self.max_requests = settings.QUERY_PLANNER_MAX_REQUESTS
+        self.min_score = settings.QUERY_PLANNER_MIN_SCORE
+        # "유형|정렬|기간" → 학습된 수확량
+        self._yields: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.stats_path and os.path.exists(self.stats_path):
+            try:
+                with open(self.stats_path, encoding="utf-8") as f:
+                    self._yields = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Query planner stats load failed: {e}")
+
+    def _save(self) -> None:
+        if not self.stats_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.stats_path) or ".", exist_ok=True)
+            with open(self.stats_path, "w", encoding="utf-8") as f:
+                json.dump(self._yields, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"Query planner stats save failed: {e}")
+
+    def _prior(self, task: PlanTask) -> float:
+        prior = SEARCH_VARIANTS[(task.sort, task.time_filter)]
+        return prior * ROUTED_PRIOR_BOOST if task.subreddits else prior
+
+    def expected_yield(self, task: PlanTask) -> float:
+        return self._yields.get(task.yield_key, self._prior(task))
+
+    def record_yield(self, task: PlanTask, qualifying: int) -> None:
+        """작업 결과로 수확량 갱신 (지수 이동 평균, 라우팅 검색은 따로 학습)"""
+        with self._lock:
+            previous = self._yields.get(task.yield_key, self._prior(task))
+            self._yields[task.yield_key] = round(previous + YIELD_EMA_ALPHA * (qualifying - previous), 3)
+
+    def build_plan(self, keywords: List[Dict[str, Any]],
+                   route: Optional[Callable[[str], List[str]]] = None) -> List[PlanTask]:
+        """
+        키워드 × (정렬, 기간) 작업을 기대 수확량 순으로 정렬 (상위 순위 키워드에 가중치)
+        route(query)가 서브레딧을 돌려주면 r/a+b+c 작업을 추가하고, r/all 작업은 부족분 보충용으로 남김
+        """
+        tasks = []
+        for keyword in keywords:
+            rank_weight = 1.0 / (1 + 0.15 * (keyword.get("rank", 1) - 1))
+            subreddits = route(keyword["query"]) if route else []
+            for sort, time_filter in SEARCH_VARIANTS:
+                for targets in ([subreddits, None] if subreddits else [None]):
+                    task = PlanTask(keyword, sort, time_filter, 0.0, targets)
+                    task.expected_yield = self.expected_yield(task) * rank_weight
+                    tasks.append(task)
+        tasks.sort(key=lambda task: task.expected_yield, reverse=True)
+        return tasks
+
+    async def execute(self, keywords: List[Dict[str, Any]],
+                      search: Callable[[str, str, str, str], List[PostBase]],
+                      target_total: Optional[int] = None,
+                      route: Optional[Callable[[str], List[str]]] = None,
+                      exclude_ids: Optional[set] = None) -> Dict[str, Any]:
+        """
+        계획 실행 - search(query, sort, time_filter, subreddit)는 요청 1회로 게시물 목록을 반환하는 동기 함수
+        exclude_ids: 이미 확보한 게시물 (다시 선택하지 않음)
+        반환: {"selected": {query: [PostBase]}, "routed_ids", "requests", "executed", "skipped", "plan"}
+        routed_ids: 라우팅된(r/a+b+c) 검색에서 선택된 게시물 - 라우팅 인덱스에 다시 반영하지 않음
+        """
+        plan = self.build_plan(keywords, route)
+        targets = {keyword["query"]: keyword.get("posts_to_collect", 10) for keyword in keywords}
+        target_total = target_total or sum(targets.values())
+        selected: Dict[str, List[PostBase]] = {keyword["query"]: [] for keyword in keywords}
+        seen_ids = set(exclude_ids or ())
+        routed_ids = set()
+        requests = 0
+        executed = []
+
+        def total() -> int:
+            return sum(len(posts) for posts in selected.values())
+
+        pending = list(plan)
+        while pending and total() < target_total and requests < self.max_requests:
+            # 아직 목표를 못 채운 키워드의 작업 중 상위 N개를 동시에 실행
+            wave = []
+            remaining = []
+            for task in pending:
+                if len(selected[task.query]) >= targets[task.query]:
+                    continue
+                if len(wave) < min(self.concurrency, self.max_requests - requests):
+                    wave.append(task)
+                else:
+                    remaining.append(task)
+            pending = remaining
+            if not wave:
+                break
+
+            results = await asyncio.gather(
+                *(asyncio.to_thread(search, task.query, task.sort, task.time_filter, task.subreddit) for task in wave),
+                return_exceptions=True
+            )
+            requests += len(wave)
+
+            for task, result in zip(wave, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error searching with query '{task.query}' ({task.sort}/{task.time_filter}, r/{task.subreddit}): {result}")
+                    continue
+
+                qualifying = 0
+                for post in sorted(result, key=lambda p: p.score or 0, reverse=True):
+                    if (post.score or 0) < self.min_score or post.post_id in seen_ids:
+                        continue
+                    qualifying += 1
+                    if len(selected[task.query]) < targets[task.query] and total() < target_total:
+                        seen_ids.add(post.post_id)
+                        selected[task.query].append(post)
+                        if task.subreddits:
+                            routed_ids.add(post.post_id)
+                self.record_yield(task, qualifying)
+                executed.append({**task.to_dict(), "qualifying": qualifying})
+
+        self._save()
+        skipped = len(plan) - len(executed)
+        routed = sum(1 for item in executed if item["subreddit"] != "all")
+        logger.info(f"🧭 쿼리 플랜 실행 | 요청: {requests}회 (라우팅 {routed}) | 실행: {len(executed)} | 건너뜀: {skipped} | 선택: {total()}/{target_total}")
+        return {
+            "selected": selected,
+            "routed_ids": routed_ids,
+            "requests": requests,
+            "executed": executed,
+            "skipped": skipped,
+            "plan": [task.to_dict() for task in plan]
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"yields": dict(self._yields), "concurrency": self.concurrency, "max_requests": self.max_requests}
+
+
+# 전역 쿼리 플래너
+query_planner = QueryPlanner()
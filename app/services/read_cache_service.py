@@ -0,0 +1,146 @@
+"""
+목록 조회 캐시
+사용자별 보고서/스케줄/알림 목록 응답을 짧은 TTL로 재사용하고, 쓰기가 일어나면 해당 사용자 항목을 무효화
+목록은 (생성 시각, id) 커서 기반 페이지로 조회 - 커서는 마지막 행의 두 값을 감싼 불투명 문자열
+"""
+import base64
+import copy
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Callable, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, Tuple]
+
+
+def encode_cursor(created_at: Any, row_id: Any) -> str:
+    """마지막 행의 (생성 시각, id)를 다음 페이지 커서로 변환"""
+    raw = json.dumps([str(created_at), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+    """커서를 (생성 시각, id)로 복원 (형식이 잘못되면 ValueError)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, row_id = json.loads(raw)
+        return str(created_at), str(row_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def next_cursor(rows: list, limit: int, time_field: str = "created_at") -> Optional[str]:
+    """limit + 1개를 조회한 결과에서 다음 페이지가 있으면 커서 반환 (rows는 limit개로 잘림)"""
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    return encode_cursor(rows[-1][time_field], rows[-1]["id"])
+
+
+class UserReadCache:
+    """
+    (namespace, 사용자, 조회 인자) → 응답
+    무효화 세대 번호로 조회 중에 쓰기가 끼어든 응답은 저장하지 않음
+    같은 프로세스 안의 쓰기만 무효화하므로 다른 인스턴스의 쓰기는 TTL 동안 늦게 보일 수 있음
+    """
+
+    def __init__(self, ttl_seconds: float = None, max_entries: int = None):
+        self.enabled = settings.READ_CACHE_ENABLED
+        self.ttl_seconds = ttl_seconds or settings.READ_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.READ_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._namespace_generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _generation(self, namespace: str, user_nickname: str) -> Tuple[int, int]:
+        return (self._namespace_generations.get(namespace, 0),
+                self._generations.get((namespace, user_nickname), 0))
+
+    def get(self, namespace: str, user_nickname: str, key: Tuple = ()) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        cache_key = (namespace, user_nickname, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[cache_key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            # 호출 측에서 응답을 수정해도 캐시에는 영향 없도록 복사본 반환
+            return copy.deepcopy(entry[1])
+
+    def put(self, namespace: str, user_nickname: str, key: Tuple, value: Any,
+            generation: Optional[Tuple[int, int]] = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation(namespace, user_nickname):
+                return
+            self._entries[(namespace, user_nickname, key)] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+            self._entries.move_to_end((namespace, user_nickname, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_load(self, namespace: str, user_nickname: str, key: Tuple, loader: Callable[[], Any]) -> Any:
+        """캐시에 없으면 loader(동기/비동기) 결과를 저장 - 실패 응답({"success": False})은 저장하지 않음"""
+        cached = self.get(namespace, user_nickname, key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            generation = self._generation(namespace, user_nickname)
+        result = loader()
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, dict) and result.get("success"):
+            self.put(namespace, user_nickname, key, result, generation)
+        return result
+
+    def invalidate(self, namespace: str, user_nickname: Optional[str] = None) -> int:
+        """사용자의 namespace 항목 삭제 (사용자를 모르면 namespace 전체)"""
+        with self._lock:
+            if user_nickname is None:
+                self._namespace_generations[namespace] = self._namespace_generations.get(namespace, 0) + 1
+                keys = [key for key in self._entries if key[0] == namespace]
+            else:
+                generation_key = (namespace, user_nickname)
+                self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+                keys = [key for key in self._entries if key[0] == namespace and key[1] == user_nickname]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += 1
+        if keys:
+            logger.debug(f"🧹 목록 캐시 무효화 | {namespace} | 사용자: {user_nickname or '전체'} | {len(keys)}개")
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl_seconds,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+                "invalidations": self._invalidations
+            }
+
+
+# 전역 목록 조회 캐시
+user_read_cache = UserReadCache()
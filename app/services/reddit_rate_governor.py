@@ -0,0 +1,210 @@
+"""
+Reddit 요청 속도 조절기
+응답의 X-Ratelimit-Remaining/Reset 헤더로 자격 증명별 남은 예산을 추적해 프로세스 전체 요청을 균등하게 분배
+대화형 검색을 스케줄 작업보다 먼저 처리하고, 스케줄 작업에는 대화형용 예비분을 남겨둠
+"""
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+from prawcore.requestor import Requestor
+from app.core.config import settings
+from app.services.credential_pool_service import reddit_credential_pool
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_SCHEDULED = "scheduled"
+
+# 현재 작업의 우선순위 (asyncio.to_thread로 넘겨도 유지됨)
+_current_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "reddit_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+class RedditRateGovernor:
+    def __init__(self, reserve: int = None, window_seconds: int = None):
+        self.reserve = reserve if reserve is not None else settings.REDDIT_RATE_INTERACTIVE_RESERVE
+        self.window_seconds = window_seconds or settings.REDDIT_RATE_WINDOW_SECONDS
+        self._cond = threading.Condition()
+        self._remaining: Optional[float] = None  # 헤더를 받기 전에는 알 수 없음
+        self._used: Optional[float] = None
+        self._reset_at = 0.0
+        self._last_grant = 0.0
+        self._in_flight = 0
+        self._waiting = {PRIORITY_INTERACTIVE: 0, PRIORITY_SCHEDULED: 0}
+        self._stats = {
+            priority: {"requests": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for priority in (PRIORITY_INTERACTIVE, PRIORITY_SCHEDULED)
+        }
+        self._throttled = 0
+
+    @contextmanager
+    def priority(self, priority: str):
+        """with 블록 안의 Reddit 요청 우선순위 지정 (모든 키의 조절기에 적용)"""
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def _delay(self, priority: str, now: float) -> float:
+        """지금 요청을 보내려면 더 기다려야 하는 시간 (0이면 바로 가능)"""
+        if now >= self._reset_at:
+            # 윈도우가 지났으면 예산이 다시 채워진 것으로 보고 새 헤더를 받을 때까지 허용
+            self._remaining = None
+
+        if priority == PRIORITY_SCHEDULED and self._waiting[PRIORITY_INTERACTIVE]:
+            return 0.05
+
+        if self._remaining is None:
+            return 0.0
+
+        usable = self._remaining - self._in_flight
+        if priority == PRIORITY_SCHEDULED:
+            usable -= self.reserve
+        seconds_to_reset = self._reset_at - now
+        if usable < 1:
+            return seconds_to_reset
+
+        # 남은 예산을 리셋까지 균등 분배
+        interval = seconds_to_reset / usable
+        return max(0.0, self._last_grant + interval - now)
+
+    def acquire(self, priority: Optional[str] = None) -> float:
+        """요청 슬롯 확보 (블로킹) - 대기한 시간(초) 반환"""
+        priority = priority or _current_priority.get()
+        started = time.monotonic()
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = self._delay(priority, now)
+                    if delay <= 0:
+                        break
+                    self._cond.wait(timeout=delay)
+            finally:
+                self._waiting[priority] -= 1
+
+            now = time.monotonic()
+            self._last_grant = now
+            self._in_flight += 1
+            waited = now - started
+            stats = self._stats[priority]
+            stats["requests"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+        if waited > 1:
+            logger.info(f"⏳ Reddit 속도 제한 대기 {waited:.2f}초 | 우선순위: {priority} | 남은 예산: {self._remaining}")
+        return waited
+
+    def release(self, headers: Optional[Dict[str, str]] = None, status_code: Optional[int] = None) -> None:
+        """요청 완료 - 응답 헤더로 남은 예산/리셋 시각 갱신"""
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            now = time.monotonic()
+            if headers and "x-ratelimit-remaining" in headers:
+                try:
+                    self._remaining = float(headers["x-ratelimit-remaining"])
+                    self._used = float(headers.get("x-ratelimit-used", 0))
+                    self._reset_at = now + float(headers.get("x-ratelimit-reset", self.window_seconds))
+                except ValueError:
+                    pass
+            if status_code == 429:
+                # 예산 소진 - 리셋까지 모든 요청 보류
+                self._throttled += 1
+                self._remaining = 0
+                if self._reset_at <= now:
+                    self._reset_at = now + float((headers or {}).get("x-ratelimit-reset", 60))
+                logger.warning(f"🚫 Reddit 429 응답 | {int(self._reset_at - now)}초 후 재개")
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            budget = None
+            utilization = None
+            if self._remaining is not None and self._used is not None:
+                budget = self._remaining + self._used
+                utilization = round(self._used / budget, 3) if budget else None
+            return {
+                "remaining": self._remaining,
+                "used": self._used,
+                "reset_in": round(max(0.0, self._reset_at - now), 1),
+                "budget_utilization": utilization,
+                "in_flight": self._in_flight,
+                "waiting": dict(self._waiting),
+                "throttled_429": self._throttled,
+                "interactive_reserve": self.reserve,
+                "by_priority": {
+                    priority: {
+                        "requests": stats["requests"],
+                        "avg_wait_seconds": round(stats["wait_seconds"] / stats["requests"], 3) if stats["requests"] else 0.0,
+                        "max_wait_seconds": round(stats["max_wait_seconds"], 3)
+                    }
+                    for priority, stats in self._stats.items()
+                }
+            }
+
+
+class GovernedRequestor(Requestor):
+    """praw 요청마다 자격 증명별 속도 조절기를 거치는 Requestor (토큰 발급 요청은 제외)"""
+
+    def __init__(self, *args, credential_id: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.governor = get_governor(credential_id)
+        self.credential = reddit_credential_pool.get(credential_id) if credential_id else None
+
+    def request(self, *args, **kwargs):
+        url = args[1] if len(args) > 1 else kwargs.get("url", "")
+        if not str(url).startswith(self.oauth_url):
+            return super().request(*args, **kwargs)
+
+        self.governor.acquire()
+        if self.credential:
+            reddit_credential_pool.begin(self.credential)
+        response = None
+        try:
+            response = super().request(*args, **kwargs)
+            return response
+        finally:
+            if response is not None:
+                self.governor.release(response.headers, response.status_code)
+            else:
+                self.governor.release()
+            if self.credential:
+                self._report(response)
+                reddit_credential_pool.release(self.credential)
+
+    def _report(self, response) -> None:
+        """키 풀에 결과 전달 - 429면 리셋까지 이 키만 백오프"""
+        if response is None:
+            reddit_credential_pool.report_error(self.credential)
+        elif response.status_code == 429:
+            reset = response.headers.get("x-ratelimit-reset")
+            reddit_credential_pool.report_rate_limited(self.credential, float(reset) if reset else None)
+        else:
+            reddit_credential_pool.report_success(self.credential)
+
+
+# 전역 Reddit 속도 조절기 (자격 증명마다 예산이 따로 있으므로 키별로 하나씩)
+reddit_rate_governor = RedditRateGovernor()
+_governors: Dict[str, RedditRateGovernor] = {}
+
+
+def get_governor(credential_id: Optional[str] = None) -> RedditRateGovernor:
+    if not credential_id:
+        return reddit_rate_governor
+    if credential_id not in _governors:
+        _governors[credential_id] = RedditRateGovernor()
+    return _governors[credential_id]
+
+
+def get_all_stats() -> Dict[str, Any]:
+    """자격 증명별 예산 사용률"""
+    if not _governors:
+        return {"default": reddit_rate_governor.get_stats()}
+    return {credential_id: governor.get_stats() for credential_id, governor in _governors.items()}
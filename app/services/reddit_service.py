@@ -2,44 +2,71 @@ import praw
 from typing import List, Dict, Optional
 from app.core.config import settings
 from app.schemas.schemas import PostBase
+from app.services.reddit_rate_governor import reddit_rate_governor, GovernedRequestor, PRIORITY_SCHEDULED
+from app.services.credential_pool_service import reddit_credential_pool
+from app.services.openai_gateway_service import openai_gateway
+from app.services.lexicon_service import bilingual_lexicon
+from app.services.listing_cache_service import reddit_listing_cache
+from app.services.subreddit_index_service import subreddit_index
+from app.services.firehose_service import subreddit_firehose
 import logging
 import asyncio
 from datetime import datetime
 import time
+import random
 import ssl
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import openai
-import re
 
 logger = logging.getLogger(__name__)
 
+# 자격 증명별 praw 클라이언트 (모든 RedditService 인스턴스가 공유)
+_reddit_clients: Dict[str, praw.Reddit] = {}
+
+
+def _get_reddit_client(credential) -> praw.Reddit:
+    """키 풀의 자격 증명으로 praw 클라이언트 생성 (처음 한 번만)"""
+    client = _reddit_clients.get(credential.id)
+    if client is not None:
+        return client
+    
+    # SSL 검증을 비활성화한 세션 생성
+    session = requests.Session()
+    session.verify = False
+    
+    # SSL 경고 비활성화
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    
+    client = praw.Reddit(
+        client_id=credential.values["client_id"],
+        client_secret=credential.values["client_secret"],
+        user_agent=settings.REDDIT_USER_AGENT,
+        timeout=30,
+        requestor_class=GovernedRequestor,  # 키별 속도 예산/백오프 추적
+        requestor_kwargs={'session': session, 'credential_id': credential.id}
+    )
+    _reddit_clients[credential.id] = client
+    
+    try:
+        # 연결 테스트
+        client.user.me()
+        logger.info(f"✅ Reddit 클라이언트 초기화 성공 | 키: {credential.id}")
+    except Exception as e:
+        logger.error(f"❌ Reddit 클라이언트 초기화 실패 | 키: {credential.id} | {e}")
+    
+    return client
+
+
 class RedditService:
-    def __init__(self):
-        self.reddit = None
-        if settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET:
-            try:
-                # SSL 검증을 비활성화한 세션 생성
-                session = requests.Session()
-                session.verify = False
-                
-                # SSL 경고 비활성화
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                
-                self.reddit = praw.Reddit(
-                    client_id=settings.REDDIT_CLIENT_ID,
-                    client_secret=settings.REDDIT_CLIENT_SECRET,
-                    user_agent=settings.REDDIT_USER_AGENT,
-                    timeout=30,
-                    requestor_kwargs={'session': session}
-                )
-                # 연결 테스트
-                self.reddit.user.me()
-                logger.info("✅ Reddit 클라이언트 초기화 성공")
-            except Exception as e:
-                logger.error(f"❌ Reddit 클라이언트 초기화 실패: {e}")
+    @property
+    def reddit(self) -> Optional[praw.Reddit]:
+        """접근할 때마다 가장 오래전에 제한된 키의 클라이언트 반환 (키가 없으면 None)"""
+        credential = reddit_credential_pool.select()
+        if credential is None:
+            return None
+        return _get_reddit_client(credential)
     
     def search_posts(self, query: str, limit: int = 25, sort: str = "relevance") -> List[PostBase]:
         """
@@ -56,66 +83,20 @@ class RedditService:
         
         posts = []
         try:
-            # 한글 검색어를 위한 키워드 매핑 (확장)
-            keyword_mapping = {
-                # 기업
-                "테슬라": ["Tesla", "TSLA"],
-                "애플": ["Apple", "AAPL"],
-                "삼성": ["Samsung"],
-                "구글": ["Google", "GOOGL"],
-                "아마존": ["Amazon", "AMZN"],
-                "메타": ["Meta", "META", "Facebook"],
-                "엔비디아": ["NVIDIA", "NVDA"],
-                
-                # 인물
-                "일런머스크": ["Elon Musk", "Musk"],
-                "트럼프": ["Trump", "Donald Trump"],
-                "바이든": ["Biden"],
-                
-                # 뉴스/정보
-                "뉴스": ["news", "update", "announcement"],
-                "최신뉴스": ["latest news", "breaking news", "recent news"],
-                "속보": ["breaking news", "breaking"],
-                "최신": ["latest", "recent", "new"],
-                
-                # 주식/금융
-                "주식": ["stock", "shares", "investment"],
-                "주가": ["stock price", "share price"],
-                "전망": ["forecast", "prediction", "outlook"],
-                "분석": ["analysis", "review"],
-                
-                # 여행/장소
-                "다낭": ["Da Nang", "Danang"],
-                "헬스장": ["gym", "fitness center"],
-                "숙소": ["hotel", "accommodation"],
-                
-                # 시간
-                "시간": ["hour", "hours"],
-                "이내": ["within", "in"],
-                "최근": ["recent", "latest"],
-            }
-            
-            # 한글 키워드를 영어로 변환
-            search_queries = []
+            # 어휘 사전으로 한글 용어를 영어로 변환 (번역어 조합으로 검색어 변형 생성)
             original_query = query
+            translation = bilingual_lexicon.translate(original_query)
+            # 사전에 없는 한글이 남으면 LLM 번역이 들어갈 자리를 남겨둠
+            search_queries = bilingual_lexicon.expand(original_query, max_variants=6 if translation["fully_translated"] else 2)
             
-            # 키워드 매핑 적용
-            for korean, english_list in keyword_mapping.items():
-                if korean in query:
-                    for eng in english_list:
-                        modified_query = query.replace(korean, eng)
-                        if modified_query not in search_queries:
-                            search_queries.append(modified_query)
+            # 사전에 없는 한글이 남아 있으면 원본 쿼리도 유지
+            if not translation["fully_translated"] and original_query not in search_queries:
+                search_queries.append(original_query)
             
-            # 원본 쿼리도 추가 (혹시 영어로 검색한 경우)
-            if not search_queries or query == original_query:
-                search_queries.append(query)
-            
-            # 한글이 포함된 경우 OpenAI를 사용해 번역
-            if re.search('[가-힣]', original_query) and len(search_queries) < 6:
+            # 사전으로 다 번역되지 않은 한글이 남은 경우에만 OpenAI로 번역
+            if openai_gateway and not translation["fully_translated"] and len(search_queries) < 6:
                 try:
-                    openai.api_key = settings.OPENAI_API_KEY
-                    response = openai.chat.completions.create(
+                    response = openai_gateway.chat.completions.create(
                         model="gpt-4.1",
                         messages=[
                             {"role": "system", "content": "You are a translator. Translate the Korean search query to English. Provide 3 different translations that would work well for Reddit search. Return only the translations separated by '|' without any explanation."},
@@ -141,32 +122,44 @@ class RedditService:
             logger.info(f"Original query: {original_query}")
             logger.info(f"Search queries: {search_queries}")
             
-            # 각 검색어로 검색 실행
-            all_submissions = []
-            seen_ids = set()
+            # 관심 서브레딧 로컬 저장소를 먼저 조회하고 부족한 만큼만 Reddit 검색
+            all_posts = subreddit_firehose.lookup(search_queries, limit)
+            seen_ids = {post.post_id for post in all_posts}
+            if all_posts:
+                logger.info(f"🚰 로컬 저장소 결과: {len(all_posts)}개")
             
+            # 각 검색어로 검색 실행 (검색 목록 캐시 경유)
             for search_query in search_queries:  # 모든 쿼리 실행 (최대 6개)
+                if len(all_posts) >= limit:
+                    break
                 try:
                     logger.debug(f"Searching Reddit with query: {search_query}")
-                    submissions = list(self.reddit.subreddit("all").search(
-                        search_query, 
-                        sort=sort, 
-                        time_filter="week",  # 최근 일주일
-                        limit=min(limit, 100)
-                    ))
+                    # 라우팅 인덱스에 근거가 있으면 관련 서브레딧만 검색
+                    # r/all은 라우팅 결과가 크게 부족하거나 탐색 표본으로 뽑힌 경우에만 추가 검색 (요청 수 두 배 방지)
+                    routed = subreddit_index.route(search_query)
+                    found = []
+                    if routed:
+                        found = self.search_listing(search_query, sort=sort, time_filter="week", limit=limit, subreddit="+".join(routed))
+                    if (not routed
+                            or len(found) < limit * settings.SUBREDDIT_ROUTE_FALLBACK_RATIO
+                            or random.random() < settings.SUBREDDIT_ROUTE_EXPLORE_RATE):
+                        unrouted = self.search_listing(search_query, sort=sort, time_filter="week", limit=limit)  # 최근 일주일
+                        # 라우팅된 결과를 다시 근거로 쌓으면 같은 서브레딧만 계속 강화되므로 r/all 결과만 반영
+                        subreddit_index.record(search_query, unrouted)
+                        found = found + unrouted
                     
                     # 중복 제거
-                    for sub in submissions:
-                        if sub.id not in seen_ids:
-                            all_submissions.append(sub)
-                            seen_ids.add(sub.id)
+                    for post in found:
+                        if post.post_id not in seen_ids:
+                            all_posts.append(post)
+                            seen_ids.add(post.post_id)
                     
-                    logger.debug(f"Found {len(submissions)} posts for query: {search_query}")
+                    logger.debug(f"Found {len(found)} posts for query: {search_query}")
                 except Exception as e:
                     logger.error(f"Error searching with query '{search_query}': {e}")
             
             # 결과가 없으면 더 넓은 범위로 재검색
-            if not all_submissions and search_queries:
+            if not all_posts and search_queries:
                 logger.info("No results found, trying broader search...")
                 # 첫 번째 영어 키워드로만 재검색
                 first_english_word = None
@@ -178,20 +171,32 @@ class RedditService:
                 if first_english_word:
                     logger.debug(f"Broader search with: {first_english_word}")
                     try:
-                        submissions = list(self.reddit.subreddit("all").search(
-                            first_english_word,
-                            sort="hot",
-                            time_filter="month",  # 더 넓은 시간 범위
-                            limit=min(limit, 50)
-                        ))
-                        all_submissions.extend(submissions)
+                        # 더 넓은 시간 범위
+                        all_posts.extend(self.search_listing(first_english_word, sort="hot", time_filter="month", limit=min(limit, 50)))
                     except Exception as e:
                         logger.error(f"Error in broader search: {e}")
             
-            # 검색 결과를 PostBase 객체로 변환
-            for submission in all_submissions[:limit]:
-                # 댓글 수와 점수 정보 추가
-                post = PostBase(
+            posts = all_posts[:limit]
+                
+            logger.info(f"📋 Reddit 검색 완료 | 키워드: '{original_query}' | 결과: {len(posts)}개")
+            
+        except praw.exceptions.APIException as e:
+            logger.error(f"⚠️ Reddit API 오류: {e}")
+        except Exception as e:
+            logger.error(f"❌ Reddit 검색 오류: {e}")
+        
+        return posts
+    
+    def search_listing(self, query: str, sort: str = "relevance", time_filter: str = "week", limit: int = 25,
+                       subreddit: str = "all") -> List[PostBase]:
+        """검색어 그대로 r/all(또는 r/a+b+c) 검색 (번역/재확장 없음, 짧은 TTL 캐시 - 창 안의 반복 검색은 Reddit 요청 없음)"""
+        if not self.reddit:
+            return []
+        
+        def fetch(fetch_limit: int) -> List[PostBase]:
+            posts = []
+            for submission in self.reddit.subreddit(subreddit).search(query, sort=sort, time_filter=time_filter, limit=min(fetch_limit, 100)):
+                posts.append(PostBase(
                     source="reddit",
                     post_id=submission.id,
                     author=str(submission.author) if submission.author else "[deleted]",
@@ -203,17 +208,10 @@ class RedditService:
                     comments=submission.num_comments,
                     created_utc=submission.created_utc,
                     subreddit=submission.subreddit.display_name
-                )
-                posts.append(post)
-                
-            logger.info(f"📋 Reddit 검색 완료 | 키워드: '{original_query}' | 결과: {len(posts)}개")
-            
-        except praw.exceptions.APIException as e:
-            logger.error(f"⚠️ Reddit API 오류: {e}")
-        except Exception as e:
-            logger.error(f"❌ Reddit 검색 오류: {e}")
+                ))
+            return posts
         
-        return posts
+        return reddit_listing_cache.get_or_fetch(query, sort, time_filter, min(limit, 100), fetch, subreddit=subreddit)
     
     def search_subreddit(self, subreddit_name: str, query: str, limit: int = 25) -> List[PostBase]:
         """특정 서브레딧에서 검색"""
@@ -247,28 +245,27 @@ class RedditService:
         return posts
     
     def get_trending_topics(self, subreddits: List[str] = None) -> List[Dict]:
-        """인기 토픽 가져오기"""
+        """인기 토픽 가져오기 (기본: 라우팅 인덱스에서 수확량이 가장 높은 서브레딧)"""
         if not self.reddit:
             return []
         
         if not subreddits:
-            subreddits = ["technology", "programming", "machinelearning", "artificial"]
+            subreddits = subreddit_index.top_subreddits(4)
         
         trending = []
         try:
-            for sub_name in subreddits:
-                subreddit = self.reddit.subreddit(sub_name)
-                hot_posts = list(subreddit.hot(limit=5))
+            # r/a+b+c+d 요청 한 번으로 조회
+            hot_posts = list(self.reddit.subreddit("+".join(subreddits)).hot(limit=5 * len(subreddits)))
+            
+            for post in hot_posts:
+                trending.append({
+                    "subreddit": post.subreddit.display_name,
+                    "title": post.title,
+                    "score": post.score,
+                    "comments": post.num_comments,
+                    "url": f"https://reddit.com{post.permalink}"
+                })
                 
-                for post in hot_posts:
-                    trending.append({
-                        "subreddit": sub_name,
-                        "title": post.title,
-                        "score": post.score,
-                        "comments": post.num_comments,
-                        "url": f"https://reddit.com{post.permalink}"
-                    })
-                    
         except Exception as e:
             logger.error(f"Error getting trending topics: {e}")
         
@@ -293,8 +290,7 @@ class RedditService:
         return "\n".join(content_parts)
     
     async def collect_reddit_posts(self, query: str, limit: int = 25) -> List[PostBase]:
-        """비동기 래퍼 메서드 - 스케줄러에서 사용"""
-        # 동기 메서드를 비동기로 래핑
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.search_posts, query, limit)
\ No newline at end of file
+        """비동기 래퍼 메서드 - 스케줄러에서 사용 (대화형 검색보다 낮은 우선순위)"""
+        # 동기 메서드를 스레드에서 실행 (to_thread는 우선순위 컨텍스트를 그대로 넘김)
+        with reddit_rate_governor.priority(PRIORITY_SCHEDULED):
+            return await asyncio.to_thread(self.search_posts, query, limit)
\ No newline at end of file
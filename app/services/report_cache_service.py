@@ -0,0 +1,158 @@
+"""
+최종 보고서 캐시 서비스
+정규화된 검색어 + 소스 + 보고서 길이 + 시간 버킷 + 구조화 출력 여부 단위로 생성된 보고서를 재사용
+"""
+import hashlib
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Tuple
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, Tuple[str, ...], str, int, bool]
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (유니코드 정규화, 소문자, 공백 정리)"""
+    text = unicodedata.normalize("NFKC", query or "").lower().strip()
+    return re.sub(r"\s+", " ", text)
+
+
+def fingerprint_posts(posts: List[PostBase]) -> str:
+    """보고서 입력 게시물 집합의 지문 (소스/게시물 ID 기준, 순서 무관)"""
+    ids = sorted(f"{post.source}:{post.post_id or post.url}" for post in posts)
+    return hashlib.sha1("\n".join(ids).encode("utf-8")).hexdigest()
+
+
+class ReportCacheService:
+    def __init__(self, bucket_minutes: int = None, max_entries: int = None):
+        self.bucket_minutes = bucket_minutes or settings.REPORT_CACHE_BUCKET_MINUTES
+        self.max_entries = max_entries or settings.REPORT_CACHE_MAX_ENTRIES
+        self.enabled = settings.REPORT_CACHE_ENABLED
+        # LRU 순서 유지 (가장 최근 사용 항목이 뒤쪽)
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def _make_key(self, query: str, sources: Optional[List[str]], report_length: str,
+                  structured: Optional[bool] = None, now: float = None) -> CacheKey:
+        bucket = int((now or time.time()) // (self.bucket_minutes * 60))
+        normalized_sources = tuple(sorted(set(s.lower() for s in (sources or []))))
+        # None이면 서버 설정(REPORT_STRUCTURED_OUTPUT)을 따르는 요청
+        structured = settings.REPORT_STRUCTURED_OUTPUT if structured is None else structured
+        return (normalize_query(query), normalized_sources, report_length or "moderate", bucket, bool(structured))
+
+    def get(self, query: str, sources: Optional[List[str]], report_length: str,
+            structured: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """캐시된 보고서 조회 (현재 시간 버킷, 같은 출력 방식의 항목만)"""
+        if not self.enabled:
+            return None
+
+        key = self._make_key(query, sources, report_length, structured)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        entry["hits"] += 1
+        logger.info(f"⚡ 보고서 캐시 적중 | 키워드: '{query}' | 길이: {report_length} | 적중 횟수: {entry['hits']}")
+        return entry
+
+    def find_analysis(self, query: str, sources: Optional[List[str]],
+                      structured: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """같은 버킷에서 다른 길이로 생성된 구조화 분석 항목 조회 (구조화 출력 요청의 길이별 보고서 도출용)"""
+        if not self.enabled:
+            return None
+
+        query_key, sources_key, _, bucket, structured_key = self._make_key(query, sources, None, structured)
+        if not structured_key:
+            return None
+        for key, entry in reversed(self._entries.items()):
+            if key[:2] == (query_key, sources_key) and key[3:] == (bucket, structured_key) \
+                    and entry["report_data"].get("analysis"):
+                return entry
+        return None
+
+    def put(self, query: str, sources: Optional[List[str]], report_length: str,
+            report_data: Dict[str, Any], posts: Optional[List[PostBase]], posts_metadata: List[Dict],
+            input_fingerprint: Optional[str] = None, posts_collected: Optional[int] = None,
+            structured: Optional[bool] = None) -> None:
+        """생성된 보고서를 캐시에 저장 (posts 대신 지문/게시물 수를 직접 넘길 수 있음)"""
+        if not self.enabled:
+            return
+
+        # 생성 실패 응답(post_mappings 없음)은 캐시하지 않음
+        if "post_mappings" not in report_data:
+            return
+
+        key = self._make_key(query, sources, report_length, structured)
+        self._entries[key] = {
+            "report_data": report_data,
+            "posts_metadata": posts_metadata,
+            "posts_collected": posts_collected if posts_collected is not None else len(posts),
+            "input_fingerprint": input_fingerprint or fingerprint_posts(posts),
+            "posts": posts,  # 캐시 적중 시에도 입력 스냅샷을 남길 수 있도록 보관
+            "created_at": time.time(),
+            "hits": 0
+        }
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        """지난 시간 버킷 항목과 용량 초과 항목 제거"""
+        current_bucket = int(time.time() // (self.bucket_minutes * 60))
+        for key in [k for k in self._entries if k[3] < current_bucket]:
+            del self._entries[key]
+            self._evictions += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, query: Optional[str] = None, report_length: Optional[str] = None) -> int:
+        """캐시 무효화 - 검색어/길이를 지정하지 않으면 전체 삭제"""
+        if query is None and report_length is None:
+            removed = len(self._entries)
+            self._entries.clear()
+        else:
+            normalized = normalize_query(query) if query is not None else None
+            keys = [
+                k for k in self._entries
+                if (normalized is None or k[0] == normalized)
+                and (report_length is None or k[2] == report_length)
+            ]
+            for key in keys:
+                del self._entries[key]
+            removed = len(keys)
+
+        self._invalidations += removed
+        logger.info(f"🗑️ 보고서 캐시 무효화 | 검색어: {query} | 길이: {report_length} | 삭제: {removed}개")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중률 등 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bucket_minutes": self.bucket_minutes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations
+        }
+
+
+# 전역 보고서 캐시 서비스
+report_cache_service = ReportCacheService()
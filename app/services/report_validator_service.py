@@ -0,0 +1,183 @@
+"""
+보고서 검증 서비스
+Aho-Corasick 다중 패턴 매칭으로 LLM 스트림을 한 번만 훑으면서 거부 응답/각주 누락을 조기 감지
+"""
+import logging
+import re
+from collections import deque
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 거부/실패 응답 지시어 (대소문자 무시)
+FAILURE_INDICATORS = [
+    "죄송합니다",
+    "작성할 수 없습니다",
+    "제공할 수 없습니다",
+    "생성할 수 없습니다",
+    "미래의 정보",
+    "실시간 정보에 접근할 수 없습니다",
+    "sorry",
+    "cannot provide",
+    "unable to",
+    "I can't",
+    "I cannot"
+]
+
+SUMMARY_SECTIONS = ["종합 요약", "종합요약"]
+MIN_REPORT_LENGTH = 1000
+
+CITATION_PATTERN = re.compile(r'\[\d+\]')
+
+
+class AhoCorasickMatcher:
+    """Aho-Corasick 오토마톤 - 여러 패턴을 입력 한 번 순회로 동시에 찾음 (청크 경계 넘어서도 상태 유지)"""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        # goto[state] = {문자: 다음 상태}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # BFS로 실패 링크 계산 (루트 자식의 실패 링크는 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+        self._state = 0
+
+    def reset(self):
+        """스트림 상태 초기화"""
+        self._state = 0
+
+    def feed(self, text: str) -> List[str]:
+        """텍스트 청크를 이어서 매칭하고 새로 발견된 패턴 목록 반환"""
+        self._state, matches = self._scan(text, self._state)
+        return matches
+
+    def search(self, text: str) -> List[str]:
+        """전체 텍스트를 독립적으로 검사 (스트림 상태에 영향 없음)"""
+        _, matches = self._scan(text, 0)
+        return matches
+
+    def find_spans(self, text: str) -> List[Tuple[int, int, int]]:
+        """겹치는 것을 포함한 모든 매칭 위치 - (시작, 끝, 패턴 인덱스)"""
+        spans = []
+        state = 0
+        for position, char in enumerate(text.lower()):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._output[state]:
+                spans.append((position + 1 - len(self.patterns[index]), position + 1, index))
+        return spans
+
+    def _scan(self, text: str, state: int) -> Tuple[int, List[str]]:
+        matches = []
+        for char in text.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._output[state]:
+                matches.append(self.patterns[index])
+        return state, matches
+
+
+class StreamingReportValidator:
+    """토큰 스트림을 받아 검증 실패가 확실해지는 즉시 중단 신호를 주는 검증기"""
+
+    def __init__(self, citation_deadline: Optional[int] = 1500):
+        # citation_deadline: 이 글자 수까지 [n] 각주가 하나도 없으면 실패로 판단 (None이면 검사 안 함)
+        self.citation_deadline = citation_deadline
+        self._matcher = AhoCorasickMatcher(FAILURE_INDICATORS)
+        self._chunks: List[str] = []
+        self._length = 0
+        self._has_citation = False
+        # 각주가 청크 경계에 걸쳐 들어오는 경우를 위한 꼬리 버퍼
+        self._tail = ""
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> Tuple[bool, str]:
+        """청크 추가 - (중단 여부, 사유) 반환"""
+        if not chunk:
+            return False, ""
+
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+        matches = self._matcher.feed(chunk)
+        if matches:
+            return True, f"거부 응답 감지: '{matches[0]}'"
+
+        if not self._has_citation:
+            window = self._tail + chunk
+            if CITATION_PATTERN.search(window):
+                self._has_citation = True
+            else:
+                self._tail = window[-8:]
+                if self.citation_deadline and self._length >= self.citation_deadline:
+                    return True, f"각주 누락: 처음 {self.citation_deadline}자 안에 [n] 각주가 없습니다"
+
+        return False, ""
+
+    def finish(self) -> Tuple[bool, str]:
+        """스트림 종료 후 길이/필수 섹션 최종 검증"""
+        text = self.text
+        if self._length < MIN_REPORT_LENGTH:
+            return False, "보고서가 너무 짧습니다"
+
+        if not any(section in text for section in SUMMARY_SECTIONS):
+            return False, "종합 요약 섹션이 없습니다"
+
+        return True, "검증 통과"
+
+
+class ReportValidatorService:
+    def __init__(self):
+        self._matcher = AhoCorasickMatcher(FAILURE_INDICATORS)
+
+    def validate(self, analysis_text: str) -> Tuple[bool, str]:
+        """완성된 보고서 검증 (실패 지시어는 한 번의 순회로 검사)"""
+        if len(analysis_text) < MIN_REPORT_LENGTH:
+            return False, "보고서가 너무 짧습니다"
+
+        matches = self._matcher.search(analysis_text)
+        if matches:
+            return False, f"거부 응답 감지: '{matches[0]}'"
+
+        if not any(section in analysis_text for section in SUMMARY_SECTIONS):
+            return False, "종합 요약 섹션이 없습니다"
+
+        return True, "검증 통과"
+
+    def create_stream_validator(self, citation_deadline: Optional[int] = 1500) -> StreamingReportValidator:
+        """스트리밍 생성용 검증기 생성"""
+        return StreamingReportValidator(citation_deadline=citation_deadline)
+
+
+# 전역 보고서 검증 서비스
+report_validator_service = ReportValidatorService()
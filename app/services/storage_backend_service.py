@@ -0,0 +1,148 @@
+"""
+저장소 백엔드
+보고서 저장/조회와 스케줄러 실행 경로(스케줄 선점, 실행 후 갱신, 알림)를 하나의 인터페이스로 묶고
+설정(STORAGE_BACKEND)에 따라 Supabase REST 또는 Postgres 직접 연결(asyncpg) 구현을 선택
+"""
+import logging
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional, Any
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StorageBackend(ABC):
+    """모든 메서드는 기존 Supabase 서비스와 같은 {"success": ...} 형식을 반환"""
+    name = "base"
+
+    # 보고서
+    @abstractmethod
+    async def save_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def get_user_reports(self, user_nickname: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """요약 컬럼(full_report 제외) 목록, 다음 페이지가 있으면 next_cursor 포함"""
+
+    @abstractmethod
+    async def get_report_by_id(self, report_id: str) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def get_report_links(self, report_id: str) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def get_links_since(self, since: Optional[str] = None, since_id: Optional[str] = None,
+                              limit: int = 1000) -> Dict[str, Any]:
+        """(created_at, id)가 (since, since_id)보다 뒤인 링크를 그 순서로 반환"""
+
+    @abstractmethod
+    async def delete_report(self, report_id: str, user_nickname: str) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def get_report_stats(self, user_nickname: str) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def ensure_report_partitions(self, months_ahead: int = 3) -> Dict[str, Any]:
+        """reports/report_links 월별 파티션 미리 생성 (migrations/003 적용 전이면 skipped)"""
+
+    # 스케줄러
+    @abstractmethod
+    async def claim_due_schedules(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """실행 시간이 된 스케줄을 선점(is_executing=True)하고 선점한 목록 반환"""
+
+    @abstractmethod
+    async def release_schedule_lock(self, schedule_id: int) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def update_schedule_after_execution(self, schedule_id: int, interval_minutes: int, report_id: str) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def update_next_run_only(self, schedule_id: int, interval_minutes: int) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def reset_all_executing_flags(self) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    async def create_notification(self, notification_data: Dict[str, Any]) -> Dict[str, Any]: ...
+
+    async def close(self) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """기존 Supabase REST 서비스에 위임"""
+    name = "supabase"
+
+    @property
+    def reports(self):
+        from app.services.supabase_reports_service import supabase_reports_service
+        return supabase_reports_service
+
+    @property
+    def schedules(self):
+        # Supabase 설정이 없으면 생성 시 예외가 나므로 사용할 때 import
+        from app.services.supabase_schedule_service import supabase_schedule_service
+        return supabase_schedule_service
+
+    async def save_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.reports.save_report(report_data)
+
+    async def get_user_reports(self, user_nickname: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        return await self.reports.get_user_reports(user_nickname, limit, cursor)
+
+    async def get_report_by_id(self, report_id: str) -> Dict[str, Any]:
+        return await self.reports.get_report_by_id(report_id)
+
+    async def get_report_links(self, report_id: str) -> Dict[str, Any]:
+        return await self.reports.get_report_links(report_id)
+
+    async def get_links_since(self, since: Optional[str] = None, since_id: Optional[str] = None,
+                              limit: int = 1000) -> Dict[str, Any]:
+        return await self.reports.get_links_since(since, since_id, limit)
+
+    async def delete_report(self, report_id: str, user_nickname: str) -> Dict[str, Any]:
+        return await self.reports.delete_report(report_id, user_nickname)
+
+    async def get_report_stats(self, user_nickname: str) -> Dict[str, Any]:
+        return await self.reports.get_report_stats(user_nickname)
+
+    async def ensure_report_partitions(self, months_ahead: int = 3) -> Dict[str, Any]:
+        return await self.reports.ensure_report_partitions(months_ahead)
+
+    async def claim_due_schedules(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """조회 후 스케줄마다 조건부 업데이트로 선점 (REST는 트랜잭션이 없어 요청 N+1회)"""
+        claimed = []
+        for schedule in (await self.schedules.get_schedules_to_execute())[:limit]:
+            if await self.schedules.try_acquire_schedule_lock(int(schedule["id"])):
+                claimed.append(schedule)
+        return claimed
+
+    async def release_schedule_lock(self, schedule_id: int) -> Dict[str, Any]:
+        return await self.schedules.release_schedule_lock(schedule_id)
+
+    async def update_schedule_after_execution(self, schedule_id: int, interval_minutes: int, report_id: str) -> Dict[str, Any]:
+        return await self.schedules.update_schedule_after_execution(schedule_id, interval_minutes, report_id)
+
+    async def update_next_run_only(self, schedule_id: int, interval_minutes: int) -> Dict[str, Any]:
+        return await self.schedules.update_next_run_only(schedule_id, interval_minutes)
+
+    async def reset_all_executing_flags(self) -> Dict[str, Any]:
+        return await self.schedules.reset_all_executing_flags()
+
+    async def create_notification(self, notification_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.schedules.create_notification_async(notification_data)
+
+
+def create_storage_backend() -> StorageBackend:
+    """설정에 맞는 저장소 백엔드 생성 (postgres는 asyncpg 필요)"""
+    if settings.STORAGE_BACKEND == "postgres":
+        from app.services.postgres_storage_service import PostgresStorageBackend
+        logger.info("🗄️ 저장소 백엔드: Postgres (asyncpg)")
+        return PostgresStorageBackend()
+    return SupabaseStorageBackend()
+
+
+# 전역 저장소 백엔드
+storage_backend = create_storage_backend()
@@ -0,0 +1,183 @@
+"""
+구조화 보고서 서비스
+LLM이 JSON(섹션 → 주장 → 인용 번호)으로 응답하면 로컬에서 마크다운과 report_links를 한 번에 생성
+"""
+import copy
+import json
+import logging
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+# 구조화 모드에서 프롬프트 뒤에 붙이는 출력 형식 지시문
+STRUCTURED_OUTPUT_INSTRUCTIONS = """
+**출력 형식: 반드시 아래 JSON 객체 하나만 출력하세요. 마크다운이나 설명을 덧붙이지 마세요.**
+{
+  "sections": [
+    {
+      "heading": "구체적인 주제 제목",
+      "kind": "topic",
+      "claims": [
+        {"text": "각주 번호 없이 작성한 한 문장의 주장", "citations": [1, 3]}
+      ]
+    }
+  ]
+}
+
+규칙:
+- kind는 "topic"(주제 섹션), "misc"(기타 정보들), "summary"(종합 요약) 중 하나입니다.
+- 마지막 섹션은 반드시 kind가 "summary"인 종합 요약입니다.
+- citations에는 근거가 된 게시물 번호(정수)만 넣고, text 안에는 [1] 같은 각주를 쓰지 마세요.
+- 게시물 번호는 위에 제공된 게시물 순서와 일치해야 합니다."""
+
+SECTION_TITLES = {
+    "misc": "기타 정보들",
+    "summary": "종합 요약",
+}
+
+# 상세 분석에서 짧은 보고서를 도출할 때 남길 분량 (None이면 전체 유지)
+CONDENSE_LIMITS = {
+    "simple": {"topic_sections": 3, "claims_per_section": 2},
+    "moderate": {"topic_sections": 5, "claims_per_section": 3},
+    "detailed": None,
+}
+
+
+class StructuredReportService:
+    def __init__(self, max_cached_analyses: int = 128):
+        # 입력 게시물 지문 → 상세 구조화 분석 (길이별 보고서가 공유)
+        self._analyses: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_cached_analyses = max_cached_analyses
+
+    def get_analysis(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """입력 집합에 대한 캐시된 상세 분석 조회"""
+        analysis = self._analyses.get(fingerprint)
+        if analysis is not None:
+            self._analyses.move_to_end(fingerprint)
+            logger.info(f"♻️ 상세 분석 재사용 | 지문: {fingerprint[:12]}")
+        return analysis
+
+    def put_analysis(self, fingerprint: str, analysis: Dict[str, Any]) -> None:
+        """상세 분석 캐시 저장"""
+        self._analyses[fingerprint] = analysis
+        self._analyses.move_to_end(fingerprint)
+        while len(self._analyses) > self.max_cached_analyses:
+            self._analyses.popitem(last=False)
+
+    def condense(self, data: Dict[str, Any], report_length: str) -> Dict[str, Any]:
+        """상세 분석에서 짧은 보고서용 분석을 로컬 추출 (같은 인용 번호 유지, LLM 호출 없음)"""
+        limits = CONDENSE_LIMITS.get(report_length)
+        if not limits:
+            return data
+
+        condensed = []
+        topic_count = 0
+        for section in data.get("sections", []):
+            if not isinstance(section, dict):
+                continue
+            kind = section.get("kind", "topic")
+            # 섹션은 인기순으로 정렬되어 있으므로 앞에서부터 남김
+            if kind == "topic":
+                if topic_count >= limits["topic_sections"]:
+                    continue
+                topic_count += 1
+            section = copy.copy(section)
+            section["claims"] = (section.get("claims") or [])[:limits["claims_per_section"]]
+            condensed.append(section)
+
+        return {**data, "sections": condensed}
+
+    def derive(self, analysis: Dict[str, Any], report_length: str, post_mappings: List[Dict]) -> Dict[str, Any]:
+        """상세 분석에서 요청 길이의 보고서를 렌더링 (원본 상세 분석은 결과에 그대로 보존)"""
+        result = self.render(self.condense(analysis, report_length), post_mappings)
+        result["analysis"] = analysis
+        return result
+
+    def parse(self, raw_text: str) -> Optional[Dict[str, Any]]:
+        """LLM 응답에서 구조화 보고서(JSON) 파싱"""
+        if not raw_text:
+            return None
+
+        text = raw_text.strip()
+        # ```json ... ``` 코드 블록으로 감싼 응답 처리
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+
+        try:
+            data = json.loads(text)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Structured report JSON parse failed: {e}")
+            return None
+
+        sections = data.get("sections") if isinstance(data, dict) else None
+        if not isinstance(sections, list) or not sections:
+            logger.warning("Structured report has no sections")
+            return None
+
+        return data
+
+    def render(self, data: Dict[str, Any], post_mappings: List[Dict]) -> Dict[str, Any]:
+        """구조화 보고서를 마크다운으로 렌더링하면서 사용된 인용 링크를 함께 수집 (단일 패스)"""
+        mapping_by_number = {m["footnote_number"]: m for m in post_mappings}
+
+        lines = []
+        report_links = []
+        used_numbers = set()
+        summary = None
+        section_number = 0
+
+        for section in data.get("sections", []):
+            if not isinstance(section, dict):
+                continue
+
+            kind = section.get("kind", "topic")
+            heading = SECTION_TITLES.get(kind) or (section.get("heading") or "").strip() or "주요 내용"
+            section_number += 1
+            lines.append(f"### {section_number}. {heading}")
+
+            for claim in section.get("claims") or []:
+                if isinstance(claim, str):
+                    claim = {"text": claim, "citations": []}
+                text = (claim.get("text") or "").strip()
+                if not text:
+                    continue
+
+                footnotes = ""
+                for number in claim.get("citations") or []:
+                    try:
+                        number = int(number)
+                    except (ValueError, TypeError):
+                        continue
+                    # 존재하지 않는 게시물 번호는 버림
+                    if number not in mapping_by_number:
+                        continue
+                    footnotes += f"[{number}]"
+                    if number not in used_numbers:
+                        used_numbers.add(number)
+                        report_links.append(mapping_by_number[number])
+
+                lines.append(f"- {text}{footnotes}")
+
+                if kind == "summary" and summary is None:
+                    summary = text
+
+            lines.append("")
+
+        full_report = "\n".join(lines).strip()
+        if summary is None:
+            summary = full_report.split('\n')[0]
+
+        return {
+            "summary": summary[:200],
+            "full_report": full_report,
+            "post_mappings": post_mappings,
+            "report_links": report_links,
+            "analysis": data  # 다른 길이 보고서 도출용 원본 구조
+        }
+
+
+# 전역 구조화 보고서 서비스
+structured_report_service = StructuredReportService()
@@ -0,0 +1,210 @@
+"""
+서브레딧 라우팅 인덱스
+검색어 단어(엔티티/주제어) → 조건을 만족하는 게시물이 실제로 나온 서브레딧 가중치를 로컬에 유지
+보고서에 인용된 링크(report_links.subreddit)와 수집 결과로 점진적으로 갱신하고,
+쿼리 플래너가 r/all 대신 r/a+b+c 검색으로 보낼 대상을 고를 때 사용
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+from typing import List, Dict, Optional, Any, Iterable
+from app.core.config import settings
+from app.schemas.schemas import PostBase
+from app.services.lexicon_service import bilingual_lexicon
+
+logger = logging.getLogger(__name__)
+
+# 라우팅에 쓰지 않는 단어
+STOPWORDS = {
+    "the", "and", "for", "with", "about", "from", "what", "how", "why", "are", "is", "of", "in", "on", "to",
+    "news", "latest", "update", "discussion", "analysis", "review", "opinion", "reddit", "2024", "2025", "2026",
+}
+
+# 인용된 링크는 단순 수집 결과보다 높은 가중치
+CITED_WEIGHT = 2.0
+COLLECTED_WEIGHT = 1.0
+
+# 인덱스가 비어 있을 때 사용하는 기본 인기 서브레딧
+DEFAULT_TRENDING_SUBREDDITS = ["technology", "programming", "machinelearning", "artificial"]
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9.&+-]*")
+
+
+def tokenize(query: str) -> List[str]:
+    """검색어를 라우팅용 단어로 분리 (한국어 용어는 어휘 사전으로 영어 변환)"""
+    text = bilingual_lexicon.translate(query)["text"].lower()
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text):
+        token = token.strip(".-")
+        if len(token) > 1 and token not in STOPWORDS and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+class SubredditIndex:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.SUBREDDIT_INDEX_PATH
+        self.max_subreddits = settings.SUBREDDIT_ROUTE_MAX_SUBREDDITS
+        self.min_evidence = settings.SUBREDDIT_ROUTE_MIN_EVIDENCE
+        self.min_score = settings.QUERY_PLANNER_MIN_SCORE
+        # 단어 → {서브레딧: 가중치}
+        self._terms: Dict[str, Dict[str, float]] = {}
+        # 서브레딧 → 누적 가중치 (인기 토픽용)
+        self._subreddits: Dict[str, float] = {}
+        # report_links 증분 갱신 기준 (마지막으로 반영한 링크의 created_at, id)
+        self._watermark: Optional[str] = None
+        self._watermark_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._load()
+
+    def _load(self) -> None:
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._terms = data.get("terms", {})
+                self._subreddits = data.get("subreddits", {})
+                self._watermark = data.get("watermark")
+                self._watermark_id = data.get("watermark_id")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Subreddit index load failed: {e}")
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps({"terms": self._terms, "subreddits": self._subreddits,
+                               "watermark": self._watermark, "watermark_id": self._watermark_id},
+                              ensure_ascii=False)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning(f"Subreddit index save failed: {e}")
+
+    def _add(self, tokens: Iterable[str], subreddit: str, weight: float) -> None:
+        subreddit = subreddit.lower()
+        for token in tokens:
+            counts = self._terms.setdefault(token, {})
+            counts[subreddit] = round(counts.get(subreddit, 0.0) + weight, 3)
+        self._subreddits[subreddit] = round(self._subreddits.get(subreddit, 0.0) + weight, 3)
+        self._dirty = True
+
+    def record(self, query: str, posts: List[PostBase]) -> int:
+        """수집 결과 반영 - 최소 점수 이상 게시물의 서브레딧을 검색어 단어에 연결"""
+        tokens = tokenize(query)
+        if not tokens:
+            return 0
+        added = 0
+        with self._lock:
+            for post in posts:
+                if post.subreddit and (post.score or 0) >= self.min_score:
+                    self._add(tokens, post.subreddit, COLLECTED_WEIGHT)
+                    added += 1
+        return added
+
+    def record_links(self, rows: List[Dict[str, Any]]) -> int:
+        """report_links 행 반영 - (created_at, id) 순서의 {"id", "subreddit", "created_at", "report_id", "query_text"}"""
+        added = 0
+        with self._lock:
+            for row in rows:
+                query = row.get("query_text")
+                if row.get("subreddit") and query:
+                    self._add(tokenize(query), row["subreddit"], CITED_WEIGHT)
+                    added += 1
+            if rows and rows[-1].get("created_at"):
+                self._watermark = rows[-1]["created_at"]
+                self._watermark_id = rows[-1].get("id")
+                self._dirty = True
+        return added
+
+    def route(self, query: str, max_subreddits: Optional[int] = None) -> List[str]:
+        """검색어에 맞는 서브레딧 (근거가 부족하면 빈 목록 → r/all 검색)"""
+        max_subreddits = max_subreddits or self.max_subreddits
+        scores: Dict[str, float] = {}
+        evidence: Dict[str, float] = {}
+        with self._lock:
+            for token in tokenize(query):
+                counts = self._terms.get(token)
+                if not counts:
+                    continue
+                # 여러 서브레딧에 흩어진 흔한 단어는 순위에 덜 반영
+                total = sum(counts.values())
+                for subreddit, weight in counts.items():
+                    scores[subreddit] = scores.get(subreddit, 0.0) + weight * (weight / total)
+                    evidence[subreddit] = evidence.get(subreddit, 0.0) + weight
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return [subreddit for subreddit in ranked if evidence[subreddit] >= self.min_evidence][:max_subreddits]
+
+    def top_subreddits(self, limit: int = 4) -> List[str]:
+        with self._lock:
+            ranked = sorted(self._subreddits.items(), key=lambda item: item[1], reverse=True)
+        return [subreddit for subreddit, _ in ranked[:limit]] or DEFAULT_TRENDING_SUBREDDITS[:limit]
+
+    async def refresh_from_reports(self, page_size: int = 1000) -> int:
+        """마지막 갱신 이후 저장된 report_links를 페이지 단위로 끝까지 가져와 반영 (저장은 한 번)"""
+        from app.services.storage_backend_service import storage_backend
+
+        added = 0
+        try:
+            while True:
+                result = await storage_backend.get_links_since(self._watermark, self._watermark_id, limit=page_size)
+                if not result.get("success"):
+                    break
+                rows = result["data"]
+                added += self.record_links(rows)
+                # 마지막 페이지 (limit보다 적게 옴)
+                if len(rows) < page_size:
+                    break
+        finally:
+            self.save()
+        if added:
+            logger.info(f"🧭 서브레딧 인덱스 갱신 | 새 링크: {added}개 | 단어: {len(self._terms)}개")
+        return added
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_from_reports()
+            except Exception as e:
+                logger.error(f"Subreddit index refresh failed: {e}")
+            await asyncio.sleep(settings.SUBREDDIT_INDEX_REFRESH_SECONDS)
+
+    def start(self) -> None:
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        self.save()
+
+    def get_stats(self, query: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "terms": len(self._terms),
+                "subreddits": len(self._subreddits),
+                "watermark": self._watermark,
+                "top_subreddits": sorted(self._subreddits.items(), key=lambda item: item[1], reverse=True)[:limit]
+            }
+        if query:
+            stats["query"] = query
+            stats["tokens"] = tokenize(query)
+            stats["route"] = self.route(query)
+        return stats
+
+
+# 전역 서브레딧 라우팅 인덱스
+subreddit_index = SubredditIndex()
@@ -8,12 +8,66 @@ import uuid
 import re
 import ssl
 import urllib3
+from app.services.read_cache_service import decode_cursor, next_cursor, user_read_cache
 
 # SSL 검증 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# 목록 조회에서 가져오는 컬럼 (full_report는 상세 조회에서만)
+REPORT_SUMMARY_COLUMNS = "id, user_nickname, query_text, summary, posts_collected, report_length, session_id, created_at"
+
+def extract_links_from_report(full_report: str, posts_metadata: List[Dict]) -> List[Dict]:
+    """보고서에서 링크 추출 (저장소 구현 공통)"""
+    links = []
+
+    # posts_metadata가 이미 footnote_number를 포함하고 있는 경우 (새 형식)
+    if posts_metadata and isinstance(posts_metadata[0], dict) and 'footnote_number' in posts_metadata[0]:
+        # 보고서에 실제로 사용된 각주 번호만 필터링
+        used_footnotes = set()
+        footnote_pattern = r'\[(\d+)\]'
+        for match in re.findall(footnote_pattern, full_report):
+            used_footnotes.add(int(match))
+
+        # 사용된 각주에 해당하는 메타데이터만 반환
+        for meta in posts_metadata:
+            if meta['footnote_number'] in used_footnotes:
+                links.append(meta)
+    else:
+        # 기존 형식 처리: [숫자](URL)
+        footnote_pattern = r'\[(\d+)\]\((https?://[^\)]+)\)'
+        matches = re.findall(footnote_pattern, full_report)
+
+        # URL을 메타데이터로 매핑
+        metadata_map = {}
+        for meta in posts_metadata:
+            if meta.get("url"):
+                metadata_map[meta["url"]] = meta
+
+        for footnote_number, url in matches:
+            link_info = {
+                "footnote_number": int(footnote_number),
+                "url": url
+            }
+
+            # 메타데이터가 있으면 추가
+            if url in metadata_map:
+                meta = metadata_map[url]
+                link_info.update({
+                    "title": meta.get("title"),
+                    "score": meta.get("score"),
+                    "comments": meta.get("comments"),
+                    "created_utc": meta.get("created_utc"),
+                    "subreddit": meta.get("subreddit"),
+                    "author": meta.get("author")
+                })
+
+            links.append(link_info)
+
+    return links
+
+
 class SupabaseReportsService:
     def __init__(self):
         self.supabase: Client = None
@@ -38,11 +92,13 @@ class SupabaseReportsService:
         try:
             report_id = str(uuid.uuid4())
             
-            # 보고서에서 링크 추출
-            links = self._extract_links_from_report(
-                report_data.get("full_report", ""),
-                report_data.get("posts_metadata", [])
-            )
+            # 구조화 렌더러가 이미 링크를 만들었으면 그대로 사용, 아니면 보고서에서 추출
+            links = report_data.get("report_links")
+            if links is None:
+                links = self._extract_links_from_report(
+                    report_data.get("full_report", ""),
+                    report_data.get("posts_metadata", [])
+                )
             
             # 보고서 데이터 준비 (posts_metadata 제외)
             report_record = {
@@ -86,6 +142,7 @@ class SupabaseReportsService:
                     if links_result.data:
                         logger.info(f"Saved {len(link_records)} links for report {report_id}")
                 
+                user_read_cache.invalidate("reports", report_record["user_nickname"])
                 return {
                     "success": True,
                     "data": result.data[0],
@@ -99,27 +156,36 @@ class SupabaseReportsService:
             logger.error(f"Error saving report: {e}")
             return {"success": False, "error": str(e)}
     
-    async def get_user_reports(self, user_nickname: str, limit: int = 20) -> Dict[str, Any]:
-        """사용자의 보고서 목록 조회"""
+    async def get_user_reports(self, user_nickname: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """사용자의 보고서 목록 조회 (요약 컬럼만, 최신순 커서 페이지)"""
         if not self.supabase:
             logger.error("Supabase client not initialized")
             return {"success": False, "error": "Database connection failed"}
         
         try:
-            # 사용자 보고서 조회 (최신순)
-            result = self.supabase.table("reports")\
-                .select("*")\
-                .eq("user_nickname", user_nickname)\
-                .order("created_at", desc=True)\
-                .limit(limit)\
+            after = decode_cursor(cursor)
+            
+            # 사용자 보고서 조회 (최신순, 같은 시각이면 id 순)
+            query = self.supabase.table("reports")\
+                .select(REPORT_SUMMARY_COLUMNS)\
+                .eq("user_nickname", user_nickname)
+            if after:
+                created_at, report_id = after
+                query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.gt.{report_id})')
+            result = query.order("created_at", desc=True)\
+                .order("id")\
+                .limit(limit + 1)\
                 .execute()
             
             if result.data is not None:
-                logger.info(f"Retrieved {len(result.data)} reports for user: {user_nickname}")
+                rows = result.data
+                cursor = next_cursor(rows, limit)
+                logger.info(f"Retrieved {len(rows)} reports for user: {user_nickname}")
                 return {
                     "success": True,
-                    "data": result.data,
-                    "count": len(result.data)
+                    "data": rows,
+                    "count": len(rows),
+                    "next_cursor": cursor
                 }
             else:
                 logger.error(f"Failed to retrieve reports: {result}")
@@ -158,52 +224,7 @@ class SupabaseReportsService:
     
     def _extract_links_from_report(self, full_report: str, posts_metadata: List[Dict]) -> List[Dict]:
         """보고서에서 링크 추출"""
-        links = []
-        
-        # posts_metadata가 이미 footnote_number를 포함하고 있는 경우 (새 형식)
-        if posts_metadata and isinstance(posts_metadata[0], dict) and 'footnote_number' in posts_metadata[0]:
-            # 보고서에 실제로 사용된 각주 번호만 필터링
-            used_footnotes = set()
-            footnote_pattern = r'\[(\d+)\]'
-            for match in re.findall(footnote_pattern, full_report):
-                used_footnotes.add(int(match))
-            
-            # 사용된 각주에 해당하는 메타데이터만 반환
-            for meta in posts_metadata:
-                if meta['footnote_number'] in used_footnotes:
-                    links.append(meta)
-        else:
-            # 기존 형식 처리: [숫자](URL)
-            footnote_pattern = r'\[(\d+)\]\((https?://[^\)]+)\)'
-            matches = re.findall(footnote_pattern, full_report)
-            
-            # URL을 메타데이터로 매핑
-            metadata_map = {}
-            for meta in posts_metadata:
-                if meta.get("url"):
-                    metadata_map[meta["url"]] = meta
-            
-            for footnote_number, url in matches:
-                link_info = {
-                    "footnote_number": int(footnote_number),
-                    "url": url
-                }
-                
-                # 메타데이터가 있으면 추가
-                if url in metadata_map:
-                    meta = metadata_map[url]
-                    link_info.update({
-                        "title": meta.get("title"),
-                        "score": meta.get("score"),
-                        "comments": meta.get("comments"),
-                        "created_utc": meta.get("created_utc"),
-                        "subreddit": meta.get("subreddit"),
-                        "author": meta.get("author")
-                    })
-                
-                links.append(link_info)
-        
-        return links
+        return extract_links_from_report(full_report, posts_metadata)
     
     async def get_report_links(self, report_id: str) -> Dict[str, Any]:
         """특정 보고서의 링크 목록 조회"""
@@ -231,6 +252,48 @@ class SupabaseReportsService:
             logger.error(f"Error retrieving report links: {e}")
             return {"success": False, "error": str(e)}
     
+    async def get_links_since(self, since: Optional[str] = None, since_id: Optional[str] = None,
+                              limit: int = 1000) -> Dict[str, Any]:
+        """
+        (since, since_id) 이후 저장된 링크의 서브레딧과 보고서 검색어 조회 (서브레딧 인덱스 증분 갱신용)
+        같은 created_at의 링크가 한 페이지를 넘어도 빠지지 않도록 (created_at, id) 순서로 이어서 조회
+        """
+        if not self.supabase:
+            return {"success": False, "error": "Database connection failed"}
+        
+        try:
+            query = self.supabase.table("report_links")\
+                .select("id, subreddit, created_at, report_id")\
+                .not_.is_("subreddit", "null")
+            if since and since_id:
+                query = query.gte("created_at", since)\
+                    .or_(f'created_at.gt."{since}",id.gt.{since_id}')
+            elif since:
+                query = query.gt("created_at", since)
+            links = query.order("created_at").order("id").limit(limit).execute().data or []
+            
+            # 월별 파티션 테이블(003)에는 report_links → reports 외래키가 없어 reports(...) 임베드를 쓸 수 없으므로 따로 조회
+            report_ids = list({link["report_id"] for link in links if link.get("report_id")})
+            query_texts = {}
+            for start in range(0, len(report_ids), 100):
+                reports = self.supabase.table("reports")\
+                    .select("id, query_text")\
+                    .in_("id", report_ids[start:start + 100])\
+                    .execute()
+                query_texts.update({report["id"]: report["query_text"] for report in reports.data or []})
+            
+            for link in links:
+                link["query_text"] = query_texts.get(link.get("report_id"))
+            
+            return {
+                "success": True,
+                "data": links
+            }
+                
+        except Exception as e:
+            logger.error(f"Error retrieving links since {since}: {e}")
+            return {"success": False, "error": str(e)}
+    
     async def delete_report(self, report_id: str, user_nickname: str) -> Dict[str, Any]:
         """보고서 삭제 (사용자 권한 확인)"""
         if not self.supabase:
@@ -247,6 +310,7 @@ class SupabaseReportsService:
             
             if result.data:
                 logger.info(f"Report deleted: {report_id}")
+                user_read_cache.invalidate("reports", user_nickname)
                 return {"success": True, "data": result.data}
             else:
                 logger.error(f"Failed to delete report or permission denied: {report_id}")
@@ -288,5 +352,27 @@ class SupabaseReportsService:
             logger.error(f"Error retrieving report stats: {e}")
             return {"success": False, "error": str(e)}
 
+    async def ensure_report_partitions(self, months_ahead: int = 3) -> Dict[str, Any]:
+        """reports/report_links 월별 파티션 미리 생성 (migrations/003 의 함수를 RPC로 호출)"""
+        if not self.supabase:
+            return {"success": False, "error": "Database connection failed"}
+
+        try:
+            created = {}
+            for table in ("reports", "report_links"):
+                result = self.supabase.rpc(
+                    "ensure_monthly_partitions",
+                    {"parent": table, "months_ahead": months_ahead}
+                ).execute()
+                created[table] = result.data
+            return {"success": True, "created": created}
+
+        except Exception as e:
+            # PGRST202: 함수 없음 (마이그레이션 적용 전)
+            if "PGRST202" in str(e):
+                return {"success": False, "skipped": True, "error": str(e)}
+            logger.error(f"Error ensuring report partitions: {e}")
+            return {"success": False, "error": str(e)}
+
 # 전역 Supabase 보고서 서비스
 supabase_reports_service = SupabaseReportsService()
\ No newline at end of file
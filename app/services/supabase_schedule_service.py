@@ -5,10 +5,18 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from supabase import create_client, Client
 from app.core.config import settings
+from app.services.read_cache_service import decode_cursor, next_cursor, user_read_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 목록 조회에서 가져오는 컬럼
+SCHEDULE_LIST_COLUMNS = (
+    "id, user_nickname, keyword, interval_minutes, report_length, total_reports, completed_reports, "
+    "status, next_run, last_run, notification_enabled, created_at, updated_at"
+)
+NOTIFICATION_LIST_COLUMNS = "id, user_nickname, title, message, type, is_read, data, sent_at"
+
 class SupabaseScheduleService:
     def __init__(self):
         if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_KEY:
@@ -39,12 +47,29 @@ class SupabaseScheduleService:
         schedule["updated_at"] = self._ensure_utc_format(schedule.get("updated_at"))
         return schedule
     
+    def _after_cursor(self, query, time_field: str, cursor: Optional[str]):
+        """커서 이후 행만 조회 (time_field 내림차순, 같은 시각이면 id 오름차순)"""
+        after = decode_cursor(cursor)
+        if not after:
+            return query
+        value, row_id = after
+        return query.or_(f'{time_field}.lt."{value}",and({time_field}.eq."{value}",id.gt.{row_id})')
+    
+    def _invalidate_schedule_lists(self, rows: Optional[List[Dict[str, Any]]]) -> None:
+        """변경된 스케줄 소유자의 목록 캐시 무효화 (소유자를 모르면 전체)"""
+        owners = {row.get("user_nickname") for row in rows or []}
+        if not owners or None in owners:
+            user_read_cache.invalidate("schedules")
+        for owner in owners - {None}:
+            user_read_cache.invalidate("schedules", owner)
+    
     def create_schedule(self, schedule_data: Dict[str, Any]) -> Dict[str, Any]:
         """스케줄 생성"""
         try:
             response = self.supabase.table("schedules").insert(schedule_data).execute()
             
             if response.data:
+                self._invalidate_schedule_lists(response.data)
                 return {
                     "success": True,
                     "data": self._format_schedule_times(response.data[0])
@@ -61,18 +86,24 @@ class SupabaseScheduleService:
                 "message": f"스케줄 생성 중 오류가 발생했습니다: {str(e)}"
             }
     
-    def get_user_schedules(self, user_nickname: str) -> Dict[str, Any]:
-        """사용자의 스케줄 목록 조회"""
+    def get_user_schedules(self, user_nickname: str, limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """사용자의 스케줄 목록 조회 (목록 컬럼만, 최신순 커서 페이지)"""
         try:
-            response = self.supabase.table("schedules")\
-                .select("*")\
-                .eq("user_nickname", user_nickname)\
-                .order("created_at", desc=True)\
+            query = self.supabase.table("schedules")\
+                .select(SCHEDULE_LIST_COLUMNS)\
+                .eq("user_nickname", user_nickname)
+            query = self._after_cursor(query, "created_at", cursor)
+            response = query.order("created_at", desc=True)\
+                .order("id")\
+                .limit(limit + 1)\
                 .execute()
             
+            rows = response.data
+            cursor = next_cursor(rows, limit)
             return {
                 "success": True,
-                "schedules": [self._format_schedule_times(schedule) for schedule in response.data]
+                "schedules": [self._format_schedule_times(schedule) for schedule in rows],
+                "next_cursor": cursor
             }
         except Exception as e:
             logger.error(f"스케줄 목록 조회 오류: {e}")
@@ -129,6 +160,7 @@ class SupabaseScheduleService:
                 .execute()
             
             if response.data:
+                self._invalidate_schedule_lists(response.data)
                 return {
                     "success": True,
                     "data": self._format_schedule_times(response.data[0])
@@ -163,6 +195,7 @@ class SupabaseScheduleService:
                     .execute()
                 
                 if response.data:
+                    self._invalidate_schedule_lists(response.data)
                     return {
                         "success": True,
                         "message": "스케줄이 완전히 삭제되었습니다."
@@ -184,6 +217,7 @@ class SupabaseScheduleService:
                     .execute()
                 
                 if response.data:
+                    self._invalidate_schedule_lists(response.data)
                     return {
                         "success": True,
                         "message": "스케줄이 취소되었습니다."
@@ -233,18 +267,16 @@ class SupabaseScheduleService:
         try:
             current_time = datetime.utcnow().isoformat()
             
-            # is_executing이 없는 경우를 대비하여 기본값 처리
+            # 조건을 모두 서버에서 처리해 부분 인덱스(idx_schedules_due)를 사용
             response = self.supabase.table("schedules")\
                 .select("*")\
                 .eq("status", "active")\
+                .eq("is_executing", False)\
                 .lte("next_run", current_time)\
+                .order("next_run")\
                 .execute()
             
-            # is_executing이 False인 것만 필터링
-            schedules = []
-            for schedule in response.data:
-                if not schedule.get("is_executing", False):  # 기본값 False
-                    schedules.append(self._format_schedule_times(schedule))
+            schedules = [self._format_schedule_times(schedule) for schedule in response.data]
             
             logger.info(f"Found {len(schedules)} schedules ready to execute")
             return schedules
@@ -336,6 +368,7 @@ class SupabaseScheduleService:
                 .execute()
             
             if response.data:
+                self._invalidate_schedule_lists(response.data)
                 return {
                     "success": True,
                     "data": self._format_schedule_times(response.data[0])
@@ -383,6 +416,7 @@ class SupabaseScheduleService:
             response = self.supabase.table("notifications").insert(notification_data).execute()
             
             if response.data:
+                user_read_cache.invalidate("notifications", notification_data.get("user_nickname"))
                 return {
                     "success": True,
                     "data": response.data[0]
@@ -424,6 +458,7 @@ class SupabaseScheduleService:
                 .delete()\
                 .in_("id", cancelled_ids)\
                 .execute()
+            user_read_cache.invalidate("schedules", user_nickname)
             
             return {
                 "success": True,
@@ -437,21 +472,29 @@ class SupabaseScheduleService:
                 "message": f"취소된 스케줄 일괄 삭제 중 오류가 발생했습니다: {str(e)}"
             }
     
-    def get_user_notifications(self, user_nickname: str, unread_only: bool = False) -> Dict[str, Any]:
-        """사용자 알림 목록 조회"""
+    def get_user_notifications(self, user_nickname: str, unread_only: bool = False,
+                               limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """사용자 알림 목록 조회 (최신순 커서 페이지)"""
         try:
             query = self.supabase.table("notifications")\
-                .select("*")\
+                .select(NOTIFICATION_LIST_COLUMNS)\
                 .eq("user_nickname", user_nickname)
             
             if unread_only:
                 query = query.eq("is_read", False)
             
-            response = query.order("sent_at", desc=True).limit(50).execute()
+            query = self._after_cursor(query, "sent_at", cursor)
+            response = query.order("sent_at", desc=True)\
+                .order("id")\
+                .limit(limit + 1)\
+                .execute()
             
+            rows = response.data
+            cursor = next_cursor(rows, limit, time_field="sent_at")
             return {
                 "success": True,
-                "notifications": response.data
+                "notifications": rows,
+                "next_cursor": cursor
             }
         except Exception as e:
             logger.error(f"알림 목록 조회 오류: {e}")
@@ -526,6 +569,7 @@ class SupabaseScheduleService:
                 .execute()
             
             if response.data:
+                self._invalidate_schedule_lists(response.data)
                 logger.info(f"Updated schedule {schedule_id} after execution. Status: {new_status}")
                 return {
                     "success": True,
@@ -557,6 +601,7 @@ class SupabaseScheduleService:
                 .execute()
             
             if response.data:
+                self._invalidate_schedule_lists(response.data)
                 logger.info(f"Updated next_run for schedule {schedule_id}")
                 return {
                     "success": True,
@@ -606,6 +651,7 @@ class SupabaseScheduleService:
             response = self.supabase.table("notifications").insert(notification_data).execute()
             
             if response.data:
+                user_read_cache.invalidate("notifications", notification_data.get("user_nickname"))
                 return {
                     "success": True,
                     "data": response.data[0]
@@ -9,11 +9,15 @@ from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
-from app.services.supabase_schedule_service import supabase_schedule_service
+from app.core.config import settings
+from app.services.storage_backend_service import storage_backend
 from app.services.reddit_service import RedditService
+from app.services.hackernews_service import HackerNewsService
 from app.services.llm_service import LLMService
-from app.services.supabase_reports_service import supabase_reports_service
 from app.services.verified_analysis_service import VerifiedAnalysisService
+from app.services.report_cache_service import report_cache_service
+from app.services.input_snapshot_service import input_snapshot_service
+from app.services.post_archive_service import post_archive
 import uuid
 from typing import Optional
 from asyncio import Queue
@@ -24,6 +28,7 @@ class SupabaseSchedulerService:
     def __init__(self):
         self.scheduler = AsyncIOScheduler(timezone="UTC")
         self.reddit_service = RedditService()
+        self.hackernews_service = HackerNewsService()
         self.llm_service = LLMService()
         self.verified_analysis_service = VerifiedAnalysisService()
         # 메모리 기반 실행 추적 (서버 재시작 시 초기화됨)
@@ -55,6 +60,16 @@ class SupabaseSchedulerService:
             replace_existing=True
         )
         
+        # reports/report_links 월별 파티션 미리 생성 (시작 시 + 매일)
+        await self._ensure_report_partitions()
+        self.scheduler.add_job(
+            self._ensure_report_partitions,
+            CronTrigger(hour=0, minute=5),
+            id="ensure_report_partitions",
+            name="Ensure monthly report partitions",
+            replace_existing=True
+        )
+
         self.scheduler.start()
         self._is_running = True
         
@@ -84,7 +99,7 @@ class SupabaseSchedulerService:
     async def _reset_all_executing_flags(self):
         """모든 스케줄의 is_executing 플래그를 false로 초기화"""
         try:
-            result = await supabase_schedule_service.reset_all_executing_flags()
+            result = await storage_backend.reset_all_executing_flags()
             if result["success"]:
                 logger.info(f"🔄 실행 플래그 초기화 완료 | 리셋된 스케줄: {result['reset_count']}개")
             else:
@@ -92,6 +107,20 @@ class SupabaseSchedulerService:
         except Exception as e:
             logger.error(f"Error resetting executing flags: {e}")
             
+    async def _ensure_report_partitions(self):
+        """다음 달 파티션이 없으면 새 보고서가 기본 파티션에 쌓이므로 미리 생성"""
+        try:
+            result = await storage_backend.ensure_report_partitions(settings.REPORT_PARTITION_MONTHS_AHEAD)
+            if result["success"]:
+                if any(result["created"].values()):
+                    logger.info(f"🗂️ 월별 파티션 생성 | {result['created']}")
+            elif result.get("skipped"):
+                logger.debug("월별 파티션 함수 없음 (migrations/003 미적용) - 건너뜀")
+            else:
+                logger.error(f"Failed to ensure report partitions: {result['error']}")
+        except Exception as e:
+            logger.error(f"Error ensuring report partitions: {e}")
+
     async def _check_and_execute_schedules(self):
         """실행해야 할 스케줄 확인 및 큐에 추가"""
         current_time = datetime.utcnow()
@@ -102,43 +131,27 @@ class SupabaseSchedulerService:
         logger.debug(f"⏰ 스케줄 체크 시작 | 시간: {current_kst.strftime('%H:%M:%S')} KST (UTC: {current_time.strftime('%H:%M:%S')})")
         
         try:
-            # 실행 대기 중인 스케줄 조회 (is_executing=False인 것만)
-            schedules = await supabase_schedule_service.get_schedules_to_execute()
+            # 실행 시간이 된 스케줄을 DB 레벨에서 원자적으로 선점 (선점된 스케줄만 반환)
+            schedules = await storage_backend.claim_due_schedules()
             
-            if schedules:
-                logger.info(f"📋 검사할 스케줄: {len(schedules)}개")
+            queued_count = 0
+            for schedule in schedules:
+                schedule_id = int(schedule["id"])
                 
-                queued_count = 0
-                for schedule in schedules:
-                    schedule_id = int(schedule["id"])
-                    
-                    # 이미 실행 중인지 메모리에서도 확인
-                    if schedule_id in self._executing_schedules:
-                        logger.debug(f"⚠️ 스케줄 {schedule_id} 이미 실행 중 (메모리 체크)")
-                        continue
-                    
-                    # 실행 시간이 되었는지 확인
-                    next_run = datetime.fromisoformat(schedule["next_run"].replace("Z", ""))
-                    if next_run <= current_time:
-                        # DB 레벨에서 원자적으로 락 획득 시도
-                        lock_acquired = await supabase_schedule_service.try_acquire_schedule_lock(schedule_id)
-                        
-                        if lock_acquired:
-                            logger.info(f"🔒 스케줄 {schedule_id} 락 획득 성공 | 키워드: {schedule.get('keyword')}")
-                            # 메모리에도 추가
-                            self._executing_schedules.add(schedule_id)
-                            # 큐에 추가
-                            await self._schedule_queue.put(schedule)
-                            queued_count += 1
-                        else:
-                            logger.debug(f"⏳ 스케줄 {schedule_id} 다른 곳에서 실행 중")
-                    else:
-                        # 한국 시간으로 표시
-                        next_run_kst = next_run.replace(tzinfo=pytz.UTC).astimezone(kst)
-                        logger.debug(f"⏱️ 스케줄 {schedule_id} 아직 실행 시간 아님 | 예정: {next_run_kst.strftime('%H:%M')} KST")
+                # 이미 실행 중인지 메모리에서도 확인
+                if schedule_id in self._executing_schedules:
+                    logger.debug(f"⚠️ 스케줄 {schedule_id} 이미 실행 중 (메모리 체크)")
+                    continue
                 
-                if queued_count > 0:
-                    logger.info(f"📥 {queued_count}개 스케줄을 실행 큐에 추가 | 큐 크기: {self._schedule_queue.qsize()}")
+                logger.info(f"🔒 스케줄 {schedule_id} 락 획득 성공 | 키워드: {schedule.get('keyword')}")
+                # 메모리에도 추가
+                self._executing_schedules.add(schedule_id)
+                # 큐에 추가
+                await self._schedule_queue.put(schedule)
+                queued_count += 1
+            
+            if queued_count > 0:
+                logger.info(f"📥 {queued_count}개 스케줄을 실행 큐에 추가 | 큐 크기: {self._schedule_queue.qsize()}")
                         
         except Exception as e:
             logger.error(f"[SCHEDULER] Error checking schedules: {e}")
@@ -177,7 +190,7 @@ class SupabaseSchedulerService:
             await self._execute_schedule(schedule)
         finally:
             # 항상 락 해제
-            await supabase_schedule_service.release_schedule_lock(schedule_id)
+            await storage_backend.release_schedule_lock(schedule_id)
             # 메모리에서도 제거
             self._executing_schedules.discard(schedule_id)
             logger.info(f"🔓 스케줄 {schedule_id} 락 해제 완료")
@@ -196,44 +209,75 @@ class SupabaseSchedulerService:
                 # 진행 상태 세션 ID 생성
                 session_id = f"schedule_{schedule_id}_{uuid.uuid4().hex[:8]}"
                 
-                # 1. Reddit 데이터 수집
-                logger.info(f"🔍 Reddit 데이터 수집 중 | 키워드: '{schedule['keyword']}'")
-                posts = await self.reddit_service.collect_reddit_posts(schedule["keyword"])
-                
-                if not posts:
-                    logger.warning(f"[SCHEDULER] No posts found for schedule {schedule_id}")
-                    # 데이터가 없어도 실행은 성공으로 처리
-                    execution_successful = True
-                    break
-                
-                logger.info(f"   수집 완료: {len(posts)}개 게시물")
+                report_length = schedule.get("report_length", "moderate")
+                sources = ["reddit", "hackernews"] if settings.HN_SCHEDULED_COLLECTION else ["reddit"]
                 
-                # 2. 보고서 생성
-                logger.info(f"📝 AI 보고서 생성 중...")
-                report_result = await self.verified_analysis_service.generate_verified_report(
-                    query=schedule["keyword"],
-                    posts=posts,
-                    report_length=schedule.get("report_length", "moderate"),
-                    session_id=session_id
-                )
+                # 같은 시간 버킷에 생성된 동일 키워드 보고서가 있으면 재사용
+                cached = report_cache_service.get(schedule["keyword"], sources, report_length)
+                if cached:
+                    logger.info(f"⚡ 캐시된 보고서 사용 | 키워드: '{schedule['keyword']}'")
+                    report_result = cached["report_data"]
+                    posts_count = cached["posts_collected"]
+                    posts = cached["posts"]
+                else:
+                    # 1. Reddit 데이터 수집
+                    logger.info(f"🔍 Reddit 데이터 수집 중 | 키워드: '{schedule['keyword']}'")
+                    posts = await self.reddit_service.collect_reddit_posts(schedule["keyword"])
+                    
+                    if "hackernews" in sources:
+                        # 이전 실행 이후 올라온 HN 스토리만 증분 수집
+                        hn_posts = await self.hackernews_service.collect_posts(
+                            schedule["keyword"], watermark_key=str(schedule_id)
+                        )
+                        logger.info(f"   HN 새 스토리: {len(hn_posts)}개")
+                        posts = (posts or []) + hn_posts
+                    
+                    if not posts:
+                        logger.warning(f"[SCHEDULER] No posts found for schedule {schedule_id}")
+                        # 데이터가 없어도 실행은 성공으로 처리
+                        execution_successful = True
+                        break
+                    
+                    logger.info(f"   수집 완료: {len(posts)}개 게시물")
+                    post_archive.add_posts(posts, query=schedule["keyword"])
+                    
+                    # 2. 보고서 생성
+                    logger.info(f"📝 AI 보고서 생성 중...")
+                    report_result = await self.verified_analysis_service.generate_verified_report(
+                        query=schedule["keyword"],
+                        posts=posts,
+                        report_length=report_length,
+                        session_id=session_id
+                    )
+                    posts_count = len(posts)
+                    
+                    report_cache_service.put(
+                        schedule["keyword"],
+                        sources,
+                        report_length,
+                        report_data=report_result,
+                        posts=posts,
+                        posts_metadata=report_result.get("post_mappings", [])
+                    )
                 
                 # 3. 보고서 저장
                 report_data = {
                     "query_text": schedule["keyword"],  # search_query 대신 query_text 사용
                     "summary": report_result.get("summary", "요약 없음"),
                     "full_report": report_result.get("full_report", "보고서 없음"),
-                    "posts_collected": len(posts),  # 수집된 게시물 수 추가
+                    "posts_collected": posts_count,  # 수집된 게시물 수 추가
                     "search_metadata": {
-                        "sources": ["reddit"],
-                        "posts_count": len(posts),
+                        "sources": sources,
+                        "posts_count": posts_count,
                         "schedule_id": schedule_id
                     },
                     "user_nickname": schedule.get("user_nickname"),
                     "session_id": session_id,
-                    "posts_metadata": report_result.get("post_mappings", [])
+                    "posts_metadata": report_result.get("post_mappings", []),
+                    "report_links": report_result.get("report_links")
                 }
                 
-                save_result = await supabase_reports_service.save_report(report_data)
+                save_result = await storage_backend.save_report(report_data)
                 
                 if save_result["success"]:
                     logger.info(f"✅ 보고서 저장 완료 | 스케줄 ID: {schedule_id}")
@@ -248,7 +292,18 @@ class SupabaseSchedulerService:
                         logger.error(f"❌ 보고서 ID를 찾을 수 없음 | save_result: {save_result}")
                         raise Exception("Report ID not found in save result")
                     
-                    update_result = await supabase_schedule_service.update_schedule_after_execution(
+                    # 재생성용 입력 스냅샷 저장
+                    if posts:
+                        await asyncio.to_thread(
+                            input_snapshot_service.save,
+                            report_id,
+                            schedule["keyword"],
+                            posts,
+                            sources=sources,
+                            report_length=report_length
+                        )
+                    
+                    update_result = await storage_backend.update_schedule_after_execution(
                         schedule_id=schedule_id,
                         interval_minutes=schedule.get("interval_minutes", 60),
                         report_id=report_id
@@ -286,7 +341,7 @@ class SupabaseSchedulerService:
         if not execution_successful:
             logger.error(f"[SCHEDULER] Schedule {schedule['id']} execution failed after all retries")
             # 실패해도 다음 실행 시간은 업데이트하여 무한 재시도 방지
-            await supabase_schedule_service.update_next_run_only(
+            await storage_backend.update_next_run_only(
                 schedule_id=schedule["id"],
                 interval_minutes=schedule.get("interval_minutes", 60)
             )
@@ -306,7 +361,7 @@ class SupabaseSchedulerService:
                 }
             }
             
-            result = await supabase_schedule_service.create_notification_async(notification_data)
+            result = await storage_backend.create_notification(notification_data)
             if result["success"]:
                 logger.info(f"[SCHEDULER] Notification created for schedule {schedule['id']}")
             else:
@@ -330,7 +385,7 @@ class SupabaseSchedulerService:
                 }
             }
             
-            result = await supabase_schedule_service.create_notification_async(notification_data)
+            result = await storage_backend.create_notification(notification_data)
             if result["success"]:
                 logger.info(f"[SCHEDULER] Error notification created for schedule {schedule['id']}")
                 
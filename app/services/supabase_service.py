@@ -2,10 +2,14 @@ import os
 from supabase import create_client, Client
 from typing import Dict, Any, Optional
 from app.core.config import settings
+from app.services.read_cache_service import decode_cursor, next_cursor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 사용자 목록에서 가져오는 컬럼
+USER_LIST_COLUMNS = "id, nickname, approval_status, created_at, last_access"
+
 class SupabaseService:
     def __init__(self):
         self.supabase: Optional[Client] = None
@@ -139,17 +143,24 @@ class SupabaseService:
             logger.error(f"사용자 승인 오류: {e}")
             return {"success": False, "error": "APPROVAL_FAILED"}
     
-    async def get_all_users(self) -> Dict[str, Any]:
-        """모든 사용자 조회"""
+    async def get_all_users(self, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """사용자 목록 조회 (최신 가입순 커서 페이지)"""
         if not self.is_available():
             return {"success": False, "error": "SUPABASE_NOT_AVAILABLE"}
         
         try:
-            result = self.supabase.table('users').select('*').order('created_at', desc=True).execute()
-            
+            query = self.supabase.table('users').select(USER_LIST_COLUMNS)
+            after = decode_cursor(cursor)
+            if after:
+                created_at, user_id = after
+                query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.gt.{user_id})')
+            result = query.order('created_at', desc=True).order('id').limit(limit + 1).execute()
+            
+            rows = result.data
             return {
                 "success": True,
-                "data": result.data
+                "data": rows,
+                "next_cursor": next_cursor(rows, limit)
             }
             
         except Exception as e:
@@ -5,63 +5,32 @@
 """
 import logging
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-from openai import OpenAI
+from app.services.openai_gateway_service import openai_gateway
 from app.core.config import settings
 from app.schemas.schemas import PostBase
-import httpx
+from app.services.structured_report_service import structured_report_service, STRUCTURED_OUTPUT_INSTRUCTIONS
+from app.services.report_validator_service import report_validator_service
+from app.services.report_cache_service import fingerprint_posts
 
 logger = logging.getLogger(__name__)
 
 class VerifiedAnalysisService:
     def __init__(self):
-        self.openai_client = None
-        if settings.OPENAI_API_KEY:
-            # SSL 검증을 비활성화한 HTTP 클라이언트 생성
-            http_client = httpx.Client(verify=False)
-            self.openai_client = OpenAI(
-                api_key=settings.OPENAI_API_KEY,
-                http_client=http_client
-            )
+        # 키 풀에 분산하는 공유 게이트웨이 (키가 없으면 None)
+        self.openai_client = openai_gateway
     
     def validate_report_content(self, analysis_text: str) -> tuple[bool, str]:
-        """보고서 내용 검증 함수"""
-        
-        # 기본 검증 조건들
-        failure_indicators = [
-            "죄송합니다",
-            "작성할 수 없습니다",
-            "제공할 수 없습니다", 
-            "생성할 수 없습니다",
-            "미래의 정보",
-            "실시간 정보에 접근할 수 없습니다",
-            "sorry",
-            "cannot provide",
-            "unable to",
-            "I can't",
-            "I cannot"
-        ]
-        
-        # 최소 길이 체크 (너무 짧으면 실패)
-        if len(analysis_text) < 1000:
-            return False, "보고서가 너무 짧습니다"
-        
-        # 실패 지시어 체크
-        for indicator in failure_indicators:
-            if indicator.lower() in analysis_text.lower():
-                return False, f"거부 응답 감지: '{indicator}'"
-        
-        # 필수 섹션 체크 (새로운 형식)
-        required_sections = ["종합 요약", "기타 정보"]
-        has_summary = any(section in analysis_text for section in ["종합 요약", "종합요약"])
-        if not has_summary:
-            return False, "종합 요약 섹션이 없습니다"
-        
-        return True, "검증 통과"
+        """보고서 내용 검증 함수 (거부 지시어는 Aho-Corasick 단일 패스로 검사)"""
+        return report_validator_service.validate(analysis_text)
     
-    async def generate_verified_report(self, query: str, posts: List[PostBase], report_length: str = "moderate", session_id: str = None) -> Dict[str, Any]:
-        """검증이 포함된 상세 분석 보고서 생성"""
+    async def generate_verified_report(self, query: str, posts: List[PostBase], report_length: str = "moderate", session_id: str = None, structured: Optional[bool] = None, model: Optional[str] = None) -> Dict[str, Any]:
+        """검증이 포함된 상세 분석 보고서 생성 (model 미지정 시 REPORT_MODEL 사용)"""
+        
+        if structured is None:
+            structured = settings.REPORT_STRUCTURED_OUTPUT
+        model = model or settings.REPORT_MODEL
         
         if not self.openai_client:
             logger.warning("OpenAI client not initialized")
@@ -218,6 +187,17 @@ class VerifiedAnalysisService:
             }
         ]
         
+        # 게시물 번호와 URL 매핑 생성
+        post_mappings = self._build_post_mappings(all_posts)
+        
+        # 구조화 모드: 같은 입력 집합의 상세 분석이 있으면 요청 길이로 로컬 도출 (LLM 호출 없음)
+        # 모델이 다르면 분석 결과도 다르므로 캐시 키에 포함
+        fingerprint = f"{model}:{fingerprint_posts(all_posts)}"
+        if structured:
+            cached_analysis = structured_report_service.get_analysis(fingerprint)
+            if cached_analysis:
+                return structured_report_service.derive(cached_analysis, report_length, post_mappings)
+        
         # 여러 시도로 보고서 생성
         max_attempts = 3
         analysis = None
@@ -228,20 +208,42 @@ class VerifiedAnalysisService:
             try:
                 prompt = prompts[attempt]
                 
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-4.1",
-                    messages=[
-                        {"role": "system", "content": prompt["system"]},
-                        {"role": "user", "content": prompt["user"]}
-                    ],
-                    temperature=0.6,
-                    max_tokens=3000
-                )
-                
-                candidate_analysis = response.choices[0].message.content
+                if structured:
+                    # 구조화 모드: JSON 응답을 로컬에서 렌더링 (각주 정규식 후처리 불필요)
+                    structured_analysis = self._generate_structured(prompt, model)
+                    if structured_analysis:
+                        # 검증은 상세 분석 전체 기준으로 수행
+                        rendered = structured_report_service.render(structured_analysis, post_mappings)
+                        is_valid, validation_message = self.validate_report_content(rendered["full_report"])
+                        logger.info(f"Validation result: {validation_message}")
+                        if is_valid:
+                            logger.info(f"Structured report generation successful on attempt {attempt + 1}")
+                            structured_report_service.put_analysis(fingerprint, structured_analysis)
+                            return structured_report_service.derive(structured_analysis, report_length, post_mappings)
+                    logger.warning(f"Attempt {attempt + 1} structured generation failed, falling back to markdown")
                 
-                # 검증 수행
-                is_valid, validation_message = self.validate_report_content(candidate_analysis)
+                if settings.REPORT_STREAMING_VALIDATION:
+                    # 스트리밍 생성 - 실패가 확실해지면 즉시 중단
+                    # 마지막 시도는 각주를 수동 보완할 수 있으므로 각주 누락으로 중단하지 않음
+                    candidate_analysis, is_valid, validation_message, aborted = self._generate_streaming(
+                        prompt, model, check_citations=attempt < max_attempts - 1
+                    )
+                else:
+                    response = self.openai_client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": prompt["system"]},
+                            {"role": "user", "content": prompt["user"]}
+                        ],
+                        temperature=0.6,
+                        max_tokens=3000
+                    )
+                    
+                    candidate_analysis = response.choices[0].message.content
+                    aborted = False
+                    
+                    # 검증 수행
+                    is_valid, validation_message = self.validate_report_content(candidate_analysis)
                 
                 logger.info(f"Validation result: {validation_message}")
                 
@@ -253,7 +255,9 @@ class VerifiedAnalysisService:
                     logger.warning(f"Attempt {attempt + 1} failed validation: {validation_message}")
                     if attempt < max_attempts - 1:
                         logger.info("Retrying with different strategy...")
-                        time.sleep(2)  # 잠시 대기
+                        # 조기 중단된 경우 대기 없이 바로 다음 전략 실행
+                        if not aborted:
+                            time.sleep(2)  # 잠시 대기
                     
             except Exception as e:
                 logger.error(f"Attempt {attempt + 1} error: {e}")
@@ -279,9 +283,62 @@ class VerifiedAnalysisService:
             # 보고서 내용에 각주 추가
             analysis = self._add_footnotes_to_report(analysis, all_posts)
         
-        # 게시물 번호와 URL 매핑 생성
+        return {
+            "summary": summary,
+            "full_report": analysis,
+            "post_mappings": post_mappings  # 각주 매핑 정보 추가
+        }
+    
+    def _generate_streaming(self, prompt: Dict[str, str], model: str, check_citations: bool = True) -> tuple[str, bool, str, bool]:
+        """스트리밍으로 보고서 생성 - (보고서, 검증 통과 여부, 메시지, 조기 중단 여부) 반환"""
+        citation_deadline = settings.REPORT_CITATION_DEADLINE_CHARS if check_citations else None
+        validator = report_validator_service.create_stream_validator(citation_deadline=citation_deadline or None)
+        
+        stream = self.openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt["system"]},
+                {"role": "user", "content": prompt["user"]}
+            ],
+            temperature=0.6,
+            max_tokens=3000,
+            stream=True
+        )
+        
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                abort, reason = validator.feed(chunk.choices[0].delta.content or "")
+                if abort:
+                    logger.warning(f"Early abort after {len(validator.text)} chars: {reason}")
+                    return validator.text, False, reason, True
+        finally:
+            # 중단 시 연결을 닫아 남은 토큰 생성을 멈춤
+            stream.close()
+        
+        is_valid, validation_message = validator.finish()
+        return validator.text, is_valid, validation_message, False
+    
+    def _generate_structured(self, prompt: Dict[str, str], model: str) -> Optional[Dict[str, Any]]:
+        """JSON 모드로 상세 구조화 분석 생성"""
+        response = self.openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt["system"]},
+                {"role": "user", "content": prompt["user"] + "\n" + STRUCTURED_OUTPUT_INSTRUCTIONS}
+            ],
+            temperature=0.6,
+            max_tokens=3000,
+            response_format={"type": "json_object"}
+        )
+        
+        return structured_report_service.parse(response.choices[0].message.content)
+    
+    def _build_post_mappings(self, posts: List[PostBase]) -> List[Dict]:
+        """게시물 번호(각주)와 URL/메타데이터 매핑 생성"""
         post_mappings = []
-        for i, post in enumerate(all_posts, 1):
+        for i, post in enumerate(posts, 1):
             if post.url:
                 post_mappings.append({
                     "footnote_number": i,
@@ -293,12 +350,7 @@ class VerifiedAnalysisService:
                     "subreddit": post.subreddit,
                     "author": post.author
                 })
-        
-        return {
-            "summary": summary,
-            "full_report": analysis,
-            "post_mappings": post_mappings  # 각주 매핑 정보 추가
-        }
+        return post_mappings
     
     def _extract_score_from_content(self, content: str) -> int:
         """게시물 내용에서 점수 추출"""
@@ -15,7 +15,9 @@ async def check_supabase_data():
             print(f"  ID: {report['id']}")
             print(f"  제목: {report['query_text']}")
             print(f"  생성일: {report['created_at']}")
-            print(f"  내용 (처음 200자): {report['full_report'][:200]}...")
+            # 목록은 요약만 반환하므로 본문은 상세 조회
+            detail = await service.get_report_by_id(report['id'])
+            print(f"  내용 (처음 200자): {detail['data']['full_report'][:200]}...")
             
             # 해당 보고서의 링크 확인
             print(f"\n=== 보고서 {report['id']} 링크 확인 ===")
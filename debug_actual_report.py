@@ -21,8 +21,8 @@ async def debug_actual_report():
         print(f"Created: {report['created_at']}")
         print(f"Posts collected: {report['posts_collected']}")
         
-        # Analyze the full report content
-        full_report = report['full_report']
+        # Analyze the full report content (list results omit the body)
+        full_report = (await service.get_report_by_id(report['id']))['data']['full_report']
         print(f"\nFull Report Length: {len(full_report)}")
         
         # Check for footnotes
@@ -0,0 +1,15 @@
+-- 스케줄러 실행 대상 조회용 부분 인덱스
+-- 스케줄러는 매 주기마다 status = 'active' AND is_executing = false AND next_run <= now() 를 next_run 순으로 조회합니다.
+-- 기존 인덱스(status, is_executing, next_run 각각 단일 컬럼)로는 완료/취소된 스케줄까지 훑어야 하므로
+-- 실행 대상이 될 수 있는 행만 담는 부분 인덱스를 추가합니다.
+-- 운영 DB에서 테이블이 크다면 CREATE INDEX CONCURRENTLY 로 한 문장씩 따로 실행하세요 (트랜잭션 밖에서만 가능).
+
+-- 1. 실행 대상 스케줄 부분 인덱스 (next_run 순서 그대로 LIMIT 처리)
+CREATE INDEX IF NOT EXISTS idx_schedules_due
+ON schedules(next_run)
+WHERE status = 'active' AND is_executing = false;
+
+-- 2. 선택도가 낮은 boolean 단일 인덱스 제거 (부분 인덱스 조건으로 대체)
+DROP INDEX IF EXISTS idx_schedules_is_executing;
+
+ANALYZE schedules;
@@ -0,0 +1,44 @@
+-- 사용자별 목록 조회용 복합/커버링 인덱스
+-- - 보고서 목록: WHERE user_nickname = ? ORDER BY created_at DESC LIMIT ?
+-- - 알림 목록: WHERE user_nickname = ? [AND is_read = false] AND (sent_at, id) 커서 이후 ORDER BY sent_at DESC, id LIMIT 51
+-- - 보고서 링크: WHERE report_id = ? ORDER BY position_in_report
+-- - 서브레딧 인덱스 갱신: WHERE subreddit IS NOT NULL AND (created_at, id) > (?, ?) ORDER BY created_at, id
+-- 정렬 순서까지 인덱스에 담아 정렬 단계 없이 LIMIT 만큼만 읽도록 합니다.
+-- 운영 DB에서 테이블이 크다면 CREATE INDEX CONCURRENTLY 로 한 문장씩 따로 실행하세요 (트랜잭션 밖에서만 가능).
+
+-- 1. 보고서 목록 (id는 같은 시각 보고서의 순서를 고정하기 위해 포함)
+-- summary/full_report는 길이 제한이 없어 인덱스 행 크기 한도를 넘을 수 있으므로 INCLUDE에서 제외
+CREATE INDEX IF NOT EXISTS idx_reports_user_created_cover
+ON reports(user_nickname, created_at DESC, id)
+INCLUDE (query_text, posts_collected, report_length);
+
+DROP INDEX IF EXISTS idx_reports_user_nickname;
+DROP INDEX IF EXISTS idx_reports_user_created;
+
+-- 2. 알림 목록 (전체 / 읽지 않은 알림, id는 커서 정렬 순서와 맞추기 위해 포함)
+CREATE INDEX IF NOT EXISTS idx_notifications_user_sent_id
+ON notifications(user_nickname, sent_at DESC, id);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread_id
+ON notifications(user_nickname, sent_at DESC, id)
+WHERE is_read = false;
+
+DROP INDEX IF EXISTS idx_notifications_user_nickname;
+DROP INDEX IF EXISTS idx_notifications_is_read;
+-- 이전 버전의 이 파일이 만든 (user_nickname, sent_at DESC) 인덱스
+DROP INDEX IF EXISTS idx_notifications_user_sent;
+DROP INDEX IF EXISTS idx_notifications_user_unread;
+
+-- 3. 보고서 링크 (report_id 단일 인덱스는 아래 인덱스의 앞부분으로 대체)
+CREATE INDEX IF NOT EXISTS idx_report_links_position
+ON report_links(report_id, position_in_report);
+
+CREATE INDEX IF NOT EXISTS idx_report_links_created
+ON report_links(created_at, id)
+WHERE subreddit IS NOT NULL;
+
+DROP INDEX IF EXISTS idx_report_links_report_id;
+
+ANALYZE reports;
+ANALYZE notifications;
+ANALYZE report_links;
@@ -0,0 +1,275 @@
+-- reports / report_links 월별 파티셔닝
+-- 보고서와 링크는 계속 쌓이기만 하고 조회는 최근 데이터(사용자별 최신 목록, 서브레딧 인덱스 갱신)에 몰리므로
+-- created_at 기준 월별 RANGE 파티션으로 나눕니다.
+-- - 최근 기간 조회는 해당 월 파티션만 읽고(partition pruning), 오래된 데이터는 파티션 단위로 분리/삭제 가능
+-- - 002_listing_covering_indexes.sql 의 인덱스를 파티션 테이블에 다시 만듭니다 (002를 먼저 실행)
+--
+-- 주의사항
+-- - 파티션 테이블의 기본키/유니크 키에는 파티션 키가 포함되어야 하므로 기본키는 (id, created_at)
+-- - id만으로는 파티션 테이블을 외래키로 참조할 수 없어 report_links → reports 외래키(ON DELETE CASCADE)를
+--   트리거(링크 삽입 시 보고서 존재 확인, 보고서 삭제 시 링크 삭제)로 대체하고,
+--   reports 를 참조하던 다른 외래키(schedule_reports 등)는 제거합니다
+-- - 기존 테이블은 reports_legacy / report_links_legacy 로 남겨 두므로 확인 후 마지막 단계에서 삭제하세요
+-- - 한 트랜잭션으로 실행되며 실행 중에는 두 테이블에 쓰기가 막힙니다
+-- - created_at 조건이 없는 조회는 모든 월 파티션을 확인하므로 보관 기간이 길수록 느려집니다.
+--   scripts/test/benchmark_query_plans.py (보고서 20만/링크 100만, 25개월) 기준 002 대비:
+--   사용자별 최신 보고서 0.04ms → 0.21ms, report_id로 링크 조회 0.04ms → 0.55ms,
+--   링크의 보고서 검색어 조회(id로 reports 조회)는 링크 1000개에 버퍼 약 1만 개.
+--   오래된 월을 분리(DETACH)해 활성 파티션 수를 줄일 계획이 없다면 002까지만 적용하는 것도 고려하세요.
+
+BEGIN;
+
+-- 1. 월별 파티션 생성 함수 (from_month ~ 현재 + months_ahead 개월, UTC 월 경계, 파티션 키는 created_at)
+-- 앱(스케줄러)이 시작할 때와 매일 호출해 앞으로 months_ahead 개월 파티션을 미리 만들어 둡니다.
+-- 파티션이 없던 동안 기본 파티션(DEFAULT)에 들어간 행이 있으면 그 월의 파티션을 만들 수 없으므로
+-- 해당 월의 행을 새 테이블로 옮긴 뒤 파티션으로 연결합니다 (수동 절차는 파일 끝 10번 참고).
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent regclass,
+    from_month timestamptz DEFAULT now(),
+    months_ahead integer DEFAULT 3
+)
+RETURNS integer AS $$
+DECLARE
+    parent_schema text;
+    parent_name text;
+    default_partition regclass;
+    month_start timestamp := date_trunc('month', from_month AT TIME ZONE 'UTC');
+    last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead);
+    bound_from timestamptz;
+    bound_to timestamptz;
+    partition_name text;
+    has_default_rows boolean;
+    moved bigint;
+    created integer := 0;
+BEGIN
+    SELECT n.nspname, c.relname INTO parent_schema, parent_name
+    FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.oid = parent;
+
+    SELECT i.inhrelid::regclass INTO default_partition
+    FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = parent AND pg_get_expr(c.relpartbound, c.oid) = 'DEFAULT';
+
+    WHILE month_start <= last_month LOOP
+        partition_name := parent_name || '_' || to_char(month_start, 'YYYY_MM');
+        bound_from := month_start AT TIME ZONE 'UTC';
+        bound_to := (month_start + interval '1 month') AT TIME ZONE 'UTC';
+
+        IF to_regclass(format('%I.%I', parent_schema, partition_name)) IS NULL THEN
+            has_default_rows := false;
+            IF default_partition IS NOT NULL THEN
+                EXECUTE format('SELECT EXISTS (SELECT 1 FROM %s WHERE created_at >= %L AND created_at < %L)',
+                               default_partition, bound_from, bound_to)
+                INTO has_default_rows;
+            END IF;
+
+            IF has_default_rows THEN
+                -- 기본 파티션의 해당 월 행을 옮기는 동안 행 트리거(보고서 삭제 시 링크 삭제 등)는 끔
+                EXECUTE format('CREATE TABLE %I.%I (LIKE %s INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                               parent_schema, partition_name, parent);
+                EXECUTE format('ALTER TABLE %s DISABLE TRIGGER USER', default_partition);
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %s WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                    'INSERT INTO %I.%I SELECT * FROM moved',
+                    default_partition, bound_from, bound_to, parent_schema, partition_name
+                );
+                GET DIAGNOSTICS moved = ROW_COUNT;
+                EXECUTE format('ALTER TABLE %s ENABLE TRIGGER USER', default_partition);
+                EXECUTE format('ALTER TABLE %s ATTACH PARTITION %I.%I FOR VALUES FROM (%L) TO (%L)',
+                               parent, parent_schema, partition_name, bound_from, bound_to);
+                RAISE NOTICE '기본 파티션에서 %행 이동: %.%', moved, parent_schema, partition_name;
+            ELSE
+                EXECUTE format('CREATE TABLE %I.%I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                               parent_schema, partition_name, parent, bound_from, bound_to);
+            END IF;
+            created := created + 1;
+        END IF;
+        month_start := month_start + interval '1 month';
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, pg_temp;
+
+-- 테이블 소유자 권한으로 실행되므로 Supabase에서는 service_role(앱의 RPC 호출)만 실행 가능
+REVOKE ALL ON FUNCTION ensure_monthly_partitions(regclass, timestamptz, integer) FROM PUBLIC;
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+        REVOKE ALL ON FUNCTION ensure_monthly_partitions(regclass, timestamptz, integer) FROM anon, authenticated;
+        GRANT EXECUTE ON FUNCTION ensure_monthly_partitions(regclass, timestamptz, integer) TO service_role;
+    END IF;
+END $$;
+
+-- 2. 기존 테이블 보관 (인덱스/제약 이름이 새 테이블과 겹치지 않도록 _legacy 접미사)
+ALTER TABLE reports RENAME TO reports_legacy;
+ALTER TABLE report_links RENAME TO report_links_legacy;
+
+DO $$
+DECLARE
+    idx record;
+BEGIN
+    FOR idx IN
+        SELECT i.indexrelid::regclass AS index_name, c.relname
+        FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid IN ('reports_legacy'::regclass, 'report_links_legacy'::regclass)
+    LOOP
+        EXECUTE format('ALTER INDEX %s RENAME TO %I', idx.index_name, idx.relname || '_legacy');
+    END LOOP;
+END $$;
+
+-- reports 를 참조하던 다른 테이블의 외래키 제거 (report_links_legacy 는 함께 보관)
+DO $$
+DECLARE
+    fk record;
+BEGIN
+    FOR fk IN
+        SELECT conname, conrelid::regclass AS table_name
+        FROM pg_constraint
+        WHERE contype = 'f'
+          AND confrelid = 'reports_legacy'::regclass
+          AND conrelid <> 'report_links_legacy'::regclass
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', fk.table_name, fk.conname);
+        RAISE NOTICE '외래키 제거: %.%', fk.table_name, fk.conname;
+    END LOOP;
+END $$;
+
+-- 3. 파티션 테이블 생성 (기존 컬럼/기본값 그대로)
+UPDATE reports_legacy SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL;
+UPDATE report_links_legacy SET created_at = now() WHERE created_at IS NULL;
+
+CREATE TABLE reports (LIKE reports_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+PARTITION BY RANGE (created_at);
+ALTER TABLE reports ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE reports ADD PRIMARY KEY (id, created_at);
+
+CREATE TABLE report_links (LIKE report_links_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+PARTITION BY RANGE (created_at);
+ALTER TABLE report_links ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE report_links ADD PRIMARY KEY (id, created_at);
+
+-- 기존 데이터가 시작되는 월부터 3개월 뒤까지 + 범위 밖 데이터용 기본 파티션
+SELECT ensure_monthly_partitions('reports', COALESCE((SELECT min(created_at) FROM reports_legacy), now()));
+SELECT ensure_monthly_partitions('report_links', COALESCE((SELECT min(created_at) FROM report_links_legacy), now()));
+CREATE TABLE reports_default PARTITION OF reports DEFAULT;
+CREATE TABLE report_links_default PARTITION OF report_links DEFAULT;
+
+-- 4. 인덱스 (파티션 테이블에 만들면 모든 파티션에 적용)
+CREATE INDEX idx_reports_user_created_cover
+ON reports(user_nickname, created_at DESC, id)
+INCLUDE (query_text, posts_collected, report_length);
+CREATE INDEX idx_reports_created_at ON reports(created_at DESC);
+
+CREATE INDEX idx_report_links_position ON report_links(report_id, position_in_report);
+CREATE INDEX idx_report_links_footnote ON report_links(report_id, footnote_number);
+CREATE INDEX idx_report_links_created ON report_links(created_at, id) WHERE subreddit IS NOT NULL;
+
+-- 5. 데이터 복사
+INSERT INTO reports SELECT * FROM reports_legacy;
+INSERT INTO report_links SELECT * FROM report_links_legacy;
+
+-- 6. 외래키 대체 트리거
+CREATE OR REPLACE FUNCTION check_report_link_parent()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM reports WHERE id = NEW.report_id) THEN
+        RAISE foreign_key_violation USING MESSAGE = format('보고서가 없습니다: report_links.report_id = %s', NEW.report_id);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION delete_report_links()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM report_links WHERE report_id = OLD.id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER check_report_link_parent
+    BEFORE INSERT OR UPDATE OF report_id ON report_links
+    FOR EACH ROW
+    EXECUTE FUNCTION check_report_link_parent();
+
+CREATE TRIGGER delete_report_links_on_report_delete
+    AFTER DELETE ON reports
+    FOR EACH ROW
+    EXECUTE FUNCTION delete_report_links();
+
+-- 업데이트 시각 자동 갱신 (supabase_reports_schema_updated.sql 의 함수가 있을 때만)
+DO $$
+BEGIN
+    IF to_regproc('update_updated_at_column') IS NOT NULL THEN
+        CREATE TRIGGER update_reports_updated_at
+            BEFORE UPDATE ON reports
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    END IF;
+END $$;
+
+-- 7. RLS 정책 (Supabase 환경에서만 - auth 스키마가 있을 때)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_namespace WHERE nspname = 'auth') THEN
+        ALTER TABLE reports ENABLE ROW LEVEL SECURITY;
+
+        CREATE POLICY "Enable all for service role" ON reports
+            USING (auth.role() = 'service_role');
+
+        CREATE POLICY "Users can view own reports" ON reports
+            FOR SELECT
+            USING (auth.role() = 'service_role' OR user_nickname = current_user::text);
+
+        CREATE POLICY "Service can insert reports" ON reports
+            FOR INSERT
+            WITH CHECK (auth.role() = 'service_role');
+
+        CREATE POLICY "Service can update reports" ON reports
+            FOR UPDATE
+            USING (auth.role() = 'service_role');
+
+        CREATE POLICY "Service and owners can delete reports" ON reports
+            FOR DELETE
+            USING (auth.role() = 'service_role');
+    END IF;
+END $$;
+
+ANALYZE reports;
+ANALYZE report_links;
+
+COMMIT;
+
+-- 8. 다음 달 파티션 미리 생성
+-- 앱 스케줄러가 시작할 때와 매일 00:05(UTC)에 ensure_monthly_partitions('reports' / 'report_links')를 호출합니다.
+-- 스케줄러를 띄우지 않는 환경에서는 pg_cron 으로 같은 작업을 등록하세요.
+-- SELECT cron.schedule('ensure-report-partitions', '5 0 * * *',
+--     $$SELECT ensure_monthly_partitions('reports'); SELECT ensure_monthly_partitions('report_links')$$);
+
+-- 9. 확인 후 기존 테이블 삭제
+-- SELECT (SELECT count(*) FROM reports) = (SELECT count(*) FROM reports_legacy);
+-- DROP TABLE report_links_legacy, reports_legacy;
+
+-- 10. 기본 파티션에 쌓인 행을 월 파티션으로 옮기기
+-- ensure_monthly_partitions 가 자동으로 처리하지만, 지나간 월(현재보다 이전)이나 수동으로 옮길 때는:
+--   SELECT ensure_monthly_partitions('reports', '2025-01-01');       -- 그 월부터 현재 + 3개월까지
+--   SELECT ensure_monthly_partitions('report_links', '2025-01-01');
+-- 기본 파티션에 어떤 월의 행이 남아 있는지 확인:
+--   SELECT date_trunc('month', created_at AT TIME ZONE 'UTC') AS month, count(*)
+--   FROM reports_default GROUP BY 1 ORDER BY 1;
+-- 함수 없이 직접 옮기는 절차 (한 트랜잭션, 예: 2025년 1월):
+--   BEGIN;
+--   CREATE TABLE reports_2025_01 (LIKE reports INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+--   ALTER TABLE reports_default DISABLE TRIGGER USER;
+--   WITH moved AS (
+--       DELETE FROM reports_default
+--       WHERE created_at >= '2025-01-01 00:00+00' AND created_at < '2025-02-01 00:00+00'
+--       RETURNING *
+--   )
+--   INSERT INTO reports_2025_01 SELECT * FROM moved;
+--   ALTER TABLE reports_default ENABLE TRIGGER USER;
+--   ALTER TABLE reports ATTACH PARTITION reports_2025_01
+--       FOR VALUES FROM ('2025-01-01 00:00+00') TO ('2025-02-01 00:00+00');
+--   COMMIT;
@@ -0,0 +1,68 @@
+"""
+보고서 재생성 스크립트
+저장된 입력 스냅샷으로 보고서를 다시 생성 (Reddit 재수집 없이 프롬프트/모델/길이 비교용)
+
+사용법:
+    python scripts/analysis/regenerate_report.py <report_id> [--length detailed] [--model gpt-4.1] [--structured] [--output out.md]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+from dotenv import load_dotenv
+
+# 환경변수 로드
+load_dotenv()
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.services.input_snapshot_service import input_snapshot_service
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="입력 스냅샷으로 보고서 재생성")
+    parser.add_argument("report_id", help="원본 보고서 ID")
+    parser.add_argument("--length", choices=["simple", "moderate", "detailed"], help="보고서 길이 (기본: 원본 설정)")
+    parser.add_argument("--model", help="사용할 모델 (기본: REPORT_MODEL)")
+    parser.add_argument("--structured", action="store_true", default=None, help="구조화 보고서 모드 사용")
+    parser.add_argument("--output", help="보고서를 저장할 파일 경로")
+    args = parser.parse_args()
+
+    print("보고서 재생성")
+    print("=" * 70)
+    print(f"시간: {datetime.now()}")
+    print(f"원본 보고서: {args.report_id}")
+    print("=" * 70)
+
+    started = datetime.now()
+    result = await input_snapshot_service.regenerate(
+        args.report_id,
+        report_length=args.length,
+        structured=args.structured,
+        model=args.model
+    )
+
+    if not result["success"]:
+        error = result.get("error") or result["report_data"].get("full_report")
+        print(f"\n✗ 재생성 실패: {error}")
+        sys.exit(1)
+
+    header = result["header"]
+    report_data = result["report_data"]
+    elapsed = (datetime.now() - started).total_seconds()
+
+    print(f"\n키워드: {header['query']}")
+    print(f"게시물: {len(result['posts'])}개 | 길이: {result['report_length']} | 소요 시간: {elapsed:.1f}초")
+    print("-" * 70)
+    print(report_data["full_report"])
+    print("-" * 70)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_data["full_report"])
+        print(f"\n✓ 보고서 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+브라우저 아이템 추출 벤치마크
+저장된 HTML 픽스처(fixtures/feed_page.html)로 요소별 추출(기존 방식)과 page.evaluate 일괄 추출을 비교
+
+사용법:
+    python scripts/test/benchmark_browser_extraction.py [--rounds 5] [--items 200]
+
+`playwright install chromium`으로 브라우저를 받을 수 없는 환경에서는 설치된 Chrome을 사용:
+    python scripts/test/benchmark_browser_extraction.py --channel chrome
+    python scripts/test/benchmark_browser_extraction.py --executable-path /usr/bin/chromium
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from playwright.async_api import async_playwright
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.services.browser_service import BrowserService
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feed_page.html")
+ITEM_SELECTOR = "article.post"
+
+
+async def extract_per_element(page, item_selector: str, max_items: int):
+    """기존 방식 - 요소/속성마다 개별 await (IPC 왕복)"""
+    items = []
+    elements = await page.query_selector_all(item_selector)
+    for element in elements[:max_items]:
+        data = {}
+        text = await element.text_content()
+        if text:
+            data['text'] = text.strip()
+
+        links = await element.query_selector_all('a')
+        if links:
+            data['links'] = []
+            for link in links[:3]:
+                href = await link.get_attribute('href')
+                if href:
+                    data['links'].append(href)
+
+        images = await element.query_selector_all('img')
+        if images:
+            data['images'] = []
+            for img in images[:2]:
+                src = await img.get_attribute('src')
+                if src:
+                    data['images'].append(src)
+
+        time_element = await element.query_selector('time, [datetime]')
+        if time_element:
+            datetime_attr = await time_element.get_attribute('datetime')
+            if datetime_attr:
+                data['timestamp'] = datetime_attr
+
+        if data:
+            items.append(data)
+    return items
+
+
+async def extract_batch(browser_service: BrowserService, page, item_selector: str, max_items: int):
+    """개선 방식 - 한 번의 page.evaluate"""
+    result = await browser_service.extract_items(page, item_selector, limit=max_items)
+    return result["items"]
+
+
+async def measure(label: str, func, rounds: int, max_items: int):
+    timings = []
+    items = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        items = await func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    avg = sum(timings) / len(timings)
+    print(f"{label:<16} | 아이템: {len(items):>4} | 평균: {avg * 1000:>8.1f}ms | 최소: {best * 1000:>8.1f}ms | 처리량: {len(items) / avg:>8.0f} items/s")
+    return items, avg
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="브라우저 아이템 추출 벤치마크")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--items", type=int, default=200, help="추출할 최대 아이템 수")
+    parser.add_argument("--channel", default=None, help="설치된 브라우저 채널 (chrome, msedge)")
+    parser.add_argument("--executable-path", default=None, help="Chromium 실행 파일 경로")
+    args = parser.parse_args()
+
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        html = f.read()
+
+    print("브라우저 추출 벤치마크")
+    print("=" * 90)
+    print(f"픽스처: {FIXTURE_PATH} ({len(html):,} bytes) | 반복: {args.rounds}회 | 최대 아이템: {args.items}")
+    print("-" * 90)
+
+    browser_service = BrowserService()
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(
+        headless=True, channel=args.channel, executable_path=args.executable_path
+    )
+    try:
+        page = await browser.new_page()
+        await page.set_content(html)
+
+        legacy_items, legacy_avg = await measure(
+            "per-element", lambda: extract_per_element(page, ITEM_SELECTOR, args.items), args.rounds, args.items
+        )
+        batch_items, batch_avg = await measure(
+            "batch evaluate", lambda: extract_batch(browser_service, page, ITEM_SELECTOR, args.items), args.rounds, args.items
+        )
+
+        print("-" * 90)
+        print(f"속도 향상: {legacy_avg / batch_avg:.1f}배")
+        print(f"결과 일치: {'✓' if legacy_items == batch_items else '✗'}")
+    finally:
+        await browser.close()
+        await playwright.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
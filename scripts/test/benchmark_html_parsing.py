@@ -0,0 +1,193 @@
+"""
+HTML 파싱 벤치마크
+저장된 픽스처(fixtures/*.html)로 기존 BeautifulSoup(html.parser) 파싱과 lxml 파서를 비교하고,
+이벤트 루프에서 직접 파싱할 때와 파싱 풀로 넘길 때의 루프 지연을 측정
+
+사용법:
+    python scripts/test/benchmark_html_parsing.py [--rounds 10] [--mode thread|process]
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from bs4 import BeautifulSoup
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.schemas.schemas import PostBase
+from app.services.html_parse_service import (
+    HtmlParseService, parse_threads_search, parse_threads_user_posts, parse_linkedin_company_posts
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BASE_URL = "https://www.threads.net"
+COMPANY_URL = "https://www.linkedin.com/company/example"
+
+
+def legacy_threads_search(html: str, query: str):
+    """기존 ThreadsService._search_web 파싱 (BeautifulSoup html.parser)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    posts = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string)
+            if isinstance(data, list):
+                for item in data:
+                    if item.get('@type') == 'SocialMediaPosting':
+                        author = item.get('author', {})
+                        author_name = author.get('name', 'Unknown')
+                        if isinstance(author, dict) and 'identifier' in author:
+                            author_name = f"@{author['identifier']['value']}"
+                        content = item.get('articleBody', '')
+                        url = item.get('url', '')
+                        if not content:
+                            continue
+                        if item.get('datePublished'):
+                            content += f"\n\n---\n📅 Posted: {item['datePublished']}"
+                        post = PostBase(source="threads", post_id=url.split('/')[-1] if url else None,
+                                        author=author_name, title=None, content=content[:1000], url=url)
+                        if query.lower() in post.content.lower():
+                            posts.append(post)
+        except Exception:
+            continue
+    og_description = soup.find('meta', property='og:description')
+    if og_description and og_description.get('content'):
+        content = og_description['content']
+        if query.lower() in content.lower():
+            posts.append(PostBase(source="threads", post_id=None, author="Threads", title=None,
+                                  content=content, url=BASE_URL))
+    return posts
+
+
+def legacy_threads_user_posts(html: str, username: str, limit: int):
+    """기존 ThreadsService._get_user_posts 파싱"""
+    soup = BeautifulSoup(html, 'html.parser')
+    posts = []
+    for container in soup.find_all('div', {'role': 'article'})[:limit]:
+        text_elements = container.find_all(['span', 'div'], string=True)
+        content = ' '.join([elem.text.strip() for elem in text_elements if elem.text.strip()])
+        if not content:
+            continue
+        link = container.find('a', href=re.compile(r'/t/'))
+        posts.append(PostBase(
+            source="threads",
+            post_id=link['href'].split('/')[-1] if link else None,
+            author=f"@{username}",
+            title=None,
+            content=content[:1000],
+            url=f"{BASE_URL}{link['href']}" if link else None
+        ))
+    return posts
+
+
+def legacy_linkedin_company_posts(html: str, company_url: str, limit: int):
+    """기존 LinkedInService._extract_company_posts 추출 규칙을 BeautifulSoup으로 재현"""
+    soup = BeautifulSoup(html, 'html.parser')
+    posts = []
+    heading = soup.find('h1')
+    company_name = heading.get_text() if heading else "Unknown Company"
+    for container in soup.select('[data-urn*="activity"], .feed-shared-update-v2')[:limit]:
+        text_element = container.select_one('.feed-shared-text, .break-words')
+        content = text_element.get_text() if text_element else ""
+        if not content:
+            continue
+        reactions = container.select_one('[data-test-social-counts]')
+        engagement = reactions.get_text() if reactions else ""
+        posts.append(PostBase(
+            source=f"linkedin/{company_name.lower().replace(' ', '_')}",
+            post_id=None,
+            author=company_name,
+            title=None,
+            content=f"{content.strip()}\n\n---\n💼 Company: {company_name}\n{engagement}",
+            url=company_url
+        ))
+    return posts
+
+
+CASES = [
+    ("threads_tag", "threads_tag_page.html",
+     lambda html: legacy_threads_search(html, "AI"), parse_threads_search, ("AI", BASE_URL)),
+    ("threads_user", "threads_user_page.html",
+     lambda html: legacy_threads_user_posts(html, "openai", 10), parse_threads_user_posts, ("openai", 10, BASE_URL)),
+    ("linkedin_company", "linkedin_company_page.html",
+     lambda html: legacy_linkedin_company_posts(html, COMPANY_URL, 10), parse_linkedin_company_posts, (COMPANY_URL, 10)),
+]
+
+
+def time_parser(func, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return sum(timings) / len(timings) * 1000
+
+
+async def measure_loop_lag(parse_calls, offload: bool, service: HtmlParseService) -> float:
+    """파싱하는 동안 1ms 간격 타이머가 얼마나 늦게 깨어나는지 (최대 지연 ms)"""
+    max_lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal max_lag
+        while running:
+            expected = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, (time.perf_counter() - expected) * 1000)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    for parser, html, args in parse_calls:
+        if offload:
+            await service.run(parser, html, *args)
+        else:
+            parser(html, *args)
+            await asyncio.sleep(0)
+    running = False
+    await tick_task
+    return max_lag
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="HTML 파싱 벤치마크")
+    parser.add_argument("--rounds", type=int, default=10, help="측정 반복 횟수")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread", help="파싱 풀 종류")
+    args = parser.parse_args()
+
+    print("HTML 파싱 벤치마크")
+    print("=" * 96)
+    print(f"{'페이지':<18} | {'크기':>9} | {'게시물':>5} | {'BS4 html.parser':>15} | {'lxml':>9} | {'향상':>6} | 결과 일치")
+    print("-" * 96)
+
+    parse_calls = []
+    for name, filename, legacy, fast, fast_args in CASES:
+        with open(os.path.join(FIXTURE_DIR, filename), encoding="utf-8") as f:
+            html = f.read()
+        legacy_posts = legacy(html)
+        fast_posts = fast(html, *fast_args)
+        same = [p.model_dump() for p in legacy_posts] == [p.model_dump() for p in fast_posts]
+
+        legacy_ms = time_parser(lambda: legacy(html), args.rounds)
+        fast_ms = time_parser(lambda: fast(html, *fast_args), args.rounds)
+        print(f"{name:<18} | {len(html):>9,} | {len(fast_posts):>5} | {legacy_ms:>12.1f}ms | {fast_ms:>7.1f}ms | "
+              f"{legacy_ms / fast_ms:>5.1f}x | {'✓' if same else '✗'}")
+        parse_calls.extend([(fast, html, fast_args)] * 5)
+
+    service = HtmlParseService(mode=args.mode, workers=4)
+    try:
+        inline_lag = await measure_loop_lag(parse_calls, offload=False, service=service)
+        offload_lag = await measure_loop_lag(parse_calls, offload=True, service=service)
+    finally:
+        service.shutdown()
+
+    print("-" * 96)
+    print(f"이벤트 루프 최대 지연 ({len(parse_calls)}페이지): 루프에서 직접 파싱 {inline_lag:.1f}ms | "
+          f"{args.mode} 풀 {offload_lag:.1f}ms")
+    print(f"풀 통계: {service.get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())